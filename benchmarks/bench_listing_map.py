@@ -0,0 +1,97 @@
+"""
+Benchmark: New/Old/Deleted merge on a synthetic 500k-row history.
+
+Compares the old full-table scan over a plain dict with the agent-indexed
+ListingMap used by master.merge_scraper_results().
+
+Usage:
+    python benchmarks/bench_listing_map.py [--rows 500000] [--agents 140]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.listing_map import ListingMap, merge_scraper_results
+
+
+def make_history(rows, agents):
+    return [
+        {
+            "listingUrl": f"https://agent{i % agents}.example/p/{i}",
+            "agentCompanyName": f"Agent {i % agents}",
+            "status": "Old",
+            "date": "2000-01-01",
+        }
+        for i in range(rows)
+    ]
+
+
+def make_run(history, agent_name):
+    # Same listings minus one (deleted) plus one new listing
+    rows = [dict(r) for r in history if r["agentCompanyName"] == agent_name][1:]
+    rows.append({"listingUrl": f"https://new.example/{agent_name}", "agentCompanyName": agent_name})
+    return rows
+
+
+def merge_with_scan(existing_map, properties, today):
+    """The pre-index merge: scans every row to find the agency's URLs."""
+    agent_name = properties[0].get("agentCompanyName", "")
+    current_urls = set()
+    agent_existing_urls = {
+        url for url, row in existing_map.items()
+        if row.get("agentCompanyName") == agent_name
+    }
+    for row in properties:
+        url = row.get("listingUrl")
+        if not url:
+            continue
+        current_urls.add(url)
+        row["date"] = today
+        row["status"] = "Old" if url in existing_map else "New"
+        existing_map[url] = row
+    for url in agent_existing_urls - current_urls:
+        existing_map[url]["status"] = "Deleted"
+
+
+def bench(label, existing_map, runs, merge):
+    start = time.perf_counter()
+    for properties in runs:
+        merge(existing_map, properties, "2000-01-02")
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s total  {elapsed / len(runs) * 1000:8.2f} ms/agency")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--agents", type=int, default=140)
+    args = parser.parse_args()
+
+    history = make_history(args.rows, args.agents)
+    agent_names = [f"Agent {a}" for a in range(args.agents)]
+    print(f"History: {args.rows} rows, {args.agents} agencies")
+    print("-" * 70)
+
+    start = time.perf_counter()
+    plain = {row["listingUrl"]: dict(row) for row in history}
+    print(f"{'load dict':<28} {time.perf_counter() - start:8.3f}s")
+    start = time.perf_counter()
+    indexed = ListingMap(dict(row) for row in history)
+    print(f"{'load ListingMap':<28} {time.perf_counter() - start:8.3f}s")
+    print("-" * 70)
+
+    scan = bench("merge (full scan)", plain, [make_run(history, a) for a in agent_names], merge_with_scan)
+    index = bench("merge (agent index)", indexed, [make_run(history, a) for a in agent_names], merge_scraper_results)
+
+    print("-" * 70)
+    print(f"Speed-up: {scan / index:.1f}x")
+
+    # Both strategies must classify identically
+    assert {u: r["status"] for u, r in plain.items()} == {u: r["status"] for u, r in indexed.items()}
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,164 @@
 """
 Helper configuration for all scrapers.
-Contains the list of scraper modules to run.
+Contains the registry of scraper modules to run.
+
+Each entry declares the module name (without .py extension, under the
+'scrapers' directory), the scraper class, the engine it needs
+(HTTP, API or SELENIUM), the domains it fetches from and, for the heavy
+ones, the expected runtime in seconds. Modules are only imported when the
+master dispatches them.
 """
+from utils.scraper_registry import API, HTTP, SELENIUM, ScraperRegistry, ScraperSpec
+
+REGISTRY = ScraperRegistry([
+    ScraperSpec("knight_commercial", "KnightCommercialScraper", SELENIUM, ("knightcommerciallondon.co.uk",), cost=3600),  # Knight Commercial London scraper
+    ScraperSpec("build_out", "BuildOutScraper", API, ("buildout.nmrk.com",)),
+    ScraperSpec("glanmor_property", "GlanmorPropertyScraper", HTTP, ("glanmorproperty.co.uk",)),
+    ScraperSpec("glinsman_weller", "GlinsmanWellerScraper", HTTP, ("glinsmanweller.co.uk",)),
+    ScraperSpec("goldenberg_real_estate", "GoldenbergRealEstateScraper", HTTP, ("goldenberg.co.uk",)),
+    ScraperSpec("gp_surveyors", "GpSurveyorsScraper", HTTP, ("gpsurveyors.co.uk",)),
+    ScraperSpec("gregory_moore_property", "GregoryMoorePropertyScraper", HTTP, ("gregorymooreproperty.co.uk",)),
+    ScraperSpec("gryphon_property_partners", "GryphonPropertyPartnersScraper", SELENIUM, ("gryphonpropertypartners.com",)),
+    ScraperSpec("gvproperty", "GvpropertyScraper", SELENIUM, ("gvproperty.co.uk",)),
+    ScraperSpec("g_v_a", "GVAScraper", API, ("pse-api.sharplaunch.com", "avisonyoung.co.uk")),
+    ScraperSpec("hants_realty", "HantsRealtyScraper", SELENIUM, ("hantsrealty.co.uk",)),
+    ScraperSpec("harrocks_commercial_property", "HarrocksCommercialPropertyScraper", HTTP, ("harrocks.co.uk",)),
+    ScraperSpec("hartnell_taylor_cook", "HartnellTaylorCookScraper", SELENIUM, ("htc.uk.com",)),
+    ScraperSpec("harvey_burns_co", "HarveyBurnsCoScraper", SELENIUM, ("harveyburns.com",)),
+    ScraperSpec("hayward_fox", "HaywardFoxScraper", SELENIUM, ("haywardfox.co.uk",)),
+    ScraperSpec("h_d_a_k", "HDAKScraper", SELENIUM, ("hdak.co.uk",)),
+    ScraperSpec("heaney_micklethwaite", "HeaneyMicklethwaiteScraper", SELENIUM, ("heaneymicklethwaite.co.uk",)),
+    ScraperSpec("heb_chartered_surveyors", "HebCharteredSurveyorsScraper", SELENIUM, ("rightmove.co.uk",)),
+    ScraperSpec("herron_associates", "HerronAssociatesScraper", SELENIUM, ("herronassociates.co.uk",)),
+    ScraperSpec("h_m_c_surveyors", "HMCSurveyorsScraper", SELENIUM, ("hmc.london",)),
+    ScraperSpec("hough_gould", "HoughGouldScraper", SELENIUM, ("houghgould.com",)),
+    ScraperSpec("howse_associates", "HowseAssociatesScraper", SELENIUM, ("howseassociates.co.uk",)),
+    ScraperSpec("hummerstone_hawkins", "HummerstoneHawkinsScraper", SELENIUM, ("hummerstonehawkins.com",)),
+    ScraperSpec("hutchinson_morrison_childs", "HutchinsonMorrisonChildsScraper", SELENIUM, ("hmc.london",)),
+    ScraperSpec("hynes_illingworth", "HynesIllingworthScraper", SELENIUM, ("hynesillingworth.com",)),
+    ScraperSpec("h_r_h_retail", "HRHRetailScraper", SELENIUM, ("hrhretail.com",)),
+    ScraperSpec("ian_scott_international", "IanScottInternationalScraper", SELENIUM, ("ianscott.com",)),
+    ScraperSpec("impey_company", "ImpeyCompanyScraper", SELENIUM, ("impey.co.uk",)),
+    ScraperSpec("ingleby_trice", "InglebyTriceScraper", SELENIUM, ("inglebytrice.co.uk",)),
+    ScraperSpec("j_h_walter", "JHWalterScraper", SELENIUM, ("brown-co.com",)),
+    ScraperSpec("j_r_b_t_commercial_property", "JRBTCommercialPropertyScraper", SELENIUM, ("jrbtcommercialproperty.co.uk",)),
+    ScraperSpec("jaggard_macland", "JaggardMaclandScraper", SELENIUM, ("jaggardmacland.co.uk",)),
+    ScraperSpec("jarroms", "JarromsScraper", SELENIUM, ("jarroms.co.uk",)),
+    ScraperSpec("jem_property", "JemPropertyScraper", SELENIUM, ("jemproperty.co.uk",)),
+    ScraperSpec("jim_raw_rees", "JimRawReesScraper", SELENIUM, ("raw-rees.co.uk",)),
+    ScraperSpec("john_whiteman_co", "JohnWhitemanCoScraper", SELENIUM, ("jwandco.co.uk",)),
+    ScraperSpec("johnson_tucker", "JohnsonTuckerScraper", SELENIUM, ("gfwllp.co.uk",)),
+    ScraperSpec("joiner_cummings", "JoinerCummingsScraper", SELENIUM, ("joinercummings.co.uk",)),
+    ScraperSpec("justice_co", "JusticeCoScraper", SELENIUM, ("justiceandco.co.uk",)),
+    ScraperSpec("kavanaghs", "KavanaghsScraper", SELENIUM, ("kavanaghproperties.com",)),
+    ScraperSpec("kimmre", "KimmreScraper", SELENIUM, ("kimmre.com",)),
+    ScraperSpec("l_b_l_real_estate", "LBLRealEstateScraper", SELENIUM, ("lblrealestate.co.uk",)),
+    ScraperSpec("leighton_goldhill", "LeightonGoldhillScraper", SELENIUM, ("leightongoldhill.com",)),
+    ScraperSpec("leopold_farmer", "LeopoldFarmerScraper", SELENIUM, ("leopoldfarmer.com",)),
+    ScraperSpec("levy_real_estate", "LevyRealEstateScraper", SELENIUM, ("levyrealestate.co.uk",)),
+    ScraperSpec("lexicon_c_r_e", "LexiconCREScraper", SELENIUM, ("lexiconcre.co.uk",)),
+    ScraperSpec("lisney", "LisneyScraper", SELENIUM, ("lisney.com",), cost=1800),
+    ScraperSpec("lofthouse_and_partners", "LofthouseAndPartnersScraper", SELENIUM, ("lofthouseandpartners.co.uk",)),
+    ScraperSpec("london_clancy", "LondonClancyScraper", SELENIUM, ("search.curchodandco.com",)),
+    ScraperSpec("phil_reid_associates", "PhilReidAssociatesScraper", SELENIUM, ("philreidassociates.com",)),
+    ScraperSpec("philip_marsh_collins_deung", "PhilipMarshCollinsDeungScraper", SELENIUM, ("pmcd.co.uk",)),
+    ScraperSpec("p_k_3_agency", "PK3AgencyScraper", SELENIUM, ("pk3.agency",)),
+    ScraperSpec("potter_associates", "PotterAssociatesScraper", SELENIUM, ("potterassociates.co.uk",)),
+    ScraperSpec("advantage_investment", "AdvantageInvestmentScraper", SELENIUM, ("advantageinvestment.co.uk",)),
+    ScraperSpec("property_sourcers_4_u", "PropertySourcers4UScraper", API, ("mypropertymarketplace.co.uk", "whitelabel.admin.theassetmanager.co.uk")),
+    ScraperSpec("rand_surveyors", "RandSurveyorsScraper", SELENIUM, ("rand-surveyors.co.uk",)),
+    ScraperSpec("pudney_shuttleworth", "PudneyShuttleworthScraper", SELENIUM, ("pudneyshuttleworth.co.uk",)),
+    ScraperSpec("r_a_r_e", "RAREScraper", SELENIUM, ("rarecommercialproperty.co.uk",)),
+    ScraperSpec("rawstron_johnson", "RawstronJohnsonScraper", SELENIUM, ("rj-ltd.co.uk",)),
+    ScraperSpec("reddin_clancy_co", "ReddinClancyCoScraper", SELENIUM, ("reddin-clancy.co.uk",)),
+    ScraperSpec("rees_denton", "ReesDentonScraper", SELENIUM, ("reesdenton.com",)),
+    ScraperSpec("p_s_k_knighton", "PSKKnightonScraper", SELENIUM, ("pskknighton.co.uk",)),
+    ScraperSpec("r_a_f_estates", "RAFEstatesScraper", SELENIUM, ("rafestates.com",)),
+    ScraperSpec("reid_rose_gregory", "ReidRoseGregoryScraper", SELENIUM, ("smithpricerrg.co.uk",)),
+    ScraperSpec("ridley_thaw", "RidleyThawScraper", SELENIUM, ("ridleythaw.co.uk",)),
+    ScraperSpec("r_k_real_estate", "RKRealEstateScraper", SELENIUM, ("rkrealestate.co.uk",)),
+    ScraperSpec("roger_etchells_co", "RogerEtchellsCoScraper", SELENIUM, ("rogeretchells.co.uk",)),
+    ScraperSpec("roger_hannah", "RogerHannahScraper", SELENIUM, ("roger-hannah.co.uk",), cost=2400),
+    ScraperSpec("commercial_property_partners", "CommercialPropertyPartnersScraper", SELENIUM, ("commercialpropertypartners.co.uk",)),
+    ScraperSpec("cordage_group", "CordageGroupScraper", SELENIUM, ("cordagegroup.co.uk",)),
+    ScraperSpec("cortex_partners", "CortexPartnersScraper", SELENIUM, ("cortexpartners.co.uk",)),
+    ScraperSpec("cradick_retail", "CradickRetailScraper", SELENIUM, ("cradick.co.uk",)),
+    ScraperSpec("crossland_otter_hunt", "CrosslandOtterHuntScraper", SELENIUM, ("coh.eu",)),
+    ScraperSpec("crow_watkin", "CrowWatkinScraper", SELENIUM, ("crowwatkin.co.uk",)),
+    ScraperSpec("curson_sowerby_partners", "CursonSowerbyPartnersScraper", SELENIUM, ("cspretail.com",)),
+    ScraperSpec("cuthbert_white", "CuthbertWhiteScraper", SELENIUM, ("cuthbertwhite.com",)),
+    ScraperSpec("cyril_leonard", "CyrilLeonardScraper", SELENIUM, ("cyrilleonard.com",)),
+    ScraperSpec("dabora_conway", "DaboraConwayScraper", SELENIUM, ("daboraconway.com",)),
+    ScraperSpec("dalkin_co", "DalkinCoScraper", SELENIUM, ("dalkinandco.com",)),
+    ScraperSpec("daniel_hirst", "DanielHirstScraper", SELENIUM, ("ws-residential.co.uk",)),
+    ScraperSpec("davis_coffer_lyons", "DavisCofferLyonsScraper", SELENIUM, ("dcl.co.uk",)),
+    ScraperSpec("davison_blackett", "DavisonBlackettScraper", SELENIUM, ("davisonblackett.com",)),
+    ScraperSpec("d_b_a_sdvisors", "DBASdvisorsScraper", SELENIUM, ("dbaprop.co.uk",)),
+    ScraperSpec("d_c_care", "DCCareScraper", SELENIUM, ("dccare.co.uk",)),
+    ScraperSpec("deriaz_campsie", "DeriazCampsieScraper", SELENIUM, ("properties.kemptoncarr.co.uk",)),
+    ScraperSpec("d_l_p_surveyors", "DLPSurveyorsScraper", SELENIUM, ("dlpsurveyors.co.uk",)),
+    ScraperSpec("drakesfield", "DrakesfieldScraper", SELENIUM, ("drakesfield.co.uk",)),
+    ScraperSpec("d_t_r_e", "DTREScraper", SELENIUM, ("dtre.com",)),
+    ScraperSpec("dunitz_co", "DunitzCoScraper", SELENIUM, ("dunitzandco.com",)),
+    ScraperSpec("dunster_morton", "DunsterMortonScraper", SELENIUM, ("simmonsandsons.com",)),
+    ScraperSpec("durlings", "DurlingsScraper", SELENIUM, ("durlings.co.uk",)),
+    ScraperSpec("edgerley_simpson_howe", "EdgerleySimpsonHoweScraper", SELENIUM, ("eshp.com",)),
+    ScraperSpec("elsom_spettigue_associates", "ElsomSpettigueAssociatesScraper", SELENIUM, ("esassociates.co.uk",)),
+    ScraperSpec("emanuel_oliver", "EmanuelOliverScraper", SELENIUM, ("emanueloliver.com",)),
+    ScraperSpec("emberson_co", "EmbersonCoScraper", SELENIUM, ("emberson.com",)),
+    ScraperSpec("e_m_r_property", "EMRPropertyScraper", SELENIUM, ("emrproperty.co.uk",)),
+    ScraperSpec("e_r_i_c_surveyors", "ERICSurveyorsScraper", SELENIUM, ("ericsurveyors.com",)),
+    ScraperSpec("e_t_p_property", "ETPPropertyScraper", SELENIUM, ("cs-re.co.uk",)),
+    ScraperSpec("everard_cole", "EverardColeScraper", API, ("everardcole.co.uk",)),
+    ScraperSpec("exigen_property", "ExigenPropertyScraper", SELENIUM, ("exigenproperty.co.uk",)),
+    ScraperSpec("e_y_c_o", "EYCOScraper", SELENIUM, ("eyco.co.uk", "neo.completelyretail.co.uk")),
+    ScraperSpec("fairhurst_buckley", "FairhurstBuckleyScraper", SELENIUM, ("fairhurstbuckley.co.uk",)),
+    ScraperSpec("fawcett_mead", "FawcettMeadScraper", SELENIUM, ("fmx.co.uk",)),
+    ScraperSpec("fifield_glyn", "FifieldGlynScraper", SELENIUM, ("fifieldglyn.com",)),
+    ScraperSpec("finch_commercial_real_estate", "FinchCommercialRealEstateScraper", SELENIUM, ("finchcre.com",)),
+    ScraperSpec("first_city", "FirstCityScraper", SELENIUM, ("firstcity.co.uk",)),
+    ScraperSpec("fleurets", "FleuretsScraper", SELENIUM, ("fleurets.com",), cost=1200),
+    ScraperSpec("flude_property_consultants", "FludePropertyConsultantsScraper", SELENIUM, ("flude.com",), cost=1200),
+    ScraperSpec("forge", "ForgeScraper", SELENIUM, ("forge-cp.com",)),
+    ScraperSpec("francis_darrah", "FrancisDarrahScraper", SELENIUM, ("francisdarrah.co.uk",)),
+    ScraperSpec("frazer_kidd_partners", "FrazerKiddPartnersScraper", HTTP, ("frazerkidd.co.uk",)),
+    ScraperSpec("f_t_linden", "FTLindenScraper", SELENIUM, ("ftlinden.com",)),
+    ScraperSpec("f_t_d_johns", "FTDJohnsScraper", SELENIUM, ("ftdjohns.co.uk",)),
+    ScraperSpec("gale_priggen_co", "GalePriggenCoScraper", SELENIUM, ("search.galepriggen.co.uk",)),
+    ScraperSpec("gavin_black_partners", "GavinBlackPartnersScraper", SELENIUM, ("naylorsgavinblack.co.uk",)),
+    ScraperSpec("h_d_h", "HDHScraper", API, ("buildout.nmrk.com",)),
+    ScraperSpec("collins_jarvis", "CollinsJarvisScraper", SELENIUM, ("collinsjarvis.co.uk",)),
+    ScraperSpec("chancellor_sons", "ChancellorSonsScraper", SELENIUM, ("homes-on-line.com",)),
+    ScraperSpec("colston_colston", "ColstonColstonScraper", SELENIUM, ("cs-re.co.uk",)),
+    ScraperSpec("charterwood", "CharterwoodScraper", SELENIUM, ("charterwood.com",)),
+    ScraperSpec("lunson_mitchenall", "LunsonMitchenallScraper", SELENIUM, ("lmrealestate.co.uk",)),
+    ScraperSpec("mark_jenkinson_son", "MarkJenkinsonSonScraper", SELENIUM, ("markjenkinson.co.uk",)),
+    ScraperSpec("matthew_pellereau", "MatthewPellereauScraper", SELENIUM, ("matthewpellereau.co.uk",)),
+    ScraperSpec("mcMullen_real_estate", "McmullenRealEstateScraper", SELENIUM, ("mcmullenre.com",)),
+    ScraperSpec("metcalf_harland", "MetcalfHarlandScraper", SELENIUM, ("mhpi.co.uk",)),
+    ScraperSpec("muxworthy", "MuxworthyScraper", SELENIUM, ("muxworthyllp.com",)),
+    ScraperSpec("newmark", "NewmarkScraper", API, ("buildout.nmrk.com",)),
+    ScraperSpec("mp_real_estate", "MpRealEstateScraper", SELENIUM, ("mprealestate.co.uk",)),
+    ScraperSpec("n_j_w_e", "NJWEScraper", SELENIUM, ("njwe.co.uk",)),
+    ScraperSpec("c_w_m", "CWMScraper", SELENIUM, ("cbre.co.uk",), cost=1800),
+    ScraperSpec("freeman_property_auctioneers", "FreemanPropertyAuctioneersScraper", SELENIUM, ("freemanforman.co.uk",)),
+    ScraperSpec("mc_gillivrays", "McGillivraysScraper", HTTP, ("mcgillivrays.com",)),
+    ScraperSpec("panther_securities", "PantherSecuritiesScraper", HTTP, ("pantherplc.com",)),
+    ScraperSpec("p_j_s", "PJSScraper", SELENIUM, ("pjsbuilds.co.uk",)),
+    ScraperSpec("w_b_f", "WBFScraper", SELENIUM, ("wb-properties.co.uk",)),
+    ScraperSpec("coady_philips", "CoadyPhilipsScraper", SELENIUM, ("propertysearch.coadyphillips.co.uk",)),
+    ScraperSpec("j_l_l", "JLLScraper", SELENIUM, ("property.jll.co.uk", "invest.jll.com", "residential.jll.co.uk"), cost=3600),
+    ScraperSpec("n_p_s_group", "NPSGroupScraper", SELENIUM, ("property.nps.co.uk",)),
+])
+
+# List of scraper module names (without .py extension), in run order
+SCRAPERS = REGISTRY.names()
 
-# List of scraper module names (without .py extension)
-# Each scraper should be in the 'scrapers' directory
-SCRAPERS = [
-    "knight_commercial",  # Knight Commercial London scraper
+# Listed for these agencies but no module exists under scrapers/ yet.
+# They are not dispatched; move an entry into REGISTRY once it is written.
+NOT_IMPLEMENTED = [
     "real_estate_23",
     "jonable_white",
-    "build_out",
-    "glanmor_property",
     "adalta_real",
     "adam_stein_and_co",
     "adkin",
@@ -31,151 +179,16 @@ SCRAPERS = [
     "bonsors",
     "box_property_consultants",
     "brasier_freeth",
-    "bree_prenton",        
-    "glinsman_weller",
-    "goldenberg_real_estate", 
-    "gp_surveyors",
-    'gregory_moore_property',
-    'gryphon_property_partners',
-    'gvproperty',
-    'g_v_a',
-    "hants_realty",
-    'harrocks_commercial_property',
-    'hartnell_taylor_cook',
-    'harvey_burns_co',
-    'hayward_fox',
-    'h_d_a_k',
-    'heaney_micklethwaite',
-    'heb_chartered_surveyors',
-    'herron_associates',
-    'h_m_c_surveyors',
-    'hough_gould',
-    'howse_associates',
-    'hummerstone_hawkins',
-    'hutchinson_morrison_childs',
-    'hynes_illingworth',
-    'h_r_h_retail',
-    'ian_scott_international',
-    'impey_company',
-    'ingleby_trice',
-    'j_h_walter',
-    'j_r_b_t_commercial_property',
-    'jaggard_macland',
-    'jarroms',
-    'jem_property',
-    'jim_raw_rees',
-    'john_whiteman_co',
-    'johnson_tucker',
-    'joiner_cummings',
-    'justice_co',
-    'kavanaghs',
-    'kimmre',
-    'l_b_l_real_estate',
-    'leighton_goldhill',
-    'leopold_farmer',
-    'levy_real_estate',
-    'lexicon_c_r_e',
-    'lisney',
-    'lofthouse_and_partners',
-    'london_clancy',
-    'phil_reid_associates',
-    'philip_marsh_collins_deung',
-    'p_k_3_agency',
-    'potter_associates',
-    'advantage_investment',
-    'property_sourcers_4_u',
-    'rand_surveyors',
-    'pudney_shuttleworth',
-    'r_a_r_e',
-    'rawstron_johnson',
-    'reddin_clancy_co',
-    'rees_denton',
-    'p_s_k_knighton',
-    'r_a_f_estates', 
-    'reid_rose_gregory', 
-    'ridley_thaw',
-    'r_k_real_estate',
-    'roger_etchells_co',
-    'roger_hannah',
-    'commercial_property_partners',
-    'cordage_group',
-    'cortex_partners',
-    'cradick_retail',
-    'crossland_otter_hunt',
-    'crow_watkin',
-    'curson_sowerby_partners', 
-    'cuthbert_white',
-    'cyril_leonard',
-    'dabora_conway',
-    'dalkin_co',
-    'daniel_hirst',
-    'davis_coffer_lyons',
-    'davison_blackett',
-    'd_b_a_sdvisors',
-    'd_c_care',
-    'deriaz_campsie', 
-    'd_l_p_surveyors',
-    'drakesfield',
-    'd_t_r_e', 
-    'dunitz_co',
-    'dunster_morton', 
-    'durlings',
-    'edgerley_simpson_howe',
-    'elsom_spettigue_associates',
-    'emanuel_oliver',
-    'emberson_co',
-    'e_m_r_property',
-    'e_r_i_c_surveyors',
-    'e_t_p_property',
-    'everard_cole',
-    'exigen_property',
-    'e_y_c_o', 
-    'fairhurst_buckley',
-    'fawcett_mead',
-    'fifield_glyn',
-    'finch_commercial_real_estate',
-    'first_city',
-    'fleurets',
-    'flude_property_consultants',
-    'forge',
-    'francis_darrah',
-    'frazer_kidd_partners',
-    'f_t_linden',
-    'f_t_d_johns',
-    'gale_priggen_co',
-    'gavin_black_partners',
-    'broadlands',
-    'bruce_gillingham_pollard',
-    'bbpc',
-    'bulleys',
-    'bulleys_bradbury',
-    'burley_browne',
-    'eddisons',
-    'camplin_bianco',
-    'manchester_offices',
-    'carrick_re',
-    'cartwright_hands',
-    'h_d_h',
-     'collins_jarvis',
-    'chancellor_sons',
-    'colston_colston', 
-    'charterwood',
-    "lunson_mitchenall",
-    "mark_jenkinson_son",
-    "matthew_pellereau",   
-    "mcMullen_real_estate",
-    "metcalf_harland",
-    "muxworthy",
-    'newmark',
-    "mp_real_estate",
-    "n_j_w_e",
-    'c_w_m',
-    'freeman_property_auctioneers',
-    'mc_gillivrays',
-    'panther_securities',
-    'p_j_s',
-    'w_b_f',
-    'coady_philips',
-    'j_l_l', 
-    "n_p_s_group", 
-]
\ No newline at end of file
+    "bree_prenton",
+    "broadlands",
+    "bruce_gillingham_pollard",
+    "bbpc",
+    "bulleys",
+    "bulleys_bradbury",
+    "burley_browne",
+    "eddisons",
+    "camplin_bianco",
+    "manchester_offices",
+    "carrick_re",
+    "cartwright_hands",
+]
@@ -1,131 +1,852 @@
 """
-Master script to run all scrapers defined in helper.py.
+Master script to run all scrapers registered in helper.py.
 Each scraper saves data to a common CSV file (data/data.csv).
+
+Each scraper's changes are merged into a listing store as it finishes;
+the CSV is written once at the end of the run. The default store journals
+deltas on top of the CSV (utils/journal.py); ``--store sqlite`` keeps the
+history in SQLite instead (utils/listing_store.py).
+
+Scrapers can run sequentially (default) or in a pool of worker processes
+with ``--workers N``. In both modes a single merge stage in the master
+process applies the New/Old/Deleted logic and writes the CSV, so workers
+never touch the listing store or the output file.
+
+By default every scraper runs in its own supervised child process with a
+wall-clock budget (``--timeout``) and hang detection (``--hang-timeout``);
+its Chrome/chromedriver processes are killed when it finishes or times
+out. ``--in-process`` turns this off; scrapers running in the same process
+then share warmed browsers from utils/webdriver_pool.py. Browsers block
+images, fonts, media and trackers; ``--resource-report`` measures what
+that saves per scraper. Wait and in-browser extraction savings are logged
+to website_data/*_report.jsonl.
+
+Completed scrapers and their deltas are checkpointed in a run manifest;
+``--resume`` continues an interrupted run from it.
+
+``--shard i/N`` runs one of N shards on this host and writes raw results to
+website_data/shards/; ``--merge-shards FILE ...`` classifies and merges
+them into the listing store (see utils/sharding.py).
+
+For pull-based workers: ``--enqueue`` queues one job per scraper,
+``--worker`` (on any number of hosts) claims and runs jobs, and
+``--collect`` merges their results (see utils/work_queue.py).
 """
-import importlib
+import argparse
+import json
 import os
 import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from utils.csv_handler import store_data_to_csv
-
-from helper import SCRAPERS
+from utils.listing_store import open_store
+from utils.supervisor import run_supervised
+from utils.run_manifest import RunManifest
+from utils import sharding
+from utils.work_queue import WorkQueue, default_worker_id
+from utils.runtime_history import (
+    RuntimeHistory,
+    format_duration,
+    predict_makespan,
+    schedule_lpt,
+)
+
+from helper import REGISTRY, SCRAPERS
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 from datetime import datetime
-import csv
 
  # storing the data in website data you can keep the name of the agent company name.
  #  for example if Company Name is Hants Realty , the file name will be hants_realty.csv
 
 CSV_FILE_NAME = os.path.join(BASE_DIR, "website_data", "data.csv")
+JOURNAL_FILE_NAME = os.path.join(BASE_DIR, "website_data", "data.journal.jsonl")
+DB_FILE_NAME = os.path.join(BASE_DIR, "website_data", "data.sqlite3")
+RUNTIME_HISTORY_FILE_NAME = os.path.join(BASE_DIR, "website_data", "runtime_history.json")
+MANIFEST_FILE_NAME = os.path.join(BASE_DIR, "website_data", "run_manifest.jsonl")
+SHARD_DIR = os.path.join(BASE_DIR, "website_data", "shards")
+QUEUE_FILE_NAME = os.path.join(BASE_DIR, "website_data", "work_queue.sqlite3")
+RESOURCE_REPORT_FILE_NAME = os.path.join(BASE_DIR, "website_data", "resource_report.jsonl")
+WAIT_REPORT_FILE_NAME = os.path.join(BASE_DIR, "website_data", "wait_report.jsonl")
+EXTRACT_REPORT_FILE_NAME = os.path.join(BASE_DIR, "website_data", "extract_report.jsonl")
+
+# Work queue timing (seconds)
+QUEUE_POLL_INTERVAL = 10
+
+# Per-scraper watchdog limits (seconds) when running isolated
+DEFAULT_BUDGET = 3600
+DEFAULT_HANG_TIMEOUT = 600
+
+
+# ===================== WORKER ===================== #
+
+def run_scraper(scraper_name, lightweight=False):
+    """
+    Import and run a single scraper.
+
+    Safe to call in a worker process: it never touches shared state and
+    returns everything the merge stage needs. The scraper module is only
+    imported here, when the scraper is dispatched.
+
+    ``lightweight`` is set for HTTP/API scrapers running in their own worker
+    process; selenium is then blocked so the worker stays small.
+
+    Returns:
+        Tuple of (scraper_name, properties, error). ``error`` is a formatted
+        traceback string when the scraper raised, otherwise None.
+    """
+    properties, error = [], None
+    try:
+        if lightweight:
+            sys.modules.setdefault("selenium", None)
+
+        scraper_class = REGISTRY.get(scraper_name).load()
+
+        scraper = scraper_class()
+        properties = scraper.run() or []
+
+    except Exception:
+        properties, error = [], traceback.format_exc()
+
+    finally:
+        release_browsers(error is not None)
+        record_resource_report(scraper_name)
+        record_wait_report(scraper_name)
+        record_extract_report(scraper_name)
+        save_learned_state()
+
+    return scraper_name, properties, error
+
+
+def release_browsers(failed=False):
+    """
+    Give back pooled browsers a scraper left leased (it crashed or forgot
+    to release them). After a failure they are quit rather than reused.
+    """
+    pool_module = sys.modules.get("utils.webdriver_pool")
+    if pool_module is None:
+        return 0
+    return pool_module.get_pool().release_all(error=failed)
+
+
+def record_resource_report(scraper_name):
+    """
+    With ``--resource-report``, append the scraper's browser traffic and
+    the bytes the resource blocklist would have saved to
+    website_data/resource_report.jsonl.
+    """
+    pool_module = sys.modules.get("utils.webdriver_pool")
+    if pool_module is None or not pool_module.RESOURCE_REPORT:
+        return
+
+    report = pool_module.get_pool().take_resource_report()
+    if not report["requests"]:
+        return
+    _append_report(RESOURCE_REPORT_FILE_NAME, scraper_name, report)
+
+    saved = report["blockable_bytes"] / report["bytes"] if report["bytes"] else 0.0
+    print(f"  {scraper_name}: {report['requests']} requests, "
+          f"{report['bytes'] / 1e6:.1f} MB; blocking saves "
+          f"{report['blockable_bytes'] / 1e6:.1f} MB ({saved:.0%})")
+
+
+def record_wait_report(scraper_name):
+    """
+    Append how long the scraper's condition waits (utils/waits.py) took,
+    against the fixed sleeps they replace, to website_data/wait_report.jsonl.
+    """
+    waits_module = sys.modules.get("utils.waits")
+    if waits_module is None:
+        return
+
+    report = waits_module.take_wait_report()
+    if not report["waits"]:
+        return
+    report["waited"] = round(report["waited"], 1)
+    report["replaced"] = round(report["replaced"], 1)
+    _append_report(WAIT_REPORT_FILE_NAME, scraper_name, report)
+
+    print(f"  {scraper_name}: {report['waits']} waits took {format_duration(report['waited'])}, "
+          f"fixed sleeps took {format_duration(report['replaced'])}")
+
+
+def record_extract_report(scraper_name):
+    """
+    Append what in-browser extraction (utils/dom_extract.py) saved over
+    page_source parsing to website_data/extract_report.jsonl.
+    """
+    extract_module = sys.modules.get("utils.dom_extract")
+    if extract_module is None:
+        return
+
+    report = extract_module.take_extract_report()
+    if not report["pages"] and not report["fallbacks"]:
+        return
+    saved_bytes, saved_seconds = extract_module.estimated_savings(report)
+    report.update(saved_bytes=saved_bytes, saved_seconds=round(saved_seconds, 1))
+    report["seconds"] = round(report["seconds"], 1)
+    report["sampled_seconds"] = round(report["sampled_seconds"], 2)
+    _append_report(EXTRACT_REPORT_FILE_NAME, scraper_name, report)
+
+    print(f"  {scraper_name}: {report['pages']} pages extracted in-browser "
+          f"({report['fallbacks']} fell back to page_source), "
+          f"{saved_bytes / 1e6:.1f} MB and ~{format_duration(max(saved_seconds, 0))} saved")
+
+
+def save_learned_state():
+    """
+    Save the fetch paths utils/http_first.py learned and the per-domain
+    rates of utils/rate_limit.py. Supervised children are killed as soon
+    as their result is in, before atexit handlers get to run, so this is
+    done at the end of every scraper.
+    """
+    for module_name, save, what in (
+        ("utils.http_first", "save_strategies", "fetch strategies"),
+        ("utils.rate_limit", "save_limiter", "domain rates"),
+    ):
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        try:
+            getattr(module, save)()
+        except OSError as e:
+            print(f"  Could not save {what}: {e}")
+
+
+def _append_report(path, scraper_name, report):
+    report.update(scraper=scraper_name, date=datetime.now().strftime("%Y-%m-%d"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(report) + "\n")
+
+
+def run_scraper_isolated(scraper_name, budget, hang_timeout, lightweight=False):
+    """Run a scraper in a supervised child process (see utils/supervisor.py)."""
+    return run_supervised(
+        run_scraper,
+        (scraper_name, lightweight),
+        budget=budget,
+        hang_timeout=hang_timeout,
+    )
+
+
+def _timed(func, scraper_name, lightweight=False):
+    started = time.time()
+    result = func(scraper_name, lightweight)
+    return result, time.time() - started
+
+
+def _iter_results(scraper_names, workers, isolate=True, budget=None, hang_timeout=None,
+                  http_workers=0):
+    """
+    Yield (run_scraper() result, seconds) in list order, or as workers
+    finish when running in parallel. Scrapers are dispatched in list order.
+
+    With ``http_workers`` > 0, scrapers whose registry engine needs no
+    browser run in a separate lane of that many lightweight workers, so
+    they neither wait for nor occupy the browser workers.
+    """
+    if isolate:
+        def run(scraper_name, lightweight=False):
+            return run_scraper_isolated(scraper_name, budget, hang_timeout, lightweight)
+        # Each thread only supervises its own child process
+        executor_class = ThreadPoolExecutor
+    else:
+        run = run_scraper
+        executor_class = ProcessPoolExecutor
+
+    if workers <= 1 and not http_workers:
+        for scraper_name in scraper_names:
+            print(f"Running scraper: {scraper_name}")
+            print("-" * 50)
+            yield _timed(run, scraper_name)
+        return
+
+    if http_workers:
+        light = [name for name in scraper_names if not REGISTRY.get(name).needs_browser]
+    else:
+        light = []
+    heavy = [name for name in scraper_names if name not in set(light)]
+
+    browser_executor = executor_class(max_workers=max(1, workers))
+    light_executor = executor_class(max_workers=http_workers) if light else None
+    try:
+        futures = {
+            browser_executor.submit(_timed, run, scraper_name): scraper_name
+            for scraper_name in heavy
+        }
+        for scraper_name in light:
+            futures[light_executor.submit(_timed, run, scraper_name, True)] = scraper_name
+
+        for future in as_completed(futures):
+            scraper_name = futures[future]
+            print(f"Finished scraper: {scraper_name}")
+            print("-" * 50)
+            try:
+                yield future.result()
+            except Exception:
+                # Worker process died (e.g. killed by the OS)
+                yield (scraper_name, [], traceback.format_exc()), 0.0
+    finally:
+        browser_executor.shutdown()
+        if light_executor is not None:
+            light_executor.shutdown()
+
+
+# ===================== MERGE ===================== #
+
+def merge_result(listing_store, scraper_name, properties, error, today, manifest=None,
+                 run_id=None):
+    """
+    Merge one scraper's result into the listing store and report it.
+
+    Returns:
+        Number of properties merged (0 on error or empty result), or None
+        if the merge itself failed
+    """
+    if error:
+        print(f"✗ Error running {scraper_name}:")
+        print(error)
+        print()
+        return 0
 
+    if not properties:
+        print(f"✗ {scraper_name}: No properties found")
+        print()
+        return 0
 
-def load_existing_data():
-    existing_map = {}
+    try:
+        delta = listing_store.merge(scraper_name, properties, today, run_id=run_id)
+        if manifest is not None:
+            manifest.record(scraper_name, len(properties), delta)
 
-    if os.path.exists(CSV_FILE_NAME):
-        with open(CSV_FILE_NAME, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get("listingUrl")
-                if url:
-                    existing_map[url] = row
+        print(f"✓ {scraper_name}: Scraped {len(properties)} properties")
+        print()
+        return len(properties)
 
-    return existing_map
+    except Exception as e:
+        print(f"✗ Error merging {scraper_name}: {e}")
+        traceback.print_exc()
+        print()
+        return None
 
 
-def run_all_scrapers():
+def _print_banner(title, workers=1, http_workers=0):
     print("=" * 70)
-    print("STARTING PROPERTY SCRAPING")
+    print(title)
+    if workers > 1:
+        print(f"Workers: {workers}")
+    if http_workers:
+        print(f"HTTP workers: {http_workers}")
     print("=" * 70)
     print()
 
+
+def run_all_scrapers(workers=1, store="csv", isolate=True,
+                     budget=DEFAULT_BUDGET, hang_timeout=DEFAULT_HANG_TIMEOUT,
+                     schedule="lpt", resume=False, http_workers=0):
+    _print_banner("STARTING PROPERTY SCRAPING", workers, http_workers)
+
     today = datetime.now().strftime("%Y-%m-%d")
     total_properties = 0
 
-    existing_map = load_existing_data()
+    listing_store = open_store(store, CSV_FILE_NAME, JOURNAL_FILE_NAME, DB_FILE_NAME)
 
-    for scraper_name in SCRAPERS:
-        print(f"Running scraper: {scraper_name}")
-        print("-" * 50)
+    if listing_store.replayed:
+        print(f"Replayed {listing_store.replayed} journaled scraper deltas from an interrupted run")
+        print()
 
-        try:
-            module = importlib.import_module(f"scrapers.{scraper_name}")
-            class_name = ''.join(word.title() for word in scraper_name.split('_')) + 'Scraper'
-            scraper_class = getattr(module, class_name)
+    # ---------------- CHECKPOINT / RESUME ---------------- #
 
-            scraper = scraper_class()
-            properties = scraper.run()
+    manifest = RunManifest.load(MANIFEST_FILE_NAME) if resume else None
 
-            if not properties:
-                print(f"✗ {scraper_name}: No properties found")
-                continue
+    stale = manifest is not None and not manifest.finished and manifest.run_date != today
+    if stale:
+        # Its scrapers' rows would be dated a previous day; what they merged
+        # is already in the store, so just run everything again
+        print(f"Interrupted run is from {manifest.run_date}, not today; starting a new run")
+        print()
+        manifest = None
+
+    if manifest is not None and not manifest.finished:
+        # Deltas the journal replay restored are in the store already
+        missing = [
+            (scraper_name, record) for scraper_name, record in manifest.completed.items()
+            if not listing_store.has_delta(scraper_name)
+        ]
+        for scraper_name, record in missing:
+            listing_store.apply_delta(scraper_name, record.get("delta", []))
+        total_properties += manifest.total_rows()
+        print(f"Resuming run of {today}: {len(manifest.completed)} scrapers already "
+              f"completed ({manifest.total_rows()} properties, "
+              f"{len(missing)} deltas replayed from the manifest)")
+        print()
+    else:
+        if resume and not stale:
+            print("No interrupted run to resume, starting a new run")
+            print()
+        manifest = RunManifest.start(MANIFEST_FILE_NAME, today)
+
+    pending = [name for name in SCRAPERS if not manifest.is_completed(name)]
+
+    # ---------------- SCHEDULE LONGEST FIRST ---------------- #
+
+    runtime_history = RuntimeHistory(RUNTIME_HISTORY_FILE_NAME)
+    estimates = runtime_history.estimates(pending, defaults=REGISTRY.costs())
+    scraper_names = schedule_lpt(pending, estimates) if schedule == "lpt" else pending
+    predicted = predict_makespan(
+        [n for n in scraper_names if not http_workers or REGISTRY.get(n).needs_browser],
+        estimates,
+        workers,
+    )
+    print(f"Schedule: {schedule}, predicted makespan: {format_duration(predicted)}")
+    print()
+
+    run_started = time.time()
+    results = _iter_results(
+        scraper_names, workers, isolate, budget, hang_timeout, http_workers
+    )
+
+    for (scraper_name, properties, error), elapsed in results:
+        runtime_history.record(scraper_name, elapsed)
 
-            # Get agent name from first row (assumed consistent per scraper)
-            agent_name = properties[0].get("agentCompanyName", "")
+        # ---------------- MERGE AFTER EACH SCRAPER ---------------- #
 
-            current_urls = set()
-            agent_existing_urls = {
-                url for url, row in existing_map.items()
-                if row.get("agentCompanyName") == agent_name
-            }
+        total_properties += merge_result(
+            listing_store, scraper_name, properties, error, today, manifest
+        ) or 0
 
-            # ---------------- HANDLE NEW / OLD ---------------- #
+    # ---------------- WRITE CSV ONCE AT THE END ---------------- #
 
-            for row in properties:
-                listing_url = row.get("listingUrl")
-                if not listing_url:
-                    continue
+    listing_store.finalize()
+    listing_store.close()
 
-                current_urls.add(listing_url)
-                row["date"] = today
+    actual = time.time() - run_started
+    runtime_history.save()
+    manifest.finish()
 
-                if listing_url in existing_map:
-                    row["status"] = "Old"
-                else:
-                    row["status"] = "New"
+    print("=" * 70)
+    print("ALL SCRAPERS COMPLETED")
+    print(f"Total properties processed this run: {total_properties}")
+    print(f"Makespan: {format_duration(actual)} (predicted {format_duration(predicted)})")
+    print(f"Data saved to: {CSV_FILE_NAME}")
+    print("=" * 70)
 
-                existing_map[listing_url] = row
 
-            # ---------------- HANDLE DELETED ---------------- #
+# ===================== SHARDS ===================== #
 
-            deleted_urls = agent_existing_urls - current_urls
+def shard_assignment(shard_count):
+    """Deterministic split of helper.SCRAPERS into ``shard_count`` shards."""
+    runtime_history = RuntimeHistory(RUNTIME_HISTORY_FILE_NAME)
+    estimates = runtime_history.estimates(SCRAPERS, defaults=REGISTRY.costs())
+    shards = sharding.assign_shards(SCRAPERS, estimates, shard_count)
+    return shards, estimates
 
-            for url in deleted_urls:
-                existing_row = existing_map.get(url)
-                if existing_row:
-                    existing_row["status"] = "Deleted"
-                    existing_row["date"] = today
-                    existing_map[url] = existing_row
 
-            # ---------------- SAVE AFTER EACH SCRAPER ---------------- #
+def run_shard(shard, workers=1, isolate=True, budget=DEFAULT_BUDGET,
+              hang_timeout=DEFAULT_HANG_TIMEOUT, http_workers=0):
+    """
+    Run one shard (``"i/N"``) and write raw results to a shard file.
 
-            store_data_to_csv(
-                list(existing_map.values()),
-                filepath=CSV_FILE_NAME,
-                mode="overwrite"
-            )
+    The listing store is not touched; use ``--merge-shards`` afterwards.
+    Re-running the same shard on the same day skips scrapers that already
+    succeeded.
+    """
+    index, count = sharding.parse_shard(shard)
+    shards, estimates = shard_assignment(count)
+    key = sharding.assignment_key(shards)
+    today = datetime.now().strftime("%Y-%m-%d")
 
-            total_properties += len(properties)
+    _print_banner(f"STARTING PROPERTY SCRAPING - SHARD {index}/{count}", workers, http_workers)
+
+    path = sharding.shard_file_name(SHARD_DIR, index, count, today)
+    writer = sharding.ShardResultWriter(path, index, count, today, key, shards[index - 1])
+    if writer.key != key:
+        print(f"Continuing {path} with its original assignment {writer.key} "
+              f"(the runtime history now gives {key})")
 
+    pending = [name for name in writer.scrapers if name not in writer.done]
+    scraper_names = schedule_lpt(pending, estimates)
+    predicted = predict_makespan(scraper_names, estimates, workers)
+    print(f"Assignment key: {writer.key} ({len(writer.scrapers)} scrapers, "
+          f"{len(writer.done)} already done)")
+    print(f"Predicted makespan: {format_duration(predicted)}")
+    print()
+
+    run_started = time.time()
+    total_properties = 0
+    results = _iter_results(
+        scraper_names, workers, isolate, budget, hang_timeout, http_workers
+    )
+    for (scraper_name, properties, error), elapsed in results:
+        writer.append(scraper_name, properties, error, elapsed)
+        if error:
+            print(f"✗ Error running {scraper_name}:")
+            print(error)
+        else:
             print(f"✓ {scraper_name}: Scraped {len(properties)} properties")
+            total_properties += len(properties)
+        print()
+
+    print("=" * 70)
+    print(f"SHARD {index}/{count} COMPLETED")
+    print(f"Total properties scraped: {total_properties}")
+    print(f"Makespan: {format_duration(time.time() - run_started)} "
+          f"(predicted {format_duration(predicted)})")
+    print(f"Results saved to: {path}")
+    print("=" * 70)
+    return path
 
-        except Exception as e:
-            print(f"✗ Error running {scraper_name}: {e}")
-            import traceback
-            traceback.print_exc()
 
+def merge_shards(paths, store="csv"):
+    """
+    Merge shard result files into the listing store.
+
+    Each scraper's properties are classified New/Old/Deleted against the
+    full history, using the run date recorded by its shard.
+    """
+    _print_banner("MERGING SHARD RESULTS")
+
+    listing_store = open_store(store, CSV_FILE_NAME, JOURNAL_FILE_NAME, DB_FILE_NAME)
+    runtime_history = RuntimeHistory(RUNTIME_HISTORY_FILE_NAME)
+    total_properties = 0
+
+    for header, record in sharding.iter_shard_results(paths):
+        scraper_name = record["scraper"]
+        runtime_history.record(scraper_name, record.get("seconds", 0.0))
+        total_properties += merge_result(
+            listing_store,
+            scraper_name,
+            record.get("properties") or [],
+            record.get("error"),
+            header.get("run_date"),
+        ) or 0
+
+    listing_store.finalize()
+    listing_store.close()
+    runtime_history.save()
+
+    print("=" * 70)
+    print("SHARD MERGE COMPLETED")
+    print(f"Total properties merged: {total_properties}")
+    print(f"Data saved to: {CSV_FILE_NAME}")
+    print("=" * 70)
+
+
+# ===================== WORK QUEUE ===================== #
+
+def enqueue_run(queue_path=QUEUE_FILE_NAME, max_attempts=3):
+    """Queue one job per scraper unless a run is already open. Returns the run."""
+    queue = WorkQueue(queue_path)
+    try:
+        run = queue.open_run()
+        if run is not None:
+            print(f"Run {run['run_id']} is still open, not enqueuing a new one")
+            return run
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        run_id = datetime.now().strftime("%Y-%m-%dT%H%M%S")
+        runtime_history = RuntimeHistory(RUNTIME_HISTORY_FILE_NAME)
+        priorities = runtime_history.estimates(SCRAPERS, defaults=REGISTRY.costs())
+        added = queue.enqueue_run(run_id, today, priorities, max_attempts=max_attempts)
+        print(f"Enqueued run {run_id}: {added} scraper jobs in {queue_path}")
+        return {"run_id": run_id, "run_date": today}
+    finally:
+        queue.close()
+
+
+def _worker_slot(queue_path, worker_id, lightweight, budget, hang_timeout):
+    """
+    One worker slot: claim a job, run it supervised, report back; repeat
+    until no open run has runnable jobs left.
+    """
+    queue = WorkQueue(queue_path)
+    lease = (budget or DEFAULT_BUDGET) + 60
+    light_names = [name for name in SCRAPERS if not REGISTRY.get(name).needs_browser]
+    processed = 0
+
+    try:
+        while True:
+            job = queue.claim(worker_id, lease, scrapers=light_names if lightweight else None)
+            if job is None:
+                run = queue.open_run()
+                if run is None or queue.is_drained(run["run_id"]):
+                    return processed
+                time.sleep(QUEUE_POLL_INTERVAL)
+                continue
+
+            scraper_name = job["scraper"]
+            print(f"[{worker_id}] Running {scraper_name} (attempt {job['attempt']})")
+
+            # Keep the lease alive while the child runs
+            stop = threading.Event()
+
+            def renew():
+                renew_queue = WorkQueue(queue_path)
+                try:
+                    while not stop.wait(lease / 3):
+                        renew_queue.renew(job["id"], worker_id, lease)
+                finally:
+                    renew_queue.close()
+
+            renewer = threading.Thread(target=renew, daemon=True)
+            renewer.start()
+            started = time.time()
+            try:
+                _, properties, error = run_scraper_isolated(
+                    scraper_name, budget, hang_timeout, lightweight
+                )
+            finally:
+                stop.set()
+                renewer.join()
+            elapsed = time.time() - started
+
+            if error:
+                status = queue.fail(job["id"], worker_id, error, elapsed)
+                print(f"[{worker_id}] ✗ {scraper_name} failed ({status}):")
+                print(error)
+            elif queue.complete(job["id"], worker_id, properties, elapsed):
+                print(f"[{worker_id}] ✓ {scraper_name}: Scraped {len(properties)} properties")
+            else:
+                print(f"[{worker_id}] ✗ {scraper_name}: lease lost, result discarded")
+            processed += 1
+    finally:
+        queue.close()
+
+
+def run_worker(queue_path=QUEUE_FILE_NAME, workers=1, http_workers=0,
+               budget=DEFAULT_BUDGET, hang_timeout=DEFAULT_HANG_TIMEOUT):
+    """
+    Pull jobs from the work queue until it is drained.
+
+    Start this on as many hosts as needed; each runs ``workers`` slots that
+    may take any scraper plus ``http_workers`` slots for HTTP/API scrapers.
+    """
+    _print_banner("STARTING QUEUE WORKER", workers, http_workers)
+    base_id = default_worker_id()
+
+    slots = [(f"{base_id}/{i}", False) for i in range(max(1, workers))]
+    slots += [(f"{base_id}/http{i}", True) for i in range(http_workers)]
+
+    with ThreadPoolExecutor(max_workers=len(slots)) as executor:
+        futures = [
+            executor.submit(_worker_slot, queue_path, worker_id, lightweight, budget, hang_timeout)
+            for worker_id, lightweight in slots
+        ]
+        processed = sum(future.result() for future in futures)
+
+    print("=" * 70)
+    print(f"QUEUE WORKER FINISHED: {processed} jobs processed")
+    print("=" * 70)
+
+
+def collect_run(queue_path=QUEUE_FILE_NAME, store="csv"):
+    """
+    Merge results pushed by queue workers into the listing store as they
+    arrive, until the open run is drained. Then write the CSV and close
+    the run.
+    """
+    queue = WorkQueue(queue_path)
+    run = queue.open_run()
+    if run is None:
+        print("No open run in the work queue")
+        queue.close()
+        return
+
+    _print_banner(f"COLLECTING QUEUED RUN {run['run_id']}")
+
+    listing_store = open_store(store, CSV_FILE_NAME, JOURNAL_FILE_NAME, DB_FILE_NAME)
+    runtime_history = RuntimeHistory(RUNTIME_HISTORY_FILE_NAME)
+    total_properties = 0
+    merge_failed = set()
+
+    while True:
+        drained = queue.is_drained(run["run_id"])
+        for result in queue.unmerged_results(run["run_id"]):
+            if result["job_id"] in merge_failed:
+                continue
+            runtime_history.record(result["scraper"], result["seconds"])
+
+            # Merged before a crash that came ahead of mark_merged: merging
+            # again would turn its New rows into Old
+            if listing_store.has_delta(result["scraper"], run["run_id"]):
+                print(f"✓ {result['scraper']}: already merged")
+                queue.mark_merged(result["job_id"])
+                continue
+
+            merged = merge_result(
+                listing_store, result["scraper"], result["properties"], None, run["run_date"],
+                run_id=run["run_id"],
+            )
+            if merged is None:
+                # Keep the result in the queue for the next --collect
+                merge_failed.add(result["job_id"])
+                continue
+            total_properties += merged
+            queue.mark_merged(result["job_id"])
+        if drained:
+            break
+        time.sleep(QUEUE_POLL_INTERVAL)
+
+    for job in queue.failed_jobs(run["run_id"]):
+        print(f"✗ {job['scraper']}: failed after {job['attempts']} attempts")
+        print(job["error"])
+        print()
+
+    listing_store.finalize()
+    listing_store.close()
+    runtime_history.save()
+    if merge_failed:
+        print(f"{len(merge_failed)} results could not be merged; the run stays open, "
+              f"run --collect again to retry them")
         print()
+    else:
+        queue.close_run(run["run_id"])
+    queue.close()
 
     print("=" * 70)
-    print("ALL SCRAPERS COMPLETED")
-    print(f"Total properties processed this run: {total_properties}")
+    print("QUEUED RUN COMPLETED")
+    print(f"Total properties merged: {total_properties}")
     print(f"Data saved to: {CSV_FILE_NAME}")
     print("=" * 70)
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run all property scrapers.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--http-workers",
+        type=int,
+        default=0,
+        help="Run HTTP/API scrapers (per helper.REGISTRY) in a separate lane of "
+             "this many lightweight workers that never import selenium (default: 0)",
+    )
+    parser.add_argument(
+        "--store",
+        choices=["csv", "sqlite"],
+        default="csv",
+        help="Listing history backend (default: csv). 'sqlite' keeps the "
+             "history in website_data/data.sqlite3 and exports the CSV at the end",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_BUDGET,
+        help=f"Wall-clock budget per scraper in seconds (default: {DEFAULT_BUDGET})",
+    )
+    parser.add_argument(
+        "--hang-timeout",
+        type=int,
+        default=DEFAULT_HANG_TIMEOUT,
+        help="Kill a scraper that produces no output for this many seconds "
+             f"(default: {DEFAULT_HANG_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--schedule",
+        choices=["lpt", "list"],
+        default="lpt",
+        help="Dispatch order: 'lpt' starts the longest scrapers first using "
+             "website_data/runtime_history.json; 'list' keeps helper.SCRAPERS order",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run: skip scrapers already recorded in "
+             "website_data/run_manifest.jsonl and replay their deltas",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Run only shard I of N (balanced by expected runtime) and write "
+             "results to website_data/shards/ instead of the listing store",
+    )
+    parser.add_argument(
+        "--merge-shards",
+        nargs="+",
+        metavar="FILE",
+        help="Merge shard result files into the listing store and exit",
+    )
+    parser.add_argument(
+        "--queue",
+        default=QUEUE_FILE_NAME,
+        metavar="PATH",
+        help="Work queue database (default: website_data/work_queue.sqlite3)",
+    )
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Queue one job per scraper for pull-based workers and exit",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Pull jobs from the work queue until it is drained",
+    )
+    parser.add_argument(
+        "--collect",
+        action="store_true",
+        help="Merge results of the open queued run as workers finish them",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run scrapers without the supervised child process (no timeouts)",
+    )
+    parser.add_argument(
+        "--resource-report",
+        action="store_true",
+        help="Load pages without resource blocking and record per scraper how "
+             "many bytes the blocklist saves (website_data/resource_report.jsonl)",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    run_all_scrapers()
+    args = parse_args()
+    if args.resource_report:
+        # Read by utils/webdriver_pool.py, here and in the worker processes
+        os.environ["WEBDRIVER_RESOURCE_REPORT"] = "1"
+    if args.enqueue:
+        enqueue_run(args.queue)
+    elif args.worker:
+        run_worker(
+            args.queue,
+            workers=args.workers,
+            http_workers=args.http_workers,
+            budget=args.timeout,
+            hang_timeout=args.hang_timeout,
+        )
+    elif args.collect:
+        collect_run(args.queue, store=args.store)
+    elif args.merge_shards:
+        merge_shards(args.merge_shards, store=args.store)
+    elif args.shard:
+        run_shard(
+            args.shard,
+            workers=args.workers,
+            isolate=not args.in_process,
+            budget=args.timeout,
+            hang_timeout=args.hang_timeout,
+            http_workers=args.http_workers,
+        )
+    else:
+        run_all_scrapers(
+            workers=args.workers,
+            store=args.store,
+            isolate=not args.in_process,
+            budget=args.timeout,
+            hang_timeout=args.hang_timeout,
+            schedule=args.schedule,
+            resume=args.resume,
+            http_workers=args.http_workers,
+        )
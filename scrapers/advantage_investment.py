@@ -1,17 +1,17 @@
 import re
 import time
-import requests
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils import http_client
+from utils.load_more import LoadMoreEndpoint
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class AdvantageInvestmentScraper:
     BASE_URL = "https://advantageinvestment.co.uk/investment-properties/"
@@ -20,32 +20,23 @@ class AdvantageInvestmentScraper:
     def __init__(self):
         self.results = []
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
 
     # ============================= RUN ============================= #
 
     def run(self):
-        session = requests.Session()
-        page = 1
         seen = set()
 
-        while True:
-            payload = {
+        # JetEngine "load more" request, all pages fetched concurrently
+        endpoint = LoadMoreEndpoint(
+            f"{self.BASE_URL}?nocache={int(time.time())}",
+            params={
                 "action": "jet_engine_ajax",
                 "handler": "listing_load_more",
                 "query[post_status][]": "publish",
                 "query[post_type]": "properties",
                 "query[posts_per_page]": "9",
-                "query[paged]": str(page - 1),
                 "query[ignore_sticky_posts]": "1",
                 "query[suppress_filters]": "false",
                 "widget_settings[lisitng_id]": "21267",
@@ -53,33 +44,18 @@ class AdvantageInvestmentScraper:
                 "widget_settings[columns]": "3",
                 "widget_settings[use_load_more]": "yes",
                 "widget_settings[load_more_type]": "scroll",
-                "page_settings[page]": str(page),
-            }
-
-            response = session.post(
-                f"{self.BASE_URL}?nocache={int(time.time())}",
-                data=payload,
-                headers={
-                    "X-Requested-With": "XMLHttpRequest",
-                    "Referer": self.BASE_URL,
-                    "Origin": self.DOMAIN,
-                }
-            )
-
-            if response.status_code != 200:
-                break
-
-            try:
-                json_data = response.json()
-                html_block = json_data.get("data", {}).get("html", "")
-            except Exception:
-                break
-
-            if not html_block:
-                break
-
-            tree = html.fromstring(html_block)
+            },
+            page_params={
+                "query[paged]": -1,
+                "page_settings[page]": 0,
+            },
+            headers={
+                "Referer": self.BASE_URL,
+                "Origin": self.DOMAIN,
+            },
+        )
 
+        for tree in endpoint.fetch_all(http_client):
             listing_urls = tree.xpath(
                 "//div[contains(@class,'jet-listing-grid__item')]"
                 "//a[contains(@class,'jet-listing-dynamic-link__link')]/@href"
@@ -101,9 +77,7 @@ class AdvantageInvestmentScraper:
             for full_url in new_urls:
                 self.results.append(self.parse_listing(full_url))
 
-            page += 1
-
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ============================= LISTING ============================= #
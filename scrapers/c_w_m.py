@@ -1,21 +1,23 @@
 import re
 import json
 import math
-import time
-import random
+from urllib.parse import urlencode
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+from utils.browser_session import BrowserSession
+from utils.rate_limit import ERROR, OK, THROTTLED, get_limiter, is_challenge_page
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class CWMScraper:
-    DOMAIN  = "https://www.cbre.co.uk"
-    API_URL = "https://www.cbre.co.uk/property-api/propertylistings/query"
+    DOMAIN     = "https://www.cbre.co.uk"
+    API_URL    = "https://www.cbre.co.uk/property-api/propertylistings/query"
+    SEARCH_URL = f"{DOMAIN}/property-search/office-space/listings/results?aspects=isLetting"
+    CARD_XPATH = "//div[contains(@class,'r4PropertyCard')]"
 
     # London bounding box
     LAT     = "51.5072178"
@@ -34,6 +36,15 @@ class CWMScraper:
 
     PAGE_SIZE = 24
 
+    # API pages requested per batch, and at most in flight at once
+    BATCH_SIZE     = 24
+    MAX_CONCURRENT = 4
+
+    # Seconds allowed per in-browser round of requests, and further
+    # in-browser attempts (in smaller batches) for failed pages
+    REQUEST_TIMEOUT = 20
+    BROWSER_RETRIES = 2
+
     TYPE_MAP = {
         "office":     ("Office",     "office-space"),
         "retail":     ("Retail",     "retail-space"),
@@ -49,22 +60,14 @@ class CWMScraper:
         self.results   = []
         self.seen_keys = set()
 
-        opts = Options()
-        opts.binary_location = "/usr/bin/chromium-browser"
-        opts.add_argument("--headless=new")
-        opts.add_argument("--no-sandbox")
-        opts.add_argument("--disable-dev-shm-usage")
-        opts.add_argument("--window-size=1920,1080")
-        opts.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/145.0.0.0 Safari/537.36"
+        self.driver = get_driver(
+            extra_args=[
+                "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/145.0.0.0 Safari/537.36",
+                "--disable-blink-features=AutomationControlled",
+            ],
+            experimental={"excludeSwitches": ["enable-automation"], "useAutomationExtension": False},
         )
-        opts.add_experimental_option("excludeSwitches", ["enable-automation"])
-        opts.add_experimental_option("useAutomationExtension", False)
-        opts.add_argument("--disable-blink-features=AutomationControlled")
-
-        svc =Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=svc, options=opts)
         self.driver.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
             {"source": "Object.defineProperty(navigator,'webdriver',{get:()=>undefined})"},
@@ -75,27 +78,35 @@ class CWMScraper:
         # Load the search page once so CF sets cookies on this browser session
         self._warm_up()
 
+        # API pages go over plain HTTP with the browser's cookies while CF
+        # accepts that; the session re-warms this browser on a challenge
+        self.http = BrowserSession(
+            self.SEARCH_URL,
+            driver=self.driver,
+            wait_for=(By.XPATH, self.CARD_XPATH),
+            headers={
+                "Accept":           "application/json, text/javascript, */*; q=0.01",
+                "X-Requested-With": "XMLHttpRequest",
+                "Referer":          self.SEARCH_URL,
+            },
+        )
+        self.http.load_from(self.driver)
+
     # ──────────────────────────────────────────────────────────────────────
     # Warm-up: establish a trusted CF session
     # ──────────────────────────────────────────────────────────────────────
 
     def _warm_up(self):
-        url = (
-            f"{self.DOMAIN}/property-search/office-space"
-            f"/listings/results?aspects=isLetting"
-        )
-        self.driver.get(url)
+        self.driver.get(self.SEARCH_URL)
         try:
             self.wait.until(EC.presence_of_element_located(
-                (By.XPATH, "//div[contains(@class,'r4PropertyCard')]")
+                (By.XPATH, self.CARD_XPATH)
             ))
         except TimeoutException:
             pass
 
 
-    def _fetch_api(self, usage_type, aspect_flag, page, type_slug):
-        from urllib.parse import urlencode
-
+    def _api_url(self, usage_type, aspect_flag, page):
         params = {
             "Site":             "uk-comm",
             "Interval":         "Annually",
@@ -113,28 +124,98 @@ class CWMScraper:
             "Page":             str(page),
             "_select":          self.SELECT_FIELDS,
         }
-        url = f"{self.API_URL}?{urlencode(params)}"
+        return f"{self.API_URL}?{urlencode(params)}"
 
-        # Synchronous XHR — execute_script blocks until JS returns
+
+    def _fetch_batch(self, urls):
+        """
+        GET all ``urls`` over HTTP, MAX_CONCURRENT at a time; whatever
+        fails (or all of them, once CF stops accepting the cookies) is
+        fetched from the warmed page instead. Returns parsed JSON (or None)
+        per URL, in order.
+        """
+        results = [None] * len(urls)
+        if not self.http.blocked:
+            responses = self.http.get_many(urls, workers=self.MAX_CONCURRENT)
+            results = [
+                self._parse_api_response(r.text) if r is not None and r.ok else None
+                for r in responses
+            ]
+
+        # Pages still missing are retried in smaller batches, so one slow
+        # or timed-out round trip doesn't cost the whole batch
+        missing = [i for i, data in enumerate(results) if data is None]
+        chunk   = len(missing)
+        for _ in range(self.BROWSER_RETRIES + 1):
+            if not missing:
+                break
+            for start in range(0, len(missing), chunk):
+                part    = missing[start:start + chunk]
+                fetched = self._fetch_in_browser([urls[i] for i in part])
+                for i, data in zip(part, fetched):
+                    results[i] = data
+            missing = [i for i in missing if results[i] is None]
+            chunk   = max(1, chunk // 4)
+        return results
+
+
+    def _fetch_in_browser(self, urls):
+        """
+        GET all ``urls`` from the warmed page. Every request takes its own
+        limiter ticket; each WebDriver round trip sends as many requests
+        together as the limiter has slots for (at most MAX_CONCURRENT).
+        """
         js = """
-        var url = arguments[0];
-        var xhr = new XMLHttpRequest();
-        xhr.open('GET', url, false);          // false = synchronous
-        xhr.setRequestHeader('Accept', 'application/json, text/javascript, */*; q=0.01');
-        xhr.setRequestHeader('X-Requested-With', 'XMLHttpRequest');
-        try {
-            xhr.send(null);
-            return xhr.responseText;
-        } catch(e) {
-            return 'ERROR:' + e.toString();
-        }
+        var urls = arguments[0];
+        var done = arguments[arguments.length - 1];
+        Promise.all(urls.map(function (url) {
+            return fetch(url, {
+                credentials: 'same-origin',
+                headers: {
+                    'Accept': 'application/json, text/javascript, */*; q=0.01',
+                    'X-Requested-With': 'XMLHttpRequest'
+                }
+            })
+                .then(function (r) { return r.text(); })
+                .catch(function (e) { return 'ERROR:' + e; });
+        })).then(done);
         """
 
-        try:
-            raw = self.driver.execute_script(js, url)
-        except Exception:
-            return None
-
+        limiter = get_limiter()
+        self.driver.set_script_timeout(self.REQUEST_TIMEOUT)
+        results = []
+        while len(results) < len(urls):
+            count   = min(self.MAX_CONCURRENT, len(urls) - len(results))
+            tickets = limiter.acquire_many(self.API_URL, count)
+            part    = urls[len(results):len(results) + len(tickets)]
+            raw_results = None
+            outcomes    = [ERROR] * len(part)
+            try:
+                raw_results = self.driver.execute_async_script(js, part)
+                outcomes    = [self._outcome(raw) for raw in raw_results]
+            except TimeoutException:
+                outcomes = [THROTTLED] * len(part)
+            except Exception:
+                pass
+            finally:
+                for ticket, outcome in zip(tickets, outcomes):
+                    ticket.outcome = outcome
+                    limiter.release(ticket)
+
+            results.extend(self._parse_api_response(raw) for raw in raw_results or [None] * len(part))
+        return results
+
+
+    def _outcome(self, raw):
+        """Limiter outcome of one in-page fetch."""
+        if self._parse_api_response(raw) is not None:
+            return OK
+        if isinstance(raw, str) and is_challenge_page(raw):
+            return THROTTLED
+        return ERROR
+
+
+    def _parse_api_response(self, raw):
         if not raw:
             return None
 
@@ -150,8 +231,12 @@ class CWMScraper:
             return None
 
 
-    def _random_delay(self, lo=1.0, hi=2.5):
-        time.sleep(random.uniform(lo, hi))
+    def _listings(self, data):
+        if not data or not data.get("Found", False):
+            return []
+        outer = data.get("Documents") or []
+        return outer[0] if outer and isinstance(outer[0], list) else []
+
 
     def _clean(self, val):
         return " ".join(str(val).split()) if val else ""
@@ -331,50 +416,79 @@ class CWMScraper:
 
 
     def run(self):
-        for prop_key, (usage_type, type_slug) in self.TYPE_MAP.items():
-            for deal_key, (aspect_flag, sale_type_label) in self.DEAL_MAP.items():
-
-                page       = 1
-                total_hit  = 0
-                total_docs = None
-
-                while True:
-                    data = self._fetch_api(usage_type, aspect_flag, page, type_slug)
-
-                    if data is None:
-                        break
-
-                    if not data.get("Found", False):
-                        break
-
-                    if total_docs is None:
-                        total_docs  = int(data.get("DocumentCount", 0))
-
-                    outer = data.get("Documents") or []
-                    listings = outer[0] if outer and isinstance(outer[0], list) else []
-
-                    if not listings:
-                        break
+        searches = [
+            (usage_type, type_slug, aspect_flag, sale_type_label)
+            for usage_type, type_slug in self.TYPE_MAP.values()
+            for aspect_flag, sale_type_label in self.DEAL_MAP.values()
+        ]
 
-                    for listing in listings:
-                        key = listing.get("Common.PrimaryKey", "")
-                        if key in self.seen_keys:
-                            continue
-                        self.seen_keys.add(key)
-                        try:
-                            record = self._build_record(listing, sale_type_label, type_slug)
-                            self.results.append(record)
-                            total_hit += 1
-    
-                        except Exception:
-                            pass
+        # Page 1 of every search, which also tells how many pages each has
+        first_pages = self._fetch_batch([
+            self._api_url(usage_type, aspect_flag, 1)
+            for usage_type, _, aspect_flag, _ in searches
+        ])
+
+        responses  = {}
+        remaining  = []
+        last_pages = {}
+        missing    = []
+        for index, data in enumerate(first_pages):
+            if data is None:
+                missing.append((index, 1))
+                continue
+            listings = self._listings(data)
+            if not listings:
+                continue
+            responses[(index, 1)] = data
+            last_pages[index]     = 1
+            if len(listings) < self.PAGE_SIZE:
+                continue
+            total_docs = int(data.get("DocumentCount", 0))
+            last_pages[index] = math.ceil(total_docs / self.PAGE_SIZE)
+            remaining.extend((index, page) for page in range(2, last_pages[index] + 1))
+
+        # All other pages of all searches, BATCH_SIZE at a time; every
+        # request takes its own ticket from the shared per-domain limiter
+        for start in range(0, len(remaining), self.BATCH_SIZE):
+            batch = remaining[start:start + self.BATCH_SIZE]
+            results = self._fetch_batch([
+                self._api_url(searches[index][0], searches[index][2], page)
+                for index, page in batch
+            ])
+            responses.update(zip(batch, results))
+
+        # Records in search / page order, as the site lists them; a page
+        # that could not be fetched is skipped, not the rest of its search
+        for index, (usage_type, type_slug, aspect_flag, sale_type_label) in enumerate(searches):
+            for page in range(1, last_pages.get(index, 0) + 1):
+                data = responses.get((index, page))
+                if data is None:
+                    missing.append((index, page))
+                    continue
+                listings = self._listings(data)
+                if not listings:
+                    break
 
-                    fetched = (page - 1) * self.PAGE_SIZE + len(listings)
-                    if fetched >= total_docs or len(listings) < self.PAGE_SIZE:
-                        break
+                for listing in listings:
+                    key = listing.get("Common.PrimaryKey", "")
+                    if key in self.seen_keys:
+                        continue
+                    self.seen_keys.add(key)
+                    try:
+                        record = self._build_record(listing, sale_type_label, type_slug)
+                        self.results.append(record)
+                    except Exception:
+                        pass
+
+                if len(listings) < self.PAGE_SIZE:
+                    break
 
-                    page += 1
-                    self._random_delay(0.8, 2.0)
+        if missing:
+            pages = ", ".join(
+                f"{searches[index][0]}/{searches[index][3]} p{page}" for index, page in sorted(missing)
+            )
+            print(f"CBRE: {len(missing)} API pages could not be fetched: {pages}")
 
-        self.driver.quit()
+        self.http.close()
+        release_driver(self.driver)
         return self.results
\ No newline at end of file
@@ -1,15 +1,14 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class ChancellorSonsScraper:
     BASE_URL = "http://www.homes-on-line.com/cgi-bin/hol/search1.cgi?HEADER=chancellor-sons%2Fheader.htm&INDEX=surrey%2Fchancellor-sons.133%2F__localind&TYPE=FS&AREA=ALL&BED=0&H=true&F=true&FARM=true&MIN=100&MAX=2%2C000%2C000&image=Search+Now&email="
@@ -19,15 +18,7 @@ class ChancellorSonsScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
 
     # ===================== RUN ===================== #
@@ -60,7 +51,7 @@ class ChancellorSonsScraper:
             except Exception:
                 continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
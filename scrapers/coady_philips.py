@@ -1,15 +1,14 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class CoadyPhilipsScraper:
     BASE_URL = "https://propertysearch.coadyphillips.co.uk/"
@@ -19,15 +18,7 @@ class CoadyPhilipsScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
 
     # ===================== RUN ===================== #
@@ -56,7 +47,7 @@ class CoadyPhilipsScraper:
             except Exception:
                 continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ===================== DETAIL PAGE ===================== #
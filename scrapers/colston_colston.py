@@ -1,15 +1,14 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class ColstonColstonScraper:
     START_URL = "https://www.cs-re.co.uk/properties/"
@@ -19,15 +18,7 @@ class ColstonColstonScraper:
         self.collected_data = []
         self.visited_links = set()
 
-        chrome_opts = Options()
-        chrome_opts.binary_location = "/usr/bin/chromium-browser"
-        chrome_opts.add_argument("--headless=new")
-        chrome_opts.add_argument("--no-sandbox")
-        chrome_opts.add_argument("--disable-dev-shm-usage")
-        chrome_opts.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.browser = webdriver.Chrome(service=service, options=chrome_opts)
+        self.browser = get_driver()
         self.waiter = WebDriverWait(self.browser, 20)
 
     # ===================== EXECUTION ===================== #
@@ -115,7 +106,7 @@ class ColstonColstonScraper:
             except Exception:
                 continue
 
-        self.browser.quit()
+        release_driver(self.browser)
         return self.collected_data
 
     # ===================== DETAIL PAGE ===================== #
@@ -2,13 +2,12 @@ import re
 from urllib.parse import urljoin, urlparse, parse_qs
 
 from lxml import html
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class CursonSowerbyPartnersScraper:
     DOMAIN = "https://www.cspretail.com"
@@ -27,15 +26,7 @@ class CursonSowerbyPartnersScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
 
     # ===================== RUN ===================== #
@@ -46,7 +37,7 @@ class CursonSowerbyPartnersScraper:
                 self._crawl_search(config["url"], config["subtype"])
             return self.results
         finally:
-            self.driver.quit()
+            release_driver(self.driver)
 
     def _crawl_search(self, base_url, property_sub_type):
         max_page = self._get_max_page(base_url)
@@ -1,16 +1,15 @@
 import re
-from urllib.request import Request, urlopen
 from urllib.parse import urljoin, urlparse, parse_qs
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.http_first import fetch_tree
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class DanielHirstScraper:
     DOMAIN = "https://www.ws-residential.co.uk"
@@ -30,24 +29,13 @@ class DanielHirstScraper:
             )
         }
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.page_load_strategy = "eager"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_experimental_option(
-            "prefs",
-            {
+        self.driver = get_driver(
+            extra_args=["--disable-gpu", "--blink-settings=imagesEnabled=false"],
+            prefs={
                 "profile.managed_default_content_settings.images": 2,
             },
+            page_load_strategy="eager",
         )
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.wait = WebDriverWait(self.driver, 20)
 
     # ===================== RUN ===================== #
@@ -124,7 +112,7 @@ class DanielHirstScraper:
 
                 current_url = urljoin(self.DOMAIN + "/", next_href)
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
@@ -337,17 +325,14 @@ class DanielHirstScraper:
         return " ".join(val.split()) if val else ""
 
     def _fetch_detail_tree(self, url):
-        try:
-            req = Request(url, headers=self.http_headers)
-            with urlopen(req, timeout=12) as response:
-                content = response.read()
-            tree = html.fromstring(content)
-            has_title = bool(tree.xpath("//div[@id='propertyTitle']//h1"))
-            if has_title:
-                return tree
-        except Exception:
-            pass
+        return fetch_tree(
+            url,
+            ["//div[@id='propertyTitle']//h1"],
+            self._load_detail_in_browser,
+            headers=self.http_headers,
+        )
 
+    def _load_detail_in_browser(self, url):
         try:
             self.driver.get(url)
             self.wait.until(EC.presence_of_element_located((
@@ -1,17 +1,16 @@
 import re
-import time
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from lxml import html
 
+from utils import waits
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class DavisonBlackettScraper:
     BASE_URL = "http://www.davisonblackett.com/db_property_listings.html"
@@ -21,25 +20,18 @@ class DavisonBlackettScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--ignore-certificate-errors")
-        chrome_options.add_argument("--allow-insecure-localhost")
-        chrome_options.add_argument("--disable-web-security")
-        # Spoof a real browser user-agent to avoid bot blocking
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (X11; Linux x86_64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
+        self.driver = get_driver(
+            extra_args=[
+                "--disable-gpu",
+                "--ignore-certificate-errors",
+                "--allow-insecure-localhost",
+                "--disable-web-security",
+                # Spoof a real browser user-agent to avoid bot blocking
+                "--user-agent=Mozilla/5.0 (X11; Linux x86_64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36",
+            ],
         )
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.driver.set_page_load_timeout(60)
         self.wait = WebDriverWait(self.driver, 30)
 
@@ -49,11 +41,11 @@ class DavisonBlackettScraper:
         try:
             self.driver.get(self.BASE_URL)
         except WebDriverException:
-            self.driver.quit()
+            release_driver(self.driver)
             return self.results
 
-        # Give the page extra time to settle
-        time.sleep(5)
+        # Give the page time to settle
+        waits.network_idle(self.driver, replaces=5)
 
         # Try waiting for detail cards; fall back to parsing page source directly
         try:
@@ -83,7 +75,7 @@ class DavisonBlackettScraper:
             )
 
         if not detail_links:
-            self.driver.quit()
+            release_driver(self.driver)
             return self.results
 
 
@@ -110,7 +102,7 @@ class DavisonBlackettScraper:
 
                 continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
@@ -122,7 +114,7 @@ class DavisonBlackettScraper:
         except WebDriverException:
             return None
 
-        time.sleep(2)
+        waits.dom_stable(self.driver, replaces=2)
 
         # Wait for locWrap; don't crash if it times out
         try:
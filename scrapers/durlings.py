@@ -1,13 +1,12 @@
 import re
-import requests
 from urllib.parse import urljoin
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 
 from lxml import html
 
+from utils import http_client
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class DurlingsScraper:
     BASE_URLS = [
@@ -21,16 +20,7 @@ class DurlingsScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver(extra_args=["--blink-settings=imagesEnabled=false"])
 
     # ===================== RUN ===================== #
 
@@ -57,7 +47,7 @@ class DurlingsScraper:
                 if not listing_urls:
                     break
 
-                new_count = 0
+                new_urls = []
 
                 for href in listing_urls:
                     url = urljoin(self.DOMAIN, href)
@@ -66,29 +56,26 @@ class DurlingsScraper:
                         continue
 
                     self.seen_urls.add(url)
-                    new_count += 1
+                    new_urls.append(url)
 
-                    try:
-                        obj = self.parse_listing(url, sale_type)
-                        if obj:
-                            self.results.append(obj)
-                    except Exception:
-                        continue
-
-                if new_count == 0:
+                if not new_urls:
                     break
 
+                self.results.extend(obj for obj in http_client.map_details(
+                    lambda url: self.parse_listing(url, sale_type), new_urls
+                ) if obj)
+
                 page += 1
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
 
     def parse_listing(self, url, sale_type):
 
-        # 🚀 FAST: use requests instead of Selenium
-        response = requests.get(url, timeout=10)
+        # 🚀 FAST: pooled HTTP instead of Selenium
+        response = http_client.get(url, timeout=10)
         tree = html.fromstring(response.text)
 
         address_main = self._clean(" ".join(
@@ -1,7 +1,8 @@
 import re
-import requests
 from urllib.parse import urljoin
 
+from utils import http_client
+
 
 class EverardColeScraper:
     API_URL = (
@@ -28,7 +29,7 @@ class EverardColeScraper:
             "user-agent": "Mozilla/5.0"
         }
 
-        response = requests.post(self.API_URL, headers=headers)
+        response = http_client.post(self.API_URL, headers=headers)
         response.raise_for_status()
 
         data = response.json()
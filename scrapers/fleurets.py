@@ -1,40 +1,46 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.dom_extract import PageExtractor
+from utils.webdriver_pool import get_driver, release_driver
+
+
+def meta_value_xpath(label):
+    return (
+        "//div[contains(@class,'property-details')]"
+        f"//div[contains(@class,'item')][.//div[contains(@class,'name') and normalize-space()='{label}']]"
+        "//div[contains(@class,'value')]//text()"
+    )
+
 
 class FleuretsScraper:
     BASE_URL = "https://www.fleurets.com/search.html"
     DOMAIN = "https://www.fleurets.com"
 
+    DETAIL_FIELDS = PageExtractor({
+        "title": "//h1[contains(@class,'o-title')]//text()",
+        "address": "//div[contains(@class,'property-meta')]//address//text()",
+        "bullets": "//div[@id='property-details']//li//text()",
+        "contact": "//div[contains(@class,'alert-info')]//text()",
+        "price": meta_value_xpath("PRICE"),
+        "tenure": meta_value_xpath("TENURE"),
+        "images": "//div[contains(@class,'property-carousel')]//img/@src",
+        "brochures": "//a[contains(translate(@href,'PDF','pdf'),'.pdf')]/@href",
+    })
+
     def __init__(self):
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        self.driver = webdriver.Chrome(
-            service=Service("/usr/bin/chromedriver"),
-            options=chrome_options,
-        )
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
-        self.detail_driver = webdriver.Chrome(
-            service=Service("/usr/bin/chromedriver"),
-            options=chrome_options,
-        )
+        self.detail_driver = get_driver(recycle=True)
         self.detail_wait = WebDriverWait(self.detail_driver, 20)
 
     # ===================== RUN ===================== #
@@ -48,8 +54,8 @@ class FleuretsScraper:
                 "//div[@id='page-list']//div[contains(@class,'property-item')]",
             )))
         except Exception:
-            self.driver.quit()
-            self.detail_driver.quit()
+            release_driver(self.driver)
+            release_driver(self.detail_driver)
             return self.results
 
         current_page = 1
@@ -132,8 +138,8 @@ class FleuretsScraper:
 
             current_page = next_page
 
-        self.driver.quit()
-        self.detail_driver.quit()
+        release_driver(self.driver)
+        release_driver(self.detail_driver)
         return self.results
 
     # ===================== LISTING ===================== #
@@ -146,20 +152,14 @@ class FleuretsScraper:
             "//h1[contains(@class,'o-title')]",
         )))
 
-        tree = html.fromstring(self.detail_driver.page_source)
+        fields = self.DETAIL_FIELDS.extract(self.detail_driver)
 
-        title = self._clean(" ".join(tree.xpath("//h1[contains(@class,'o-title')]//text()")))
-        address = self._clean(" ".join(
-            tree.xpath("//div[contains(@class,'property-meta')]//address//text()")
-        ))
+        title = self._clean(" ".join(fields["title"]))
+        address = self._clean(" ".join(fields["address"]))
         display_address = self._clean(" ".join(part for part in [title, address] if part))
 
-        detail_bullets = self._clean(" ".join(
-            tree.xpath("//div[@id='property-details']//li//text()")
-        ))
-        contact_text = self._clean(" ".join(
-            tree.xpath("//div[contains(@class,'alert-info')]//text()")
-        ))
+        detail_bullets = self._clean(" ".join(fields["bullets"]))
+        contact_text = self._clean(" ".join(fields["contact"]))
         detailed_description = self._clean(" ".join(
             part
             for part in [
@@ -171,8 +171,8 @@ class FleuretsScraper:
             if part
         ))
 
-        detail_price_text = self.get_meta_value(tree, "PRICE")
-        detail_tenure_text = self.get_meta_value(tree, "TENURE")
+        detail_price_text = self._clean(" ".join(fields["price"]))
+        detail_tenure_text = self._clean(" ".join(fields["tenure"]))
 
         price_text = detail_price_text or listing_summary.get("price_text", "")
         tenure_text = detail_tenure_text or listing_summary.get("tenure_text", "")
@@ -188,9 +188,7 @@ class FleuretsScraper:
         price = self.extract_numeric_price(price_input_text, sale_type)
 
         property_images = []
-        for src in tree.xpath(
-            "//div[contains(@class,'property-carousel')]//img/@src"
-        ):
+        for src in fields["images"]:
             full = urljoin(self.DOMAIN, src)
             if full and full not in property_images:
                 property_images.append(full)
@@ -199,7 +197,7 @@ class FleuretsScraper:
             property_images.append(urljoin(self.DOMAIN, listing_summary.get("image")))
 
         brochure_urls = []
-        for href in tree.xpath("//a[contains(translate(@href,'PDF','pdf'),'.pdf')]/@href"):
+        for href in fields["brochures"]:
             full = urljoin(self.DOMAIN, href)
             if full not in brochure_urls:
                 brochure_urls.append(full)
@@ -238,15 +236,6 @@ class FleuretsScraper:
 
     # ===================== HELPERS ===================== #
 
-    def get_meta_value(self, tree, label):
-        return self._clean(" ".join(
-            tree.xpath(
-                "//div[contains(@class,'property-details')]"
-                f"//div[contains(@class,'item')][.//div[contains(@class,'name') and normalize-space()='{label}']]"
-                "//div[contains(@class,'value')]//text()"
-            )
-        ))
-
     def extract_property_sub_type(self, url):
         if not url:
             return ""
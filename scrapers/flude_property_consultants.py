@@ -1,36 +1,48 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from lxml import html
 
+from utils.dom_extract import PageExtractor
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class FludePropertyConsultantsScraper:
     BASE_URL = "https://www.flude.com/Property/Search/All/All/All/Both"
     DOMAIN = "https://www.flude.com"
 
+    DETAIL_FIELDS = PageExtractor({
+        "address": "//h2[contains(@class,'property-address')]//text()",
+        "type": "//h3[contains(@class,'property-type')]//text()",
+        "status": "//div[contains(@class,'property-status-wrapper')]//h1//text()",
+        "size": "//h3[contains(@class,'property-size')]//text()",
+        "sections": (
+            "//div[contains(@class,'property-details-section')]//p[contains(@class,'property-details-title')]",
+            {
+                "heading": ".//text()",
+                "content": "following-sibling::p[contains(@class,'property-details-content')][1]//text()",
+            },
+        ),
+        "features": "//div[contains(@class,'property-key-features')]//li//text()",
+        "image_styles": "//div[contains(@class,'property-image')]/@style",
+        "brochures": "//a[contains(@href,'ViewFile') or contains(translate(@href,'PDF','pdf'),'.pdf')]/@href",
+        "agent_name": "(//div[contains(@class,'property-agent')]//p[contains(@class,'property-agent-name')]//text())[1]",
+        "agent_phone": "(//div[contains(@class,'property-agent')]//a[contains(@class,'property-agent-tel')]/@href)[1]",
+        "agent_email": "(//div[contains(@class,'property-agent')]//a[contains(@class,'property-agent-email')]/@href)[1]",
+    })
+
     def __init__(self):
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
 
-        self.detail_driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.detail_driver = get_driver(recycle=True)
         self.detail_wait = WebDriverWait(self.detail_driver, 20)
 
     # ===================== RUN ===================== #
@@ -44,8 +56,8 @@ class FludePropertyConsultantsScraper:
                 "//div[contains(@class,'property-card-wrapper')]//div[contains(@class,'property-card')]",
             )))
         except Exception:
-            self.driver.quit()
-            self.detail_driver.quit()
+            release_driver(self.driver)
+            release_driver(self.detail_driver)
             return self.results
 
         while True:
@@ -122,8 +134,8 @@ class FludePropertyConsultantsScraper:
             except Exception:
                 break
 
-        self.driver.quit()
-        self.detail_driver.quit()
+        release_driver(self.driver)
+        release_driver(self.detail_driver)
         return self.results
 
     # ===================== LISTING ===================== #
@@ -136,38 +148,26 @@ class FludePropertyConsultantsScraper:
             "//div[contains(@class,'property-details-page-wrapper')]",
         )))
 
-        tree = html.fromstring(self.detail_driver.page_source)
+        fields = self.DETAIL_FIELDS.extract(self.detail_driver)
 
-        display_address = self._clean(" ".join(
-            tree.xpath("//h2[contains(@class,'property-address')]//text()")
-        )) or listing_summary.get("address", "")
+        display_address = self._clean(" ".join(fields["address"])) or listing_summary.get("address", "")
 
-        property_sub_type = self._clean(" ".join(
-            tree.xpath("//h3[contains(@class,'property-type')]//text()")
-        )) or listing_summary.get("property_type", "")
+        property_sub_type = self._clean(" ".join(fields["type"])) or listing_summary.get("property_type", "")
 
-        status_text = self._clean(" ".join(
-            tree.xpath("//div[contains(@class,'property-status-wrapper')]//h1//text()")
-        )) or listing_summary.get("status_text", "")
+        status_text = self._clean(" ".join(fields["status"])) or listing_summary.get("status_text", "")
 
-        size_text = self._clean(" ".join(
-            tree.xpath("//h3[contains(@class,'property-size')]//text()")
-        )) or listing_summary.get("size_text", "")
+        size_text = self._clean(" ".join(fields["size"])) or listing_summary.get("size_text", "")
 
         section_parts = []
-        for title in tree.xpath("//div[contains(@class,'property-details-section')]//p[contains(@class,'property-details-title')]"):
-            heading = self._clean(" ".join(title.xpath(".//text()")))
-            content = self._clean(" ".join(
-                title.xpath("following-sibling::p[contains(@class,'property-details-content')][1]//text()")
-            ))
+        for section in fields["sections"]:
+            heading = self._clean(" ".join(section["heading"]))
+            content = self._clean(" ".join(section["content"]))
             if heading and content:
                 section_parts.append(f"{heading}: {content}")
             elif content:
                 section_parts.append(content)
 
-        features_text = self._clean(" ".join(
-            tree.xpath("//div[contains(@class,'property-key-features')]//li//text()")
-        ))
+        features_text = self._clean(" ".join(fields["features"]))
         if features_text:
             section_parts.append(features_text)
 
@@ -181,8 +181,7 @@ class FludePropertyConsultantsScraper:
         price = self.extract_numeric_price(detailed_description, sale_type)
 
         property_images = []
-        style_chunks = tree.xpath("//div[contains(@class,'property-image')]/@style")
-        for style in style_chunks:
+        for style in fields["image_styles"]:
             for image_url in re.findall(r"url\(['\"]?([^'\")]+)", style):
                 full = urljoin(self.DOMAIN, image_url)
                 if "flude-logo-large-background.jpg" in full:
@@ -196,20 +195,14 @@ class FludePropertyConsultantsScraper:
                 property_images.append(urljoin(self.DOMAIN, fallback_image))
 
         brochure_urls = []
-        for href in tree.xpath("//a[contains(@href,'ViewFile') or contains(translate(@href,'PDF','pdf'),'.pdf')]/@href"):
+        for href in fields["brochures"]:
             full = urljoin(self.DOMAIN, href)
             if full not in brochure_urls:
                 brochure_urls.append(full)
 
-        agent_name = self._clean(" ".join(
-            tree.xpath("(//div[contains(@class,'property-agent')]//p[contains(@class,'property-agent-name')]//text())[1]")
-        ))
-        agent_phone = self._clean("".join(
-            tree.xpath("(//div[contains(@class,'property-agent')]//a[contains(@class,'property-agent-tel')]/@href)[1]")
-        )).replace("tel:", "", 1)
-        agent_email = self._clean("".join(
-            tree.xpath("(//div[contains(@class,'property-agent')]//a[contains(@class,'property-agent-email')]/@href)[1]")
-        )).replace("mailto:", "", 1)
+        agent_name = self._clean(" ".join(fields["agent_name"]))
+        agent_phone = self._clean("".join(fields["agent_phone"])).replace("tel:", "", 1)
+        agent_email = self._clean("".join(fields["agent_email"])).replace("mailto:", "", 1)
 
         obj = {
             "listingUrl": url,
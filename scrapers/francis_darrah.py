@@ -2,40 +2,30 @@ import re
 from urllib.parse import urljoin
 
 from lxml import html
-import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from utils import http_client
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class FrancisDarrahScraper:
     BASE_URL = "https://www.francisdarrah.co.uk/available-properties/"
     DOMAIN = "https://www.francisdarrah.co.uk"
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+        )
+    }
 
     def __init__(self):
         self.results = []
         self.seen_urls = set()
         self.visited_pages = set()
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
-            )
-        })
-
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
 
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
 
     def run(self):
@@ -99,12 +89,11 @@ class FrancisDarrahScraper:
 
             page += 1
 
-        self.driver.quit()
-        self.session.close()
+        release_driver(self.driver)
         return self.results
 
     def parse_listing(self, url, list_status_text=""):
-        resp = self.session.get(url, timeout=20)
+        resp = http_client.get(url, headers=self.HEADERS, timeout=20)
         if resp.status_code != 200:
             return None
         tree = html.fromstring(resp.text)
@@ -1,26 +1,24 @@
 import re
 from urllib.parse import urljoin, urlparse, urlunparse
 
-import requests
 from lxml import html
 
+from utils import http_client
+
 
 class FrazerKiddPartnersScraper:
     BASE_URL = "https://www.frazerkidd.co.uk/Property?Term=&PropertyTypeID=0&search=SEARCH&AreaID=0&Price=999999999"
     DOMAIN = "https://www.frazerkidd.co.uk"
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+        )
+    }
 
     def __init__(self):
         self.results = []
         self.seen_urls = set()
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-                )
-            }
-        )
 
     # ===================== RUN ===================== #
 
@@ -256,7 +254,7 @@ class FrazerKiddPartnersScraper:
 
     def get_tree(self, url):
         try:
-            response = self.session.get(url, timeout=30)
+            response = http_client.get(url, headers=self.HEADERS, timeout=30)
             response.raise_for_status()
             return html.fromstring(response.text)
         except Exception:
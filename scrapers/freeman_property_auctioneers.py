@@ -1,16 +1,15 @@
 import re
-import time
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils import waits
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class FreemanPropertyAuctioneersScraper:
     BASE_URL = "https://www.freemanforman.co.uk/properties/sales/most-recent-first/"
@@ -20,23 +19,15 @@ class FreemanPropertyAuctioneersScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/122.0.0.0 Safari/537.36"
+        self.driver = get_driver(
+            extra_args=[
+                "--disable-blink-features=AutomationControlled",
+                "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/122.0.0.0 Safari/537.36",
+            ],
+            experimental={"excludeSwitches": ["enable-automation"], "useAutomationExtension": False},
         )
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.driver.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
             {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"}
@@ -65,7 +56,7 @@ class FreemanPropertyAuctioneersScraper:
             except Exception:
                 break
 
-            time.sleep(2)
+            waits.dom_stable(self.driver, replaces=2)
 
             tree = html.fromstring(self.driver.page_source)
 
@@ -108,7 +99,7 @@ class FreemanPropertyAuctioneersScraper:
 
             page += 1
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
@@ -125,7 +116,7 @@ class FreemanPropertyAuctioneersScraper:
         except Exception:
             pass
 
-        time.sleep(2)
+        waits.dom_stable(self.driver, replaces=2)
         tree = html.fromstring(self.driver.page_source)
 
         # ---------- ADDRESS ---------- #
@@ -1,8 +1,9 @@
 import re
-import requests
 from urllib.parse import urljoin
 from lxml import html
 
+from utils import http_client
+
 
 class GVAScraper:
     API_URL = "https://pse-api.sharplaunch.com/data"
@@ -32,16 +33,13 @@ class GVAScraper:
             "status": "active,escrow",
         }
 
-        resp = requests.get(self.API_URL, headers=headers, params=params, timeout=30)
+        resp = http_client.get(self.API_URL, headers=headers, params=params, timeout=30)
         resp.raise_for_status()
 
         data = resp.json()
 
-        for item in data.get("items", []):
-            try:
-                self.results.append(self.parse_item(item))
-            except Exception:
-                continue
+        # Every item fetches its listing page for brochure, agent and images
+        self.results.extend(http_client.map_details(self.parse_item, data.get("items", [])))
 
         return self.results
 
@@ -278,7 +276,7 @@ class GVAScraper:
                 )
             }
 
-            resp = requests.get(listing_url, headers=headers, timeout=30)
+            resp = http_client.get(listing_url, headers=headers, timeout=30)
             if resp.status_code != 200:
                 return None
 
@@ -1,7 +1,6 @@
-import requests
 import re
 from lxml import html
-from utils import store_data_to_csv
+from utils import http_client, store_data_to_csv
 
 class GlanmorPropertyScraper:
     BASE_SEARCH = "https://glanmorproperty.co.uk/search-results/"
@@ -24,7 +23,7 @@ class GlanmorPropertyScraper:
 
             url = self._build_page_url(page)
 
-            resp = requests.get(url, headers=self.HEADERS, timeout=30)
+            resp = http_client.get(url, headers=self.HEADERS, timeout=30)
             if resp.status_code != 200:
                 break
 
@@ -36,11 +35,7 @@ class GlanmorPropertyScraper:
             if not listing_urls:
                 break
 
-            for link in listing_urls:
-                try:
-                    self.results.append(self.parse_listing(link))
-                except Exception:
-                    continue
+            self.results.extend(http_client.map_details(self.parse_listing, listing_urls))
 
             page += 1
         return self.results
@@ -51,7 +46,7 @@ class GlanmorPropertyScraper:
         return f"{self.BASE_SEARCH}page/{page}/"
 
     def parse_listing(self, url):
-        resp = requests.get(url, headers=self.HEADERS, timeout=30)
+        resp = http_client.get(url, headers=self.HEADERS, timeout=30)
         tree = html.fromstring(resp.text)
 
         size_ft, size_ac = self.extract_size(tree)
@@ -1,7 +1,6 @@
-import requests
 import re
 from lxml import html
-from utils import store_data_to_csv
+from utils import http_client, store_data_to_csv
 
 
 class GlinsmanWellerScraper:
@@ -26,7 +25,7 @@ class GlinsmanWellerScraper:
         while True:
             url = self._build_page_url(page)
 
-            resp = requests.get(url, headers=self.HEADERS, timeout=30)
+            resp = http_client.get(url, headers=self.HEADERS, timeout=30)
             if resp.status_code != 200:
                 break
 
@@ -40,12 +39,7 @@ class GlinsmanWellerScraper:
             if not listing_urls:
                 break
 
-            for link in listing_urls:
-                try:
-                    self.results.append(self.parse_listing(link))
-
-                except Exception:
-                    continue
+            self.results.extend(http_client.map_details(self.parse_listing, listing_urls))
             break
 
         return self.results
@@ -57,7 +51,7 @@ class GlinsmanWellerScraper:
     # ---------------- LISTING ---------------- #
 
     def parse_listing(self, url):
-        resp = requests.get(url, headers=self.HEADERS, timeout=30)
+        resp = http_client.get(url, headers=self.HEADERS, timeout=30)
         tree = html.fromstring(resp.text)
 
         description = self.get_description(tree)
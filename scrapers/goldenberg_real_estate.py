@@ -1,7 +1,8 @@
-import requests
 import re
 from lxml import html
 
+from utils import http_client
+
 
 class GoldenbergRealEstateScraper:
     BASE_URL = "https://www.goldenberg.co.uk/"
@@ -20,7 +21,7 @@ class GoldenbergRealEstateScraper:
     # ---------------- RUN ---------------- #
 
     def run(self):
-        resp = requests.get(self.BASE_URL, headers=self.HEADERS, timeout=30)
+        resp = http_client.get(self.BASE_URL, headers=self.HEADERS, timeout=30)
         if resp.status_code != 200:
             return []
 
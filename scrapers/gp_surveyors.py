@@ -1,7 +1,8 @@
-import requests
 import re
 from lxml import html
 
+from utils import http_client
+
 
 class GpSurveyorsScraper:
     BASE_URL = "https://www.gpsurveyors.co.uk/properties/gp-properties-for-sale/"
@@ -20,7 +21,7 @@ class GpSurveyorsScraper:
     # ---------------- RUN ---------------- #
 
     def run(self):
-        resp = requests.get(self.BASE_URL, headers=self.HEADERS, timeout=30)
+        resp = http_client.get(self.BASE_URL, headers=self.HEADERS, timeout=30)
         if resp.status_code != 200:
             return []
 
@@ -30,18 +31,14 @@ class GpSurveyorsScraper:
             "//div[contains(@class,'blog-shortcode')]//article//h2/a/@href"
         )
 
-        for url in listing_urls:
-            try:
-                self.results.append(self.parse_listing(url))
-            except Exception:
-                continue
+        self.results.extend(http_client.map_details(self.parse_listing, listing_urls))
 
         return self.results
 
     # ---------------- LISTING ---------------- #
 
     def parse_listing(self, url):
-        resp = requests.get(url, headers=self.HEADERS, timeout=30)
+        resp = http_client.get(url, headers=self.HEADERS, timeout=30)
         tree = html.fromstring(resp.text)
 
         description = self.get_description(tree)
@@ -1,8 +1,9 @@
-import requests
 from lxml import html
 import re
 from urllib.parse import urljoin
 
+from utils import http_client
+
 
 class GregoryMoorePropertyScraper:
     BASE_URL = "https://www.gregorymooreproperty.co.uk/new-instructions/"
@@ -21,7 +22,7 @@ class GregoryMoorePropertyScraper:
     # ---------------- RUN ---------------- #
 
     def run(self):
-        resp = requests.get(self.BASE_URL, headers=self.HEADERS, timeout=30)
+        resp = http_client.get(self.BASE_URL, headers=self.HEADERS, timeout=30)
         if resp.status_code != 200:
             return []
 
@@ -1,15 +1,14 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class GryphonPropertyPartnersScraper:
     BASE_URL = "https://www.gryphonpropertypartners.com/Properties.html"
@@ -18,23 +17,7 @@ class GryphonPropertyPartnersScraper:
     def __init__(self):
         self.results = []
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-software-rasterizer")
-        chrome_options.add_argument("--remote-debugging-port=9222")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-
-        self.driver = webdriver.Chrome(
-            service=service,
-            options=chrome_options
-        )
+        self.driver = get_driver(extra_args=["--disable-gpu", "--disable-software-rasterizer"])
 
         self.wait = WebDriverWait(self.driver, 20)
 
@@ -60,7 +43,7 @@ class GryphonPropertyPartnersScraper:
             except Exception:
                 continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ---------------- LISTING ---------------- #
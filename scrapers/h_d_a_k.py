@@ -1,15 +1,14 @@
 import re
 from urllib.parse import urljoin, urlparse, urlunparse
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class HDAKScraper:
     DOMAIN = "https://www.hdak.co.uk"
@@ -25,22 +24,15 @@ class HDAKScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        # ⚡ PERFORMANCE
-        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-        chrome_options.add_argument("--disable-animations")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-software-rasterizer")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver(
+            # ⚡ PERFORMANCE
+            extra_args=[
+                "--blink-settings=imagesEnabled=false",
+                "--disable-animations",
+                "--disable-gpu",
+                "--disable-software-rasterizer",
+            ],
+        )
         self.wait = WebDriverWait(self.driver, 5)
 
     # ===================== RUN ===================== #
@@ -86,7 +78,7 @@ class HDAKScraper:
 
                 page += 1
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ===================== PAGINATION ===================== #
@@ -1,15 +1,14 @@
 from urllib.parse import urljoin
-import time
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils import waits
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class HantsRealtyScraper:
     BASE_URL = "https://www.hantsrealty.co.uk/"
@@ -18,16 +17,7 @@ class HantsRealtyScraper:
     def __init__(self):
         self.results = []
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 30)
 
     # -------------------------------------------------
@@ -63,7 +53,7 @@ class HantsRealtyScraper:
                 )))
 
                 # Let animation settle
-                time.sleep(0.5)
+                waits.dom_stable(self.driver, quiet=0.3, timeout=3, replaces=0.5)
 
                 tree = html.fromstring(self.driver.page_source)
                 obj = self.parse_modal(tree, post_id)
@@ -77,12 +67,12 @@ class HantsRealtyScraper:
                 """)
 
                 # Allow close animation + layout reset
-                time.sleep(0.5)
+                waits.dom_stable(self.driver, quiet=0.3, timeout=3, replaces=0.5)
 
             except Exception:
                 continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # -------------------------------------------------
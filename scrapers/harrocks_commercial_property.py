@@ -1,8 +1,9 @@
 import re
-import requests
 from urllib.parse import urljoin
 from lxml import html
 
+from utils import http_client
+
 
 class HarrocksCommercialPropertyScraper:
     BASE_URL = "https://harrocks.co.uk/properties/"
@@ -24,7 +25,7 @@ class HarrocksCommercialPropertyScraper:
     # -------------------------------------------------
 
     def run(self):
-        resp = requests.get(self.BASE_URL, headers=self.HEADERS, timeout=30)
+        resp = http_client.get(self.BASE_URL, headers=self.HEADERS, timeout=30)
         resp.raise_for_status()
 
         tree = html.fromstring(resp.text)
@@ -42,12 +43,10 @@ class HarrocksCommercialPropertyScraper:
             "//div[contains(@class,'et_pb_image_container')]//img/@src"
         )
 
-        for url, img in zip(listing_urls, listing_images):
-            try:
-                data = self.parse_listing(urljoin(self.DOMAIN, url), img)
-                self.results.append(data)
-            except Exception:
-                continue
+        self.results.extend(http_client.map_details(
+            lambda pair: self.parse_listing(urljoin(self.DOMAIN, pair[0]), pair[1]),
+            zip(listing_urls, listing_images),
+        ))
 
         return self.results
 
@@ -56,7 +55,7 @@ class HarrocksCommercialPropertyScraper:
     # -------------------------------------------------
 
     def parse_listing(self, url, image_url):
-        resp = requests.get(url, headers=self.HEADERS, timeout=30)
+        resp = http_client.get(url, headers=self.HEADERS, timeout=30)
         resp.raise_for_status()
 
         tree = html.fromstring(resp.text)
@@ -1,15 +1,14 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class HebCharteredSurveyorsScraper:
     BASE_URLS = {
@@ -23,16 +22,7 @@ class HebCharteredSurveyorsScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver(extra_args=["--blink-settings=imagesEnabled=false"])
         self.wait = WebDriverWait(self.driver, 20)
 
     # ============================================================
@@ -89,7 +79,7 @@ class HebCharteredSurveyorsScraper:
                     except Exception:
                         continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ============================================================
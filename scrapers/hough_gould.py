@@ -1,16 +1,15 @@
 import re
-import requests
 from urllib.parse import urljoin
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils import http_client
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class HoughGouldScraper:
 
@@ -22,16 +21,7 @@ class HoughGouldScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver(extra_args=["--blink-settings=imagesEnabled=false"])
         self.wait = WebDriverWait(self.driver, 30)
 
     # ======================================================
@@ -58,7 +48,7 @@ class HoughGouldScraper:
                 self.seen_urls.add(data["listingUrl"])
                 self.results.append(data)
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ======================================================
@@ -147,7 +137,7 @@ class HoughGouldScraper:
         HEADERS = {"User-Agent": "Mozilla/5.0"}
 
         try:
-            r = requests.get(download_page_url, headers=HEADERS, timeout=30)
+            r = http_client.get(download_page_url, headers=HEADERS, timeout=30)
             r.raise_for_status()
         except:
             return []
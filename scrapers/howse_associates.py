@@ -1,15 +1,14 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class HowseAssociatesScraper:
     BASE_URL = "https://www.howseassociates.co.uk/"
@@ -20,16 +19,7 @@ class HowseAssociatesScraper:
         self.results = []
         self.seen_titles = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver(extra_args=["--blink-settings=imagesEnabled=false"])
         self.wait = WebDriverWait(self.driver, 10)
 
     # ======================================================
@@ -44,7 +34,7 @@ class HowseAssociatesScraper:
                 (By.XPATH, "//span[@class='BSBTitle']")
             ))
         except Exception:
-            self.driver.quit()
+            release_driver(self.driver)
             return self.results
 
         while True:
@@ -95,7 +85,7 @@ class HowseAssociatesScraper:
             if new_title in self.seen_titles:
                 break
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
 
@@ -1,15 +1,15 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils import waits
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class InglebyTriceScraper:
     BASE_URLS = [
@@ -23,16 +23,7 @@ class InglebyTriceScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver(extra_args=["--blink-settings=imagesEnabled=false"])
         self.wait = WebDriverWait(self.driver, 20)
 
     # ===================== RUN ===================== #
@@ -47,8 +38,6 @@ class InglebyTriceScraper:
                 "//div[contains(@class,'product-listing-box')]"
             )))
 
-            import time
-
             while True:
                 cards_before = self.driver.find_elements(
                     By.XPATH,
@@ -81,7 +70,7 @@ class InglebyTriceScraper:
                 except:
                     break
 
-                time.sleep(1)
+                waits.dom_stable(self.driver, replaces=1)
 
             # ---------- Parse Cards ---------- #
             tree = html.fromstring(self.driver.page_source)
@@ -118,7 +107,7 @@ class InglebyTriceScraper:
                 except Exception:
                     continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
 
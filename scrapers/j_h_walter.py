@@ -2,15 +2,15 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.detail_fetcher import DetailFetcher
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class JHWalterScraper:
 
@@ -30,17 +30,15 @@ class JHWalterScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver_options = {"extra_args": ["--blink-settings=imagesEnabled=false"]}
+        self.driver = get_driver(**driver_options)
         self.wait = WebDriverWait(self.driver, 20)
+        detail_card = "//div[contains(@class,'card--property--view')]"
+        self.details = DetailFetcher(
+            wait_for=(By.XPATH, detail_card),
+            driver_options=driver_options,
+            required_xpaths=[detail_card],
+        )
 
     # ===================== RUN ===================== #
 
@@ -73,6 +71,7 @@ class JHWalterScraper:
                     break
 
                 new_links_found = False
+                new_urls = []
 
                 for href in listing_urls:
                     url = urljoin(self.DOMAIN, href)
@@ -82,9 +81,13 @@ class JHWalterScraper:
 
                     new_links_found = True
                     self.seen_urls.add(url)
+                    new_urls.append(url)
 
+                for url, tree in self.details.fetch(new_urls):
+                    if tree is None:
+                        continue
                     try:
-                        obj = self.parse_listing(url)
+                        obj = self.parse_listing(url, tree)
                         if obj:
                             self.results.append(obj)
                     except Exception:
@@ -96,21 +99,13 @@ class JHWalterScraper:
 
                 page += 1
 
-        self.driver.quit()
+        self.details.close()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
 
-    def parse_listing(self, url):
-
-        self.driver.get(url)
-
-        self.wait.until(EC.presence_of_element_located((
-            By.XPATH,
-            "//div[contains(@class,'card--property--view')]"
-        )))
-
-        tree = html.fromstring(self.driver.page_source)
+    def parse_listing(self, url, tree):
 
         display_address = self._clean(" ".join(
             tree.xpath("//div[contains(@class,'cp-loc')]//text()")
@@ -1,38 +1,28 @@
 import re
-import time
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils import waits
+from utils.network_capture import ResponseCapture, find_number, find_strings
+from utils.scroll_stream import stream_cards
+from utils.webdriver_pool import get_driver, release_driver
+
 
 # ══════════════════════════════════════════════════════════════
 #  SHARED CHROME FACTORY
 # ══════════════════════════════════════════════════════════════
 
-def _make_driver():
-    chrome_options = Options()
-    # chrome_options.binary_location = "/usr/bin/chromium-browser"   # Linux
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument(
+def _make_driver(performance_log=False):
+    driver = get_driver(extra_args=[
         "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/124.0.0.0 Safari/537.36"
-    )
-    # service = Service("/usr/bin/chromedriver")                       # Linux
-    service = Service(
-        "C:/Users/educa/Downloads/ScrapyProject/ScrapyProject/chromedriver.exe"
-    )
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    ], performance_log=performance_log)
     return driver, WebDriverWait(driver, 25)
 
 
@@ -329,7 +319,7 @@ class JLLCommercialScraper(_Helpers):
                 break
             page += 1
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     def _parse_listing(self, url):
@@ -449,51 +439,35 @@ class JLLInvestScraper(_Helpers):
     - Search page uses infinite scroll (no ?page= param)
     - Listing cards render as <a href="/uk/en/listing/...">
     - Individual listing pages also require JS rendering
+    - Search results arrive as JSON over XHR; listing URLs are read from
+      those responses, with the rendered cards as a fallback
     """
     SEARCH_URL = "https://invest.jll.com/uk/en/property-search"
     DOMAIN     = "https://invest.jll.com"
 
+    # Property-search JSON on invest.jll.com (search API or the app's page
+    # data for the search route) searched for listing links, and the keys
+    # that may hold the total number of results in that same payload
+    API_PATTERN  = r"^https://invest\.jll\.com/[^?#]*(?:property-search|/search|/listings)"
+    LISTING_PATH = r"^(?:https?://[^/]*invest\.jll\.com)?/[^\s]*/listing/"
+    TOTAL_KEYS   = ("total", "totalCount", "totalResults", "totalHits", "resultCount")
+
     def __init__(self):
         self.results   = []
         self.seen_urls = set()
-        self.driver, self.wait = _make_driver()
+        self.driver, self.wait = _make_driver(performance_log=True)
 
     def run(self):
+        capture = ResponseCapture(self.driver, self.API_PATTERN)
         self.driver.get(self.SEARCH_URL)
 
-        # Wait for at least one listing card link
-        try:
-            self.wait.until(EC.presence_of_element_located((
-                By.XPATH, "//a[contains(@href,'/listing/')]"
-            )))
-        except Exception:
-            self.driver.quit()
+        listing_urls = self._listing_urls_from_api(capture)
+        if listing_urls is None:
+            listing_urls = self._listing_urls_from_dom()
+        if not listing_urls:
+            release_driver(self.driver)
             return self.results
 
-        # Infinite scroll: keep scrolling until no new cards appear for 3 rounds
-        stable_rounds = 0
-        last_count    = 0
-        while stable_rounds < 3:
-            self.driver.execute_script(
-                "window.scrollTo(0, document.body.scrollHeight);"
-            )
-            time.sleep(2.5)
-            tree  = html.fromstring(self.driver.page_source)
-            hrefs = tree.xpath("//a[contains(@href,'/listing/')]/@href")
-            count = len(set(hrefs))
-            if count == last_count:
-                stable_rounds += 1
-            else:
-                stable_rounds = 0
-            last_count = count
-
-        # Collect final set of listing URLs
-        tree = html.fromstring(self.driver.page_source)
-        listing_urls = list(dict.fromkeys(
-            urljoin(self.DOMAIN, h)
-            for h in tree.xpath("//a[contains(@href,'/listing/')]/@href")
-        ))
-
         for url in listing_urls:
             if url in self.seen_urls:
                 continue
@@ -506,9 +480,65 @@ class JLLInvestScraper(_Helpers):
                             return self.results
             except Exception:
                 pass
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
+    def _listing_urls_from_api(self, capture):
+        """
+        Listing URLs from the search API responses, or None if the page
+        loaded none or stopped short of the API's total (the rendered
+        cards are read instead then). Scrolls only while new results keep
+        arriving and the total (when it gives one) is not reached.
+        """
+        listing_urls   = []
+        total          = 0
+        stalled_rounds = 0
+        while stalled_rounds < 2:
+            waits.network_idle(self.driver, quiet=1.0, timeout=20)
+            found = 0
+            for _, payload in capture.poll():
+                hrefs = find_strings(payload, self.LISTING_PATH)
+                if not hrefs:
+                    continue
+                # Only a payload that carries results can tell their total
+                total = max(total, find_number(payload, self.TOTAL_KEYS))
+                for href in hrefs:
+                    url = urljoin(self.DOMAIN, href)
+                    if url not in listing_urls:
+                        listing_urls.append(url)
+                        found += 1
+
+            if not listing_urls:
+                return None
+            if total and len(listing_urls) >= total:
+                break
+            stalled_rounds = 0 if found else stalled_rounds + 1
+
+            # Next page of results: the app requests it on scroll
+            self.driver.execute_script(
+                "window.scrollTo(0, document.body.scrollHeight);"
+            )
+        if total and len(listing_urls) < total:
+            return None
+        return listing_urls
+
+    def _listing_urls_from_dom(self):
+        # Wait for at least one listing card link
+        try:
+            self.wait.until(EC.presence_of_element_located((
+                By.XPATH, "//a[contains(@href,'/listing/')]"
+            )))
+        except Exception:
+            return []
+
+        # Infinite scroll: cards are reported as they are added, until
+        # scrolling stops bringing new ones
+        return list(dict.fromkeys(
+            urljoin(self.DOMAIN, card.get("href"))
+            for card in stream_cards(self.driver, "a[href*='/listing/']", stall_rounds=3)
+            if card.get("href")
+        ))
+
     def _parse_listing(self, url):
         self.driver.get(url)
 
@@ -520,7 +550,7 @@ class JLLInvestScraper(_Helpers):
             )))
         except Exception:
             pass
-        time.sleep(1.5)  # allow React to finish rendering
+        waits.dom_stable(self.driver, replaces=1.5)  # allow React to finish rendering
 
         tree = html.fromstring(self.driver.page_source)
 
@@ -689,7 +719,7 @@ class JLLResidentialScraper(_Helpers):
                 break
             page += 1
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     def _parse_listing(self, url):
@@ -707,7 +737,7 @@ class JLLResidentialScraper(_Helpers):
             )))
         except Exception:
             # Page may still be partially loaded — give it a moment
-            time.sleep(3)
+            waits.network_idle(self.driver, timeout=5, replaces=3)
 
         tree = html.fromstring(self.driver.page_source)
 
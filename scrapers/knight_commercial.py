@@ -5,14 +5,11 @@ This scraper extracts property listings from Knight Commercial London website
 across all property types (To Let, For Sale, Investment).
 """
 import os
-import time
 import re
 import logging
-import shutil
 from typing import List, Dict, Optional
-from selenium import webdriver
 
-from utils import store_data_to_csv
+from utils import store_data_to_csv, waits
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
@@ -21,9 +18,9 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException
 )
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+
+from utils.rate_limit import ERROR, THROTTLED, get_limiter, is_challenge_page
+from utils.webdriver_pool import get_driver, release_driver
 
 # ============================================================
 # CONFIGURATION - All settings embedded in scraper
@@ -33,7 +30,7 @@ DROPDOWN_OPTIONS = ["To Let", "For Sale", "Investment"]
 CSV_FILENAME = "data/data.csv"
 SCROLL_PAUSE_TIME = 5
 MAX_SCROLL_ATTEMPTS = 8  # More attempts to ensure all properties load
-REQUEST_DELAY = 2
+PROPERTY_LINKS = (By.CSS_SELECTOR, "a[href*='/listing/']")
 PAGE_LOAD_TIMEOUT = 30
 HEADLESS_MODE = True
 WINDOW_SIZE = "1920,1080"
@@ -73,114 +70,27 @@ class KnightCommercialScraper:
         self.properties_data = []  # Collect all property data to save at the end
         
     def setup_driver(self):
-        """Set up and configure the Selenium WebDriver."""
+        """Get a Chrome WebDriver from the shared pool."""
         self.logger.info("Setting up Chrome WebDriver...")
-        
-        chrome_options = Options()
-        
-        if HEADLESS_MODE:
-            chrome_options.add_argument('--headless=new')
-        
-        chrome_options.add_argument(f'--window-size={WINDOW_SIZE}')
-        chrome_options.add_argument(f'user-agent={USER_AGENT}')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--disable-gpu')
-        
-        # For WSL environments, try chromium-browser first
-        import shutil
-        import subprocess
-        chromium_path = shutil.which('chromium-browser')
-        chrome_path = shutil.which('google-chrome')
-        
-        if chromium_path:
-            chrome_options.binary_location = chromium_path
-            self.logger.info(f"Using chromium-browser at: {chromium_path}")
-        elif chrome_path:
-            chrome_options.binary_location = chrome_path
-            self.logger.info(f"Using google-chrome at: {chrome_path}")
-        else:
-            error_msg = """
-            Chrome/Chromium browser not found!
-            
-            Please install Chrome or Chromium:
-            
-            For Ubuntu/WSL:
-              sudo apt-get update
-              sudo apt-get install -y chromium-browser
-            
-            Or install Google Chrome:
-              wget https://dl.google.com/linux/direct/google-chrome-stable_current_amd64.deb
-              sudo apt install ./google-chrome-stable_current_amd64.deb
-            """
-            self.logger.error(error_msg)
-            raise RuntimeError(error_msg)
-        
-        try:
-            # For snap-installed chromium, we need to use a specific driver version
-            # Instead of auto-detecting, use a compatible ChromeDriver version
-            try:
-                # Try to get browser version
-                if chromium_path:
-                    result = subprocess.run(
-                        [chromium_path, '--version'], 
-                        capture_output=True, 
-                        text=True, 
-                        timeout=5
-                    )
-                    browser_version = result.stdout.strip()
-                    self.logger.info(f"Browser version: {browser_version}")
-            except Exception as e:
-                self.logger.warning(f"Could not detect browser version: {e}")
-            
-            # Use ChromeDriverManager with specific version for better compatibility
-            from webdriver_manager.chrome import ChromeDriverManager
-            from webdriver_manager.core.os_manager import ChromeType
-            
-            # For chromium, specify the chrome type
-            if chromium_path:
-                self.logger.info("Installing ChromeDriver for Chromium...")
-                driver_manager = ChromeDriverManager(chrome_type=ChromeType.CHROMIUM)
-            else:
-                self.logger.info("Installing ChromeDriver for Google Chrome...")
-                driver_manager = ChromeDriverManager()
-            
-            service = Service(driver_manager.install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-            
-            self.logger.info("WebDriver setup complete")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize WebDriver: {e}")
-            
-            # Fallback: try using system ChromeDriver if available
-            chromedriver_path = shutil.which('chromedriver')
-            if chromedriver_path:
-                self.logger.info(f"Trying system chromedriver at: {chromedriver_path}")
-                try:
-                    service = Service(chromedriver_path)
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                    self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-                    self.logger.info("WebDriver setup complete using system chromedriver")
-                    return
-                except Exception as e2:
-                    self.logger.error(f"System chromedriver also failed: {e2}")
-            
-            raise RuntimeError(f"""
-            Failed to set up ChromeDriver. 
-            
-            Try installing chromium-chromedriver:
-              sudo apt-get install -y chromium-chromedriver
-            
-            Original error: {e}
-            """)
+
+        self.driver = get_driver(
+            extra_args=[
+                f'user-agent={USER_AGENT}',
+                '--disable-blink-features=AutomationControlled',
+                '--disable-gpu',
+            ],
+            headless=HEADLESS_MODE,
+            recycle=True,
+        )
+        self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+
+        self.logger.info("WebDriver setup complete")
     
     def navigate_to_homepage(self):
         """Navigate to the Knight Commercial homepage."""
         self.logger.info(f"Navigating to {BASE_URL}")
         self.driver.get(BASE_URL)
-        time.sleep(3)  # Wait for page to load
+        waits.network_idle(self.driver, replaces=3)
     
     def navigate_to_property_type(self, property_type: str) -> str:
         """
@@ -224,24 +134,26 @@ class KnightCommercialScraper:
             
             # Wait up to 15 seconds for property links to appear
             WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/listing/']"))
+                EC.presence_of_element_located(PROPERTY_LINKS)
             )
             self.logger.info("Property links detected, page loaded successfully")
         except Exception as e:
             self.logger.warning(f"Timeout waiting for property links: {e}")
             # Try scrolling down to trigger lazy load
             self.driver.execute_script("window.scrollTo(0, 500);")
-            time.sleep(3)
+            waits.load_more_finished(self.driver, PROPERTY_LINKS, 0, replaces=3)
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
+            waits.dom_stable(self.driver, replaces=3)
         
-        time.sleep(2)  # Additional wait for all properties to render
+        # Wait for all properties to render
+        waits.dom_stable(self.driver, replaces=2)
         
         # For Investment page, refresh to ensure properties load correctly
         if property_type == "Investment":
             self.logger.info("Refreshing Investment page to ensure properties load...")
             self.driver.refresh()
-            time.sleep(5)
+            waits.count_increased(self.driver, PROPERTY_LINKS, 0, timeout=15, replaces=5)
+            waits.dom_stable(self.driver)
         
         return sale_type_map.get(property_type, "To Let")
     
@@ -273,16 +185,20 @@ class KnightCommercialScraper:
                 no_change_count = 0
                 self.logger.info(f"Found {after_count - before_count} new properties (total: {after_count})")
             
-            # Scroll to bottom with smooth scrolling for lazy load
+            # Scroll to bottom and wait for the lazy loader to finish
+            loaded = len(self.driver.find_elements(*PROPERTY_LINKS))
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             scroll_count += 1
-            time.sleep(6)  # Increased wait time for lazy loading
+            count = waits.load_more_finished(
+                self.driver, PROPERTY_LINKS, loaded, timeout=SCROLL_PAUSE_TIME * 2, replaces=12
+            )
             
-            # Scroll up slightly then back down to trigger any lazy loaders
-            self.driver.execute_script("window.scrollBy(0, -800);")
-            time.sleep(2)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(4)
+            if count <= loaded:
+                # Scroll up slightly then back down to trigger any lazy loaders
+                self.driver.execute_script("window.scrollBy(0, -800);")
+                waits.dom_stable(self.driver, quiet=0.3, timeout=2)
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                waits.load_more_finished(self.driver, PROPERTY_LINKS, loaded, timeout=SCROLL_PAUSE_TIME)
         
         self.logger.info(f"Scroll complete. Total properties found: {len(property_urls)} (after {scroll_count} scrolls)")
         return list(property_urls)
@@ -330,7 +246,7 @@ class KnightCommercialScraper:
         
         try:
             self.driver.get(url)
-            time.sleep(2)  # Wait for page load
+            waits.dom_stable(self.driver, replaces=2)
             
             data = {
                 'listingUrl': url,
@@ -361,6 +277,13 @@ class KnightCommercialScraper:
             self.logger.error(f"Error extracting property details from {url}: {e}")
             return None
     
+    def _on_challenge_page(self) -> bool:
+        """True if the browser is showing a bot-protection page."""
+        try:
+            return is_challenge_page(self.driver.page_source)
+        except Exception:
+            return False
+    
     def _safe_find_text(self, selectors: List[str], default: str = "") -> str:
         """
         Safely find and extract text from elements using multiple selectors.
@@ -590,14 +513,14 @@ class KnightCommercialScraper:
             
             # Scroll the button into view to avoid click interception
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", brochure_button)
-            time.sleep(1)
             
             # Store current window handle
             original_window = self.driver.current_window_handle
+            known_windows = self.driver.window_handles
             
             # Use JavaScript click to avoid interception issues
             self.driver.execute_script("arguments[0].click();", brochure_button)
-            time.sleep(2)  # Wait for new tab to open
+            waits.new_window(self.driver, known_windows, replaces=3)
             
             # Get all window handles
             all_windows = self.driver.window_handles
@@ -608,7 +531,11 @@ class KnightCommercialScraper:
                     self.driver.switch_to.window(window)
                     break
             
-            # Get the URL from the new tab
+            # Get the URL from the new tab once it has started navigating
+            try:
+                WebDriverWait(self.driver, 10).until(lambda d: d.current_url != "about:blank")
+            except TimeoutException:
+                pass
             brochure_url = self.driver.current_url
             
             # Close the new tab
@@ -731,14 +658,15 @@ class KnightCommercialScraper:
                 for idx, url in enumerate(property_urls, 1):
                     self.logger.info(f"Processing property {idx}/{len(property_urls)}")
                     
-                    data = self.extract_property_details(url, sale_type)
+                    # Paced per domain instead of a fixed delay
+                    with get_limiter().request(url) as ticket:
+                        data = self.extract_property_details(url, sale_type)
+                        if not data:
+                            ticket.outcome = THROTTLED if self._on_challenge_page() else ERROR
                     
                     if data:
                         self.properties_data.append(data)
                         self.properties_scraped += 1
-                    
-                    # Delay between requests
-                    time.sleep(REQUEST_DELAY)
                 
                 self.logger.info(f"Completed {option}: {len(property_urls)} properties processed")
             
@@ -761,8 +689,8 @@ class KnightCommercialScraper:
         
         finally:
             if self.driver:
-                self.driver.quit()
-                self.logger.info("WebDriver closed")
+                release_driver(self.driver)
+                self.logger.info("WebDriver released")
 
 
 if __name__ == "__main__":
@@ -1,15 +1,15 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.detail_fetcher import DetailFetcher
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class LisneyScraper:
 
@@ -27,16 +27,9 @@ class LisneyScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
+        self.details = DetailFetcher(wait_for=(By.TAG_NAME, "body"))
 
     # ===================== RUN ===================== #
 
@@ -70,6 +63,7 @@ class LisneyScraper:
                     break
 
                 new_items_found = False
+                new_listings = {}
 
                 for card in cards:
 
@@ -89,9 +83,13 @@ class LisneyScraper:
 
                     new_items_found = True
                     self.seen_urls.add(url)
+                    new_listings[url] = display_address
 
+                for url, tree in self.details.fetch(new_listings):
+                    if tree is None:
+                        continue
                     try:
-                        obj = self.parse_listing(url, display_address)
+                        obj = self.parse_listing(url, tree, new_listings[url])
                         if obj:
                             self.results.append(obj)
                     except Exception:
@@ -102,21 +100,13 @@ class LisneyScraper:
 
                 page += 1
 
-        self.driver.quit()
+        self.details.close()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
 
-    def parse_listing(self, url, display_address):
-
-        self.driver.get(url)
-
-        try:
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        except Exception:
-            return None
-
-        tree = html.fromstring(self.driver.page_source)
+    def parse_listing(self, url, tree, display_address):
 
         # -------- DESCRIPTION (FEATURES TAB ONLY) -------- #
 
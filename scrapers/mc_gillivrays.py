@@ -1,8 +1,9 @@
 import re
-import requests
 from urllib.parse import urljoin
 from lxml import html
 
+from utils import http_client
+
 
 class McGillivraysScraper:
     BASE_URL = "https://www.mcgillivrays.com/properties.aspx"
@@ -25,14 +26,13 @@ class McGillivraysScraper:
 
     def __init__(self):
         self.results = []
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
 
     # ===================== RUN ===================== #
 
     def run(self):
-        # Step 1: GET the page to retrieve a fresh __VIEWSTATE
-        get_resp = self.session.get(self.BASE_URL)
+        # Step 1: GET the page to retrieve a fresh __VIEWSTATE (the pooled
+        # session keeps the ASP.NET cookie for the POST)
+        get_resp = http_client.get(self.BASE_URL, headers=self.HEADERS)
         get_resp.raise_for_status()
         tree = html.fromstring(get_resp.content)
 
@@ -53,7 +53,7 @@ class McGillivraysScraper:
             "btnSearch.y": "8",
         }
 
-        post_resp = self.session.post(self.BASE_URL, data=post_data)
+        post_resp = http_client.post(self.BASE_URL, headers=self.HEADERS, data=post_data)
         post_resp.raise_for_status()
 
         tree = html.fromstring(post_resp.content)
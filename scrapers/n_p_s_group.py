@@ -1,17 +1,16 @@
 import re
 import time
-import requests
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.browser_session import BrowserSession
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class NPSGroupScraper:
     """
@@ -24,7 +23,8 @@ class NPSGroupScraper:
                                                              (no JS required)
     Strategy:
       1. Use Selenium only for the listing grid pages (JS-rendered).
-      2. Use requests + lxml for detail pages (static HTML, much faster).
+      2. Use requests + lxml for detail pages (static HTML, much faster),
+         with the cookies and user agent of the Selenium session.
     """
 
     DOMAIN = "https://property.nps.co.uk"
@@ -50,22 +50,17 @@ class NPSGroupScraper:
     def __init__(self):
         self.results   = []
         self.seen_urls = set()
-        self.session   = requests.Session()
-        self.session.headers.update(self.HEADERS)
-
-        chrome_options = Options()
-        # chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-
-        # service = Service("/usr/bin/chromedriver")
-        service = Service("C:/Users/educa/Downloads/ScrapyProject/ScrapyProject/chromedriver.exe")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+
+        self.driver = get_driver(
+            extra_args=["--disable-blink-features=AutomationControlled"],
+            experimental={"excludeSwitches": ["enable-automation"]},
+        )
         self.wait   = WebDriverWait(self.driver, 40)
+        self.session = BrowserSession(
+            f"{self.DOMAIN}/searchproperties/",
+            driver=self.driver,
+            headers=self.HEADERS,
+        )
 
     # ===================== RUN ===================== #
 
@@ -74,7 +69,8 @@ class NPSGroupScraper:
             for category in self.CATEGORIES:
                 self._scrape_category(category)
         finally:
-            self.driver.quit()
+            self.session.close()
+            release_driver(self.driver)
 
         return self.results
 
@@ -98,6 +94,9 @@ class NPSGroupScraper:
                 break
 
             tree = html.fromstring(self.driver.page_source)
+            if self.session.warmups == 0:
+                # The listing page already passed any bot check
+                self.session.load_from(self.driver)
 
             # ── Collect detail-page hrefs (dedup: image link + button both point to same URL) ──
             hrefs = tree.xpath("//a[contains(@href,'propertyInfo')]/@href")
@@ -143,10 +142,8 @@ class NPSGroupScraper:
         Detail pages render fully as static HTML — no JS execution needed.
         Using requests is ~10× faster than Selenium for these pages.
         """
-        try:
-            resp = self.session.get(url, timeout=20)
-            resp.raise_for_status()
-        except Exception:
+        resp = self.session.get(url, timeout=20)
+        if resp is None or not resp.ok:
             return None
 
         tree = html.fromstring(resp.text)
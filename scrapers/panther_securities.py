@@ -1,8 +1,9 @@
 import re
-import requests
 from urllib.parse import urljoin
 from lxml import html
 
+from utils import http_client
+
 
 class PantherSecuritiesScraper:
     SEARCH_URL  = "https://pantherplc.com/property-grid-view/"
@@ -37,8 +38,6 @@ class PantherSecuritiesScraper:
     def __init__(self):
         self.results = []
         self.seen_addresses = set()
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
 
     # ===================== RUN ===================== #
 
@@ -61,7 +60,7 @@ class PantherSecuritiesScraper:
     # ===================== SCRAPE FOR SALE PAGE ===================== #
 
     def _scrape_for_sale(self):
-        resp = self.session.get(self.FOR_SALE_URL)
+        resp = http_client.get(self.FOR_SALE_URL, headers=self.HEADERS)
         resp.raise_for_status()
 
         tree = html.fromstring(resp.content)
@@ -79,7 +78,7 @@ class PantherSecuritiesScraper:
             "property-category": category,
             "region": "All",
         }
-        resp = self.session.post(self.SEARCH_URL, data=post_data)
+        resp = http_client.post(self.SEARCH_URL, headers=self.HEADERS, data=post_data)
         resp.raise_for_status()
 
         tree = html.fromstring(resp.content)
@@ -1,5 +1,6 @@
 import re
-import requests
+
+from utils import http_client
 
 
 class PropertySourcers4UScraper:
@@ -28,12 +29,11 @@ class PropertySourcers4UScraper:
         return self.FALLBACK_TOKEN
 
     def _extract_token_from_js(self):
-        session = requests.Session()
-        session.headers.update({
+        headers = {
             "user-agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
-        })
+        }
 
-        resp = session.get(self.BASE_URL, timeout=30)
+        resp = http_client.get(self.BASE_URL, headers=headers, timeout=30)
         resp.raise_for_status()
 
         js_paths = set()
@@ -52,7 +52,7 @@ class PropertySourcers4UScraper:
                 js_url = self.BASE_URL + "/" + js_path
 
             try:
-                js_resp = session.get(js_url, timeout=15)
+                js_resp = http_client.get(js_url, headers=headers, timeout=15)
                 if js_resp.status_code != 200:
                     continue
 
@@ -127,7 +127,7 @@ class PropertySourcers4UScraper:
             "limit": 30
         }
 
-        response = requests.post(
+        response = http_client.post(
             self.API_URL,
             headers=headers,
             json=payload,
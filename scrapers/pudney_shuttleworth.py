@@ -1,16 +1,15 @@
 import re
-import time
 from urllib.parse import urljoin, urlparse
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils import waits
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class PudneyShuttleworthScraper:
     BASE_URLS = [
@@ -25,15 +24,7 @@ class PudneyShuttleworthScraper:
         self.results = []
         self.seen_keys = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
 
     # ===================== RUN ===================== #
@@ -62,7 +53,7 @@ class PudneyShuttleworthScraper:
                 except Exception:
                     continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
@@ -200,10 +191,11 @@ class PudneyShuttleworthScraper:
         }
 
     def _expand_view_more(self):
+        cards = (By.XPATH, "//div[@role='listitem']")
         stagnation = 0
 
         while True:
-            cards_before = len(self.driver.find_elements(By.XPATH, "//div[@role='listitem']"))
+            cards_before = len(self.driver.find_elements(*cards))
             btn = self._get_view_more_button()
             if not btn:
                 break
@@ -212,7 +204,7 @@ class PudneyShuttleworthScraper:
             try:
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-                time.sleep(0.4)
+                waits.dom_stable(self.driver, quiet=0.2, timeout=2, replaces=0.4)
                 btn.click()
                 clicked = True
             except Exception:
@@ -228,19 +220,13 @@ class PudneyShuttleworthScraper:
                     break
                 continue
 
-            loaded = False
-            end_time = time.time() + 15
-            while time.time() < end_time:
-                time.sleep(0.6)
-                cards_now = len(self.driver.find_elements(By.XPATH, "//div[@role='listitem']"))
-                if cards_now > cards_before:
-                    loaded = True
-                    break
-
-                # If button disappeared, we've reached the final page.
-                if not self._get_view_more_button():
-                    loaded = True
-                    break
+            # Loaded when new cards appear or the button disappears (final page)
+            loaded = waits.until(
+                self.driver,
+                lambda d: len(d.find_elements(*cards)) > cards_before or not self._get_view_more_button(),
+                timeout=15,
+                replaces=0.6,
+            )
 
             if loaded:
                 stagnation = 0
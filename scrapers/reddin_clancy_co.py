@@ -1,17 +1,16 @@
 import re
-import time
 import hashlib
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils import waits
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class ReddinClancyCoScraper:
     BASE_URL = "https://www.reddin-clancy.co.uk/our-property/"
@@ -21,15 +20,7 @@ class ReddinClancyCoScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        service = Service("/usr/bin/chromedriver")
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
 
     # ===================== RUN ===================== #
@@ -53,7 +44,7 @@ class ReddinClancyCoScraper:
             except Exception:
                 continue
 
-        self.driver.quit()
+        release_driver(self.driver)
         return self.results
 
     def parse_listing_card(self, card):
@@ -146,12 +137,12 @@ class ReddinClancyCoScraper:
         return obj
 
     def _load_all_listing_cards(self, max_scrolls=30):
+        cards = (By.XPATH, "//div[contains(@class,'search-results-row')]")
         last_count = 0
         stagnant_rounds = 0
 
         for _ in range(max_scrolls):
-            cards = self.driver.find_elements(By.XPATH, "//div[contains(@class,'search-results-row')]")
-            current_count = len(cards)
+            current_count = len(self.driver.find_elements(*cards))
 
             if current_count > last_count:
                 last_count = current_count
@@ -163,11 +154,12 @@ class ReddinClancyCoScraper:
                 break
 
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1.2)
+            if waits.load_more_finished(self.driver, cards, current_count, replaces=3.0) > current_count:
+                continue
             self.driver.execute_script("window.scrollBy(0, -400);")
-            time.sleep(0.6)
+            waits.dom_stable(self.driver, quiet=0.3, timeout=2)
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1.2)
+            waits.load_more_finished(self.driver, cards, current_count)
 
     # ===================== HELPERS ===================== #
 
@@ -1,41 +1,51 @@
+import math
 import re
-import time
-from urllib.request import Request, urlopen
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 from lxml import html
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from utils.browser_session import BrowserSession
+from utils.http_first import fetch_tree
+from utils.load_more import LoadMoreEndpoint, capture_endpoint
+from utils.scroll_stream import stream_cards
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class RogerHannahScraper:
     BASE_URL = "https://roger-hannah.co.uk/property-search/"
     DOMAIN = "https://roger-hannah.co.uk"
+    CARD_XPATH = "//div[contains(@class,'property_card_ajax')]"
+    LOAD_MORE = "#load-more, button.load-more-btn"
+    AJAX_URL = f"{DOMAIN}/wp-admin/admin-ajax.php"
+
+    # Further attempts, one page at a time, for result pages that failed
+    PAGE_RETRIES = 2
+
+    # data-* attributes of #load-more, all posted with the request
+    _LOAD_MORE_DATA_JS = """
+    var button = document.querySelector('#load-more');
+    if (!button) return null;
+    var data = {};
+    button.getAttributeNames().forEach(function (name) {
+        if (name.indexOf('data-') === 0) data[name.slice(5)] = button.getAttribute(name);
+    });
+    return data;
+    """
 
     def __init__(self):
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_experimental_option(
-            "prefs",
-            {"profile.managed_default_content_settings.images": 2},
-        )
-        chrome_options.page_load_strategy = "eager"
-
-        service = Service("/usr/bin/chromedriver")
-        self._chrome_options = chrome_options
-        self._service = service
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self._driver_options = {
+            "prefs": {"profile.managed_default_content_settings.images": 2},
+            "page_load_strategy": "eager",
+        }
+        # Performance log to capture the "load more" request
+        self.driver = get_driver(**self._driver_options, performance_log=True)
         self.wait = WebDriverWait(self.driver, 20)
         self.detail_driver = None
         self.detail_wait = None
@@ -49,79 +59,24 @@ class RogerHannahScraper:
                 "//div[contains(@class,'property_card_ajax')]",
             )))
 
-            processed_count = 0
-            listing_rows = []
             max_cards = self._get_expected_card_count()
-
-            while True:
-                current_count = len(self.driver.find_elements(By.XPATH, "//div[contains(@class,'property_card_ajax')]"))
-                tree = html.fromstring(self.driver.page_source)
-                cards = tree.xpath("//div[contains(@class,'property_card_ajax')]")
-
-                for card in cards[processed_count:current_count]:
-                    href = self._clean(" ".join(card.xpath(".//h5/a/@href")))
-                    if not href:
-                        continue
-
-                    listing_url = self.normalize_url(href)
-                    if listing_url in self.seen_urls:
-                        continue
-                    self.seen_urls.add(listing_url)
-
-                    card_body = card.xpath(".//div[contains(@class,'pt-7')][1]")
-                    listing_sub_type = self._clean(" ".join(
-                        card_body[0].xpath(".//ul[1]/li[1]//text()") if card_body else []
-                    ))
-                    listing_size = self._clean(" ".join(
-                        card_body[0].xpath(".//ul[1]/li[last()]//text()") if card_body else []
-                    ))
-                    listing_address = self._clean(" ".join(
-                        card_body[0].xpath("./p[1]//text()") if card_body else []
-                    ))
-
-                    sale_labels = [
-                        self._clean(v)
-                        for v in card.xpath(".//div[contains(@class,'pt-7')]//ul[contains(@class,'font-aeonik')]//li/p/text()")
-                        if self._clean(v)
-                    ]
-                    listing_sale_text = " | ".join(sale_labels)
-
-                    listing_price = self._clean(" ".join(
-                        card.xpath(
-                            ".//div[contains(@class,'pt-7')]"
-                            "//ul[contains(@class,'font-aeonik')]//li/h5[1]//text()"
-                        )
-                    ))
-
-                    listing_images = self._unique([
-                        self.normalize_url(src)
-                        for src in card.xpath(".//div[contains(@class,'property-slider')]//img/@src")
-                        if src
-                    ])
-
-                    listing_rows.append({
-                        "url": listing_url,
-                        "listing_sub_type": listing_sub_type,
-                        "listing_size": listing_size,
-                        "listing_address": listing_address,
-                        "listing_sale_text": listing_sale_text,
-                        "listing_price": listing_price,
-                        "listing_images": listing_images,
-                    })
-
-                processed_count = current_count
-                if max_cards and processed_count >= max_cards:
-                    break
-                if not self._load_more_once(current_count):
-                    break
-
-            for row in listing_rows:
-                try:
-                    obj = self.parse_listing(**row)
+            card_count = 0
+
+            # Detail pages are parsed on a worker while more cards load
+            with ThreadPoolExecutor(max_workers=1) as details:
+                futures = []
+                for card in self._cards(max_cards):
+                    card_count += 1
+                    row = self._card_row(card)
+                    if row:
+                        futures.append(details.submit(self._parse_row, row))
+                    if max_cards and card_count >= max_cards:
+                        break
+
+                for future in futures:
+                    obj = future.result()
                     if obj:
                         self.results.append(obj)
-                except Exception:
-                    continue
 
             return self.results
         except Exception:
@@ -129,6 +84,145 @@ class RogerHannahScraper:
         finally:
             self._close_drivers()
 
+    def _cards(self, max_cards):
+        """
+        Every card on the search page. Pages after the first are fetched
+        concurrently over HTTP from the request #load-more declares, with
+        the page count from data-found_posts. If the button declares none,
+        two clicks show the request instead; failing that the button is
+        clicked through.
+        """
+        first_page = html.fromstring(self.driver.page_source).xpath(self.CARD_XPATH)
+        per_page = len(first_page)
+        if not per_page or max_cards <= per_page:
+            yield from stream_cards(self.driver, "div.property_card_ajax", load_more=self.LOAD_MORE)
+            return
+
+        http = BrowserSession(self.BASE_URL, driver=self.driver)
+        http.load_from(self.driver)
+        try:
+            endpoint, page_two = self._declared_endpoint(http, first_page)
+            if endpoint is not None:
+                yield from first_page
+                yield from page_two.xpath(self.CARD_XPATH)
+                next_page = 3
+            else:
+                endpoint = capture_endpoint(self.driver, self.LOAD_MORE)
+                if endpoint is None:
+                    yield from stream_cards(self.driver, "div.property_card_ajax", load_more=self.LOAD_MORE)
+                    return
+                # Pages 1-3 are loaded in the browser now
+                yield from html.fromstring(self.driver.page_source).xpath(self.CARD_XPATH)
+                next_page = 4
+
+            last_page = math.ceil(max_cards / per_page)
+            pages = list(range(next_page, last_page + 1))
+            trees = dict(zip(pages, endpoint.fetch_pages(http, pages)))
+            for _ in range(self.PAGE_RETRIES):
+                failed = [page for page, tree in trees.items() if tree is None]
+                if not failed:
+                    break
+                trees.update(zip(failed, endpoint.fetch_pages(http, failed, workers=1)))
+
+            lost = [page for page, tree in trees.items() if tree is None]
+            if lost:
+                print(f"Roger Hannah: {len(lost)} result pages could not be fetched: {lost}")
+            for page in pages:
+                if trees[page] is not None:
+                    yield from trees[page].xpath(self.CARD_XPATH)
+        finally:
+            http.close()
+
+    def _declared_endpoint(self, http, first_page):
+        """
+        The "load more" request from #load-more's data attributes (action,
+        nonce, query), with its page number in ``page``, and page 2 fetched
+        through it. data-page may count from 0 or 1: zero-based is tried
+        first, as a one-based endpoint then answers with page 1 again,
+        whose cards we already have. (None, None) if the button declares
+        no request.
+        """
+        try:
+            data = self.driver.execute_script(self._LOAD_MORE_DATA_JS)
+        except Exception:
+            return None, None
+        if not data or not data.get("action"):
+            return None, None
+
+        params = {name: value for name, value in data.items() if name != "page"}
+        first_hrefs = {href for card in first_page for href in card.xpath(".//h5/a/@href")}
+        for offset in (-1, 0):
+            endpoint = LoadMoreEndpoint(
+                self.AJAX_URL,
+                params=params,
+                page_params={"page": offset},
+                headers={"Referer": self.BASE_URL, "Origin": self.DOMAIN},
+            )
+            page_two = endpoint.fetch_page(http, 2)
+            if page_two is None:
+                continue
+            hrefs = set(page_two.xpath(f"{self.CARD_XPATH}//h5/a/@href"))
+            if hrefs and not hrefs <= first_hrefs:
+                return endpoint, page_two
+        return None, None
+
+    def _card_row(self, card):
+        href = self._clean(" ".join(card.xpath(".//h5/a/@href")))
+        if not href:
+            return None
+
+        listing_url = self.normalize_url(href)
+        if listing_url in self.seen_urls:
+            return None
+        self.seen_urls.add(listing_url)
+
+        card_body = card.xpath(".//div[contains(@class,'pt-7')][1]")
+        listing_sub_type = self._clean(" ".join(
+            card_body[0].xpath(".//ul[1]/li[1]//text()") if card_body else []
+        ))
+        listing_size = self._clean(" ".join(
+            card_body[0].xpath(".//ul[1]/li[last()]//text()") if card_body else []
+        ))
+        listing_address = self._clean(" ".join(
+            card_body[0].xpath("./p[1]//text()") if card_body else []
+        ))
+
+        sale_labels = [
+            self._clean(v)
+            for v in card.xpath(".//div[contains(@class,'pt-7')]//ul[contains(@class,'font-aeonik')]//li/p/text()")
+            if self._clean(v)
+        ]
+        listing_sale_text = " | ".join(sale_labels)
+
+        listing_price = self._clean(" ".join(
+            card.xpath(
+                ".//div[contains(@class,'pt-7')]"
+                "//ul[contains(@class,'font-aeonik')]//li/h5[1]//text()"
+            )
+        ))
+
+        listing_images = self._unique([
+            self.normalize_url(src)
+            for src in card.xpath(".//div[contains(@class,'property-slider')]//img/@src")
+            if src
+        ])
+
+        return {
+            "url": listing_url,
+            "listing_sub_type": listing_sub_type,
+            "listing_size": listing_size,
+            "listing_address": listing_address,
+            "listing_sale_text": listing_sale_text,
+            "listing_price": listing_price,
+            "listing_images": listing_images,
+        }
+
+    def _parse_row(self, row):
+        try:
+            return self.parse_listing(**row)
+        except Exception:
+            return None
+
     def parse_listing(
         self,
         url,
@@ -286,80 +380,6 @@ class RogerHannahScraper:
         }
         return obj
 
-    def _load_all_cards(self):
-        attempts = 0
-
-        while attempts < 40:
-            current_count = len(self.driver.find_elements(By.XPATH, "//div[contains(@class,'property_card_ajax')]"))
-
-            load_more_buttons = self.driver.find_elements(By.XPATH, "//button[@id='load-more']")
-            if not load_more_buttons:
-                break
-
-            button = load_more_buttons[0]
-            if not button.is_displayed() or not button.is_enabled():
-                break
-
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", button)
-            time.sleep(0.5)
-            self.driver.execute_script("arguments[0].click();", button)
-
-            try:
-                self.wait.until(lambda d: len(d.find_elements(By.XPATH, "//div[contains(@class,'property_card_ajax')]")) > current_count)
-            except Exception:
-                break
-
-            attempts += 1
-
-    def _load_more_once(self, current_count):
-        retries = 0
-        while retries < 3:
-            load_more_buttons = self.driver.find_elements(
-                By.XPATH,
-                "//button[@id='load-more']"
-                " | //button[contains(@class,'load-more-btn')]"
-                " | //button[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'show more')]",
-            )
-            if not load_more_buttons:
-                return False
-
-            button = load_more_buttons[0]
-            old_data_page = (button.get_attribute("data-page") or "").strip()
-
-            try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", button)
-                time.sleep(0.2)
-                self.driver.execute_script("arguments[0].click();", button)
-            except Exception:
-                retries += 1
-                continue
-
-            try:
-                self.wait.until(
-                    lambda d: len(d.find_elements(By.XPATH, "//div[contains(@class,'property_card_ajax')]")) > current_count
-                )
-                return True
-            except Exception:
-                # On this site, AJAX can update page index before cards append.
-                if old_data_page:
-                    try:
-                        page_changed = self.wait.until(
-                            lambda d: (
-                                (d.find_elements(By.XPATH, "//button[@id='load-more']")[0].get_attribute("data-page") or "").strip()
-                                != old_data_page
-                            ) or len(d.find_elements(By.XPATH, "//button[@id='load-more']")) == 0
-                        )
-                        if page_changed:
-                            time.sleep(0.5)
-                            new_count = len(self.driver.find_elements(By.XPATH, "//div[contains(@class,'property_card_ajax')]"))
-                            if new_count > current_count:
-                                return True
-                    except Exception:
-                        pass
-                retries += 1
-
-        return False
-
     def _get_expected_card_count(self):
         try:
             container = self.driver.find_elements(By.XPATH, "//div[@id='property-container-load']")
@@ -371,24 +391,9 @@ class RogerHannahScraper:
             return 0
 
     def _fetch_detail_tree(self, url):
-        req = Request(
-            url,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-                )
-            },
-        )
-        try:
-            with urlopen(req, timeout=15) as res:
-                html_bytes = res.read()
-            tree = html.fromstring(html_bytes)
-            if tree.xpath("//main"):
-                return tree
-        except Exception:
-            pass
+        return fetch_tree(url, ["//main"], self._load_detail_in_browser)
 
+    def _load_detail_in_browser(self, url):
         try:
             self._ensure_detail_driver()
             self.detail_driver.get(url)
@@ -400,15 +405,12 @@ class RogerHannahScraper:
     def _ensure_detail_driver(self):
         if self.detail_driver is not None:
             return
-        self.detail_driver = webdriver.Chrome(service=self._service, options=self._chrome_options)
+        self.detail_driver = get_driver(**self._driver_options)
         self.detail_wait = WebDriverWait(self.detail_driver, 20)
 
     def _close_drivers(self):
         for drv in [self.driver, self.detail_driver]:
-            try:
-                drv.quit()
-            except Exception:
-                pass
+            release_driver(drv)
 
     def extract_size(self, text):
         if not text:
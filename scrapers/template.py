@@ -2,15 +2,15 @@
 import re
 from urllib.parse import urljoin
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from lxml import html
 
+from utils.detail_fetcher import DetailFetcher
+from utils.webdriver_pool import get_driver, release_driver
+
 
 class HeaneyMicklethwaiteScraper:
     BASE_URL = "https://www.heaneymicklethwaite.co.uk/all_properties/"
@@ -20,17 +20,13 @@ class HeaneyMicklethwaiteScraper:
         self.results = []
         self.seen_urls = set()
 
-        chrome_options = Options()
-        # chrome_options.binary_location = "/usr/bin/chromium-browser"
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        # service = Service("/usr/bin/chromedriver")
-        service = Service("C:/Users/educa/Downloads/ScrapyProject/ScrapyProject/chromedriver.exe")  #for windows
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = get_driver()
         self.wait = WebDriverWait(self.driver, 20)
+        detail_title = "//h2[contains(@class,'elementor-heading-title')]"
+        self.details = DetailFetcher(
+            wait_for=(By.XPATH, detail_title),
+            required_xpaths=[detail_title],
+        )
 
     # ===================== RUN ===================== #
 
@@ -60,15 +56,20 @@ class HeaneyMicklethwaiteScraper:
             if not listing_urls:
                 break
 
+            new_urls = []
             for href in listing_urls:
                 url = urljoin(self.DOMAIN, href)
 
                 if url in self.seen_urls:
                     continue
                 self.seen_urls.add(url)
+                new_urls.append(url)
 
+            for url, tree in self.details.fetch(new_urls):
+                if tree is None:
+                    continue
                 try:
-                    obj = self.parse_listing(url)
+                    obj = self.parse_listing(url, tree)
                     if obj:
                         self.results.append(obj)
                 except Exception:
@@ -76,21 +77,13 @@ class HeaneyMicklethwaiteScraper:
 
             page += 1
 
-        self.driver.quit()
+        self.details.close()
+        release_driver(self.driver)
         return self.results
 
     # ===================== LISTING ===================== #
 
-    def parse_listing(self, url):
-        self.driver.get(url)
-
-        self.wait.until(EC.presence_of_element_located((
-            By.XPATH,
-            "//h2[contains(@class,'elementor-heading-title')]"
-        )))
-
-        tree = html.fromstring(self.driver.page_source)
-
+    def parse_listing(self, url, tree):
         # ---------- DISPLAY ADDRESS ---------- #
         display_address = self._clean(" ".join(
             tree.xpath(
@@ -3,5 +3,8 @@ Utility functions for the scraping project.
 """
 
 from .csv_handler import store_data_to_csv
+from . import journal
+from .listing_map import ListingMap
+from .listing_store import open_store
 
-__all__ = ["store_data_to_csv"]
+__all__ = ["store_data_to_csv", "journal", "ListingMap", "open_store"]
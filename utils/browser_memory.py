@@ -0,0 +1,146 @@
+"""
+Memory accounting for Chrome sessions.
+
+Long-lived browsers keep growing over hundreds of page loads, and several
+scrapers running at once can push the box into swap or the OOM killer.
+This module reads process memory from /proc (Linux; everything is a no-op
+elsewhere):
+
+- ``session_rss``: resident memory of one WebDriver session, i.e.
+  chromedriver plus every Chrome process under it
+- ``admit_browser``: block before starting a new browser until the machine
+  has room for it, so parallel scrapers queue instead of thrashing
+
+RSS is summed over processes, which counts shared pages more than once;
+the figure is an upper bound, which is what a budget wants.
+"""
+import os
+import time
+from typing import Dict, List, Optional
+
+# Recycle a session above this resident size
+MAX_SESSION_RSS_MB = int(os.environ.get("WEBDRIVER_MAX_RSS_MB", "1500"))
+
+# Admission: all Chrome processes on the box must stay under the budget
+# (0 = no cap) and this much memory must stay free after a new browser
+MEMORY_BUDGET_MB = int(os.environ.get("WEBDRIVER_MEMORY_BUDGET_MB", "0"))
+MIN_FREE_MB = int(os.environ.get("WEBDRIVER_MIN_FREE_MB", "1024"))
+
+# What a fresh headless browser takes before loading anything heavy
+NEW_BROWSER_MB = 400
+
+ADMIT_TIMEOUT = 300
+ADMIT_POLL = 2.0
+
+MB = 1024 * 1024
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+# ===================== /proc ===================== #
+
+def _processes() -> Dict[int, tuple]:
+    """pid -> (ppid, command name) of every running process."""
+    processes = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return processes
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name is in parentheses and may contain spaces
+        name = stat[stat.index("(") + 1:stat.rindex(")")]
+        fields = stat[stat.rindex(")") + 2:].split()
+        processes[int(entry)] = (int(fields[1]), name)
+    return processes
+
+
+def _rss(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def process_tree_rss(pid: int) -> Optional[int]:
+    """Resident bytes of ``pid`` and all its descendants, None if unknown."""
+    processes = _processes()
+    if pid not in processes:
+        return None
+
+    children: Dict[int, List[int]] = {}
+    for child, (parent, _) in processes.items():
+        children.setdefault(parent, []).append(child)
+
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        total += _rss(current)
+        stack.extend(children.get(current, []))
+    return total
+
+
+def session_rss(driver) -> Optional[int]:
+    """Resident bytes of a WebDriver session (chromedriver and its browsers)."""
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    return process_tree_rss(pid)
+
+
+def chrome_rss() -> int:
+    """Resident bytes of every Chrome/chromedriver process on the machine."""
+    return sum(
+        _rss(pid) for pid, (_, name) in _processes().items()
+        if "chrom" in name.lower()
+    )
+
+
+def available_memory() -> Optional[int]:
+    """MemAvailable in bytes, None if unknown."""
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+# ===================== ADMISSION ===================== #
+
+def has_room_for_browser() -> bool:
+    available = available_memory()
+    if available is not None and available - NEW_BROWSER_MB * MB < MIN_FREE_MB * MB:
+        return False
+    if MEMORY_BUDGET_MB and chrome_rss() + NEW_BROWSER_MB * MB > MEMORY_BUDGET_MB * MB:
+        return False
+    return True
+
+
+def admit_browser(timeout: float = ADMIT_TIMEOUT) -> bool:
+    """
+    Wait until a new browser fits in memory. Gives up after ``timeout``
+    seconds and returns False; the caller starts the browser anyway rather
+    than failing the scraper.
+    """
+    if has_room_for_browser():
+        return True
+
+    print("Waiting for memory before starting another browser...")
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        time.sleep(ADMIT_POLL)
+        if has_room_for_browser():
+            return True
+    print(f"Still short of memory after {timeout:.0f}s, starting the browser anyway")
+    return False
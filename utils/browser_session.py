@@ -0,0 +1,169 @@
+"""
+HTTP session seeded from a warmed-up browser.
+
+Some sites only need a browser to get past bot protection or to pick up
+session cookies; after that every listing and detail page would load fine
+over plain HTTP. ``BrowserSession`` loads a page in Chrome once, copies its
+cookies and user agent into a pooled ``requests.Session`` and does the
+bulk fetching over HTTP:
+
+    http = BrowserSession(DOMAIN + "/search/", wait_for=(By.CSS_SELECTOR, ".card"))
+    for response in http.get_many(urls):
+        ...
+
+When responses turn into challenge pages (cookies expired, clearance
+revoked) the browser warms up again and the request is retried. If that
+keeps failing the session gives up (``blocked``) and ``get`` returns None,
+so the scraper can fall back to its browser.
+
+Requests are paced by the shared per-domain limiter (utils/rate_limit.py).
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils import waits
+from utils.rate_limit import THROTTLED, get_limiter, is_challenge, outcome_of, retry_after
+from utils.webdriver_pool import get_driver, release_driver
+
+# Warm-ups in a row that may fail to clear a challenge before giving up
+MAX_REWARMS = 2
+
+
+class BrowserSession:
+    """
+    Pooled HTTP session carrying a browser's cookies and user agent.
+
+    Args:
+        warm_url: Page loaded in Chrome to obtain cookies
+        driver: Scraper's own browser to warm up with; a pooled one is
+            leased per warm-up otherwise
+        driver_options: get_driver() keyword arguments for leased browsers
+        wait_for: Locator present once the page (not a challenge) loaded
+        headers: Extra request headers
+        pool_size: Keep-alive connections per host
+        timeout: Request timeout in seconds
+    """
+
+    def __init__(self, warm_url: str, driver=None, driver_options: Optional[Dict] = None,
+                 wait_for: Optional[Tuple[str, str]] = None, headers: Optional[Dict[str, str]] = None,
+                 pool_size: int = 10, timeout: float = 20):
+        self.warm_url = warm_url
+        self.driver = driver
+        self.driver_options = driver_options or {}
+        self.wait_for = wait_for
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(headers or {})
+
+        self.blocked = False
+        self.warmups = 0
+        self._generation = 0
+        self._failed_warmups = 0
+        self._lock = threading.Lock()
+
+    # ===================== WARM-UP ===================== #
+
+    def load_from(self, driver) -> None:
+        """Copy cookies and user agent from a browser already on the site."""
+        for cookie in driver.get_cookies():
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+        user_agent = driver.execute_script("return navigator.userAgent;")
+        if user_agent:
+            # Clearance cookies are bound to the user agent that earned them
+            self.session.headers["User-Agent"] = user_agent.replace("HeadlessChrome", "Chrome")
+        self._generation += 1
+        self.warmups += 1
+
+    def warm(self) -> None:
+        """Load ``warm_url`` in Chrome and take over its session."""
+        driver = self.driver or get_driver(**self.driver_options)
+        try:
+            driver.get(self.warm_url)
+            if self.wait_for:
+                waits.until(driver, lambda d: d.find_elements(*self.wait_for), timeout=30)
+            else:
+                waits.network_idle(driver, timeout=15)
+            self.session.cookies.clear()
+            self.load_from(driver)
+        finally:
+            if self.driver is None:
+                release_driver(driver)
+
+    def _rewarm(self, seen_generation: int) -> bool:
+        """Warm up again unless another thread already did. False once blocked."""
+        with self._lock:
+            if self.blocked:
+                return False
+            if seen_generation != self._generation:
+                return True
+            if self._failed_warmups >= MAX_REWARMS:
+                print(f"Still challenged after {MAX_REWARMS} warm-ups, giving up on HTTP for {self.warm_url}")
+                self.blocked = True
+                return False
+            self._failed_warmups += 1
+            try:
+                self.warm()
+            except Exception:
+                pass
+            return True
+
+    # ===================== FETCH ===================== #
+
+    def request(self, method: str, url: str, **kwargs) -> Optional[requests.Response]:
+        """Request over HTTP; None on errors, or on challenges a re-warm can't clear."""
+        if self._generation == 0:
+            self._rewarm(0)
+
+        kwargs.setdefault("timeout", self.timeout)
+        while not self.blocked:
+            generation = self._generation
+            try:
+                with get_limiter().request(url) as ticket:
+                    response = self.session.request(method, url, **kwargs)
+                    ticket.outcome = outcome_of(response.status_code)
+                    if response.status_code == 429:
+                        ticket.pause = retry_after(response)
+                    challenged = is_challenge(response)
+                    if challenged:
+                        ticket.outcome = THROTTLED
+            except requests.RequestException:
+                return None
+            if not challenged:
+                with self._lock:
+                    self._failed_warmups = 0
+                return response
+            if not self._rewarm(generation):
+                break
+        return None
+
+    def get(self, url: str, **kwargs) -> Optional[requests.Response]:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Optional[requests.Response]:
+        return self.request("POST", url, **kwargs)
+
+    def get_many(self, urls: Iterable[str], workers: int = 4, **kwargs) -> List[Optional[requests.Response]]:
+        """get() each URL on ``workers`` threads; responses in the order of ``urls``."""
+        urls = list(urls)
+        if not urls:
+            return []
+        if self._generation == 0:
+            self._rewarm(0)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return list(executor.map(lambda url: self.get(url, **kwargs), urls))
+
+    def close(self) -> None:
+        self.session.close()
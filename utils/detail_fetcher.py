@@ -0,0 +1,173 @@
+"""
+Concurrent detail-page loading for the Selenium scrapers.
+
+Most scrapers collect the listing URLs of a results page and then load
+each detail page one after the other on their single driver, which sits
+idle on the network most of the time. ``DetailFetcher`` loads them on a
+small pool of extra browsers from utils/webdriver_pool.py instead:
+
+    with DetailFetcher(wait_for=(By.XPATH, "//h1")) as details:
+        for url, tree in details.fetch(urls):
+            obj = self.parse_listing(url, tree)
+
+Pages are returned as parsed lxml trees in the order of ``urls``, whatever
+order they finished in, so results stay deterministic. The shared
+per-domain limiter (utils/rate_limit.py) decides how many pages of one
+site load at the same time and how quickly new loads start, and backs off
+when pages time out or stop coming back.
+
+Separate browsers are used rather than tabs of one browser: a WebDriver
+session runs one command at a time, so tabs would still load one by one.
+
+With ``required_xpaths`` each page is tried over plain HTTP first (see
+utils/http_first.py) and only loaded in a browser when that response is
+missing any of them.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from lxml import html
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.http_first import fetch_tree
+from utils.rate_limit import ERROR, THROTTLED, RateLimiter, Ticket, get_limiter, is_challenge_page
+from utils.webdriver_pool import get_driver, release_driver
+
+# Browsers loading detail pages per scraper
+DEFAULT_WORKERS = int(os.environ.get("DETAIL_WORKERS", "3"))
+
+
+# ===================== FETCHER ===================== #
+
+class DetailFetcher:
+    """
+    Load detail pages on a bounded pool of browsers.
+
+    Args:
+        wait_for: Locator that must be present before the page is read;
+            pages where it never appears come back as None
+        workers: Number of browsers
+        timeout: Seconds to wait for ``wait_for``
+        driver_options: Keyword arguments for get_driver(), so the detail
+            browsers match the scraper's own (user agent, prefs, ...)
+        limiter: Per-domain rate limiter; the process-wide one by default
+        required_xpaths: XPaths a plain HTTP response must contain to be
+            used instead of a browser load; empty to always use a browser
+    """
+
+    def __init__(self, wait_for: Optional[Tuple[str, str]] = None, workers: int = DEFAULT_WORKERS,
+                 timeout: float = 20, driver_options: Optional[Dict] = None,
+                 limiter: Optional[RateLimiter] = None, required_xpaths: Sequence[str] = ()):
+        self.wait_for = wait_for
+        self.required_xpaths = list(required_xpaths)
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.driver_options = driver_options or {}
+        self.limiter = limiter or get_limiter()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._drivers: List = []
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="detail")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _driver(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = get_driver(**self.driver_options)
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def _discard_driver(self) -> None:
+        driver = getattr(self._local, "driver", None)
+        self._local.driver = None
+        if driver is not None:
+            with self._lock:
+                self._drivers.remove(driver)
+            release_driver(driver, error=True)
+
+    def _load(self, url: str):
+        ticket = self.limiter.acquire(url)
+        try:
+            return fetch_tree(
+                url, self.required_xpaths, lambda page_url: self._load_in_browser(page_url, ticket)
+            )
+        finally:
+            self.limiter.release(ticket)
+
+    def _load_in_browser(self, url: str, ticket: Ticket):
+        """
+        The page as an lxml tree, None if it never showed ``wait_for``.
+        Only load timeouts and challenge pages count as throttling; a page
+        that loaded without ``wait_for`` (e.g. a removed listing) does not.
+        """
+        try:
+            driver = self._driver()
+            driver.get(url)
+        except TimeoutException:
+            ticket.outcome = THROTTLED
+            return None
+        except WebDriverException:
+            # Browser crashed or got stuck: start a fresh one next time
+            ticket.outcome = ERROR
+            self._discard_driver()
+            return None
+        except Exception:
+            ticket.outcome = ERROR
+            return None
+
+        try:
+            # Waiting also lets a challenge interstitial resolve itself
+            if self.wait_for:
+                WebDriverWait(driver, self.timeout).until(
+                    EC.presence_of_element_located(self.wait_for)
+                )
+            source = driver.page_source
+        except TimeoutException:
+            if self._on_challenge_page(driver):
+                ticket.outcome = THROTTLED
+            return None
+        except WebDriverException:
+            ticket.outcome = ERROR
+            self._discard_driver()
+            return None
+
+        if is_challenge_page(source):
+            ticket.outcome = THROTTLED
+        try:
+            return html.fromstring(source)
+        except Exception:
+            # e.g. an empty document lxml cannot parse
+            ticket.outcome = ERROR
+            return None
+
+    @staticmethod
+    def _on_challenge_page(driver) -> bool:
+        try:
+            return is_challenge_page(driver.page_source)
+        except WebDriverException:
+            return False
+
+    def fetch(self, urls: Sequence[str]) -> Iterator[Tuple[str, Optional[object]]]:
+        """Yield (url, lxml tree or None) in the order of ``urls``."""
+        urls = list(urls)
+        return zip(urls, self._executor.map(self._load, urls))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            release_driver(driver)
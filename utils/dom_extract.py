@@ -0,0 +1,196 @@
+"""
+In-browser structured extraction.
+
+``html.fromstring(driver.page_source)`` after every page load sends the
+whole serialized DOM over the WebDriver wire, often megabytes, and then
+parses it again in Python, only for the scraper to read a dozen XPaths.
+``PageExtractor`` declares those XPaths once; one injected script
+evaluates them in the page and returns just the values as JSON:
+
+    DETAIL = PageExtractor({
+        "title": "//h1//text()",
+        "images": "//div[@class='gallery']//img/@src",
+        "sections": ("//div[@class='section']", {
+            "heading": ".//h3//text()",
+            "content": ".//p//text()",
+        }),
+    })
+    fields = DETAIL.extract(driver)
+    title = " ".join(fields["title"])
+
+Every field is a list of strings, like ``tree.xpath()`` gives for text and
+attribute queries (elements give their text content). A group, declared
+as (context XPath, {name: relative XPath}), is a list of such dicts, one
+per context node. If the script fails, for example on an XPath the
+browser rejects, the page source is parsed with lxml instead. Node, text
+and attribute queries give the same lists either way. An XPath that
+returns a scalar (``count()``, ``normalize-space()``) makes the script
+fail, so every page takes the slower fallback, where the value comes back
+as a one-item list.
+
+``take_extract_report()`` tells how many bytes and how much parse time
+in-browser extraction saved.
+"""
+import json
+import threading
+import time
+from typing import Dict, List, Tuple, Union
+
+from lxml import html
+
+# Fetch and parse the full page source every this many in-browser
+# extractions, to estimate what it would have cost
+SAMPLE_EVERY = 25
+
+Spec = Union[str, Tuple[str, Dict[str, str]]]
+
+_EXTRACT_JS = """
+var fields = arguments[0];
+
+function values(xpath, context) {
+    var result = document.evaluate(
+        xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    var out = [];
+    for (var i = 0; i < result.snapshotLength; i++) {
+        var node = result.snapshotItem(i);
+        out.push(node.nodeType === 1 ? node.textContent : node.nodeValue);
+    }
+    return out;
+}
+
+function nodes(xpath) {
+    var result = document.evaluate(
+        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    var out = [];
+    for (var i = 0; i < result.snapshotLength; i++) out.push(result.snapshotItem(i));
+    return out;
+}
+
+var out = {};
+Object.keys(fields).forEach(function (name) {
+    var spec = fields[name];
+    if (typeof spec === 'string') {
+        out[name] = values(spec, document);
+        return;
+    }
+    out[name] = nodes(spec[0]).map(function (node) {
+        var group = {};
+        Object.keys(spec[1]).forEach(function (sub) { group[sub] = values(spec[1][sub], node); });
+        return group;
+    });
+});
+return JSON.stringify(out);
+"""
+
+_lock = threading.Lock()
+
+
+def _empty_report() -> Dict[str, float]:
+    return {
+        "pages": 0, "fallbacks": 0, "wire_bytes": 0, "seconds": 0.0,
+        "sampled_pages": 0, "sampled_bytes": 0, "sampled_seconds": 0.0,
+    }
+
+
+_report = _empty_report()
+
+
+# ===================== REPORT ===================== #
+
+def take_extract_report() -> Dict[str, float]:
+    """
+    Extractions since the last call: pages, fallbacks to page_source,
+    bytes actually transferred and seconds spent. ``sampled_*`` measure
+    the size of the pages and what page_source + lxml cost on every
+    SAMPLE_EVERY-th page.
+    """
+    global _report
+    with _lock:
+        report, _report = _report, _empty_report()
+    return report
+
+
+def estimated_savings(report: Dict[str, float]) -> Tuple[int, float]:
+    """
+    (bytes, seconds) saved according to a take_extract_report() result,
+    extrapolated from the sampled pages.
+    """
+    if not report["sampled_pages"] or not report["sampled_bytes"]:
+        return 0, 0.0
+    page_bytes = report["pages"] * report["sampled_bytes"] / report["sampled_pages"]
+    per_byte = report["sampled_seconds"] / report["sampled_bytes"]
+    return int(page_bytes - report["wire_bytes"]), page_bytes * per_byte - report["seconds"]
+
+
+# ===================== EXTRACTION ===================== #
+
+def _lxml_values(tree_or_node, xpath: str) -> List[str]:
+    results = tree_or_node.xpath(xpath)
+    if not isinstance(results, list):
+        results = [results]
+    return [
+        value.text_content() if hasattr(value, "text_content") else str(value)
+        for value in results
+    ]
+
+
+class PageExtractor:
+    """Named XPaths evaluated in the browser, with a page_source fallback."""
+
+    def __init__(self, fields: Dict[str, Spec]):
+        self.fields = fields
+        self._count = 0
+
+    def extract_from_tree(self, tree) -> Dict[str, list]:
+        """Same result as extract(), from an already parsed lxml tree."""
+        out = {}
+        for name, spec in self.fields.items():
+            if isinstance(spec, str):
+                out[name] = _lxml_values(tree, spec)
+            else:
+                context, subs = spec
+                out[name] = [
+                    {sub: _lxml_values(node, xpath) for sub, xpath in subs.items()}
+                    for node in tree.xpath(context)
+                ]
+        return out
+
+    def _from_page_source(self, driver) -> Tuple[Dict[str, list], int, float]:
+        started = time.time()
+        source = driver.page_source
+        tree = html.fromstring(source)
+        return self.extract_from_tree(tree), len(source), time.time() - started
+
+    def extract(self, driver) -> Dict[str, list]:
+        """Values of every field on the driver's current page."""
+        started = time.time()
+        try:
+            raw = driver.execute_script(_EXTRACT_JS, self.fields)
+            values = json.loads(raw)
+        except Exception:
+            values, _, _ = self._from_page_source(driver)
+            with _lock:
+                _report["fallbacks"] += 1
+            return values
+        elapsed = time.time() - started
+
+        sample = None
+        self._count += 1
+        if self._count % SAMPLE_EVERY == 1:
+            try:
+                _, sampled_bytes, sampled_seconds = self._from_page_source(driver)
+                sample = (sampled_bytes, sampled_seconds)
+            except Exception:
+                pass
+
+        with _lock:
+            _report["pages"] += 1
+            _report["wire_bytes"] += len(raw)
+            _report["seconds"] += elapsed
+            if sample:
+                _report["sampled_pages"] += 1
+                _report["sampled_bytes"] += sample[0]
+                _report["sampled_seconds"] += sample[1]
+        return values
@@ -0,0 +1,44 @@
+"""
+Cross-process lock for read-merge-write updates of shared JSON files.
+
+Supervised children save learned state (utils/http_first.py,
+utils/rate_limit.py) at the end of every scraper. A thread lock only
+covers one process, so two children could both read the file, merge
+their own entries and replace it, and the second would drop the first's.
+Holding ``file_lock(path)`` around the whole update prevents that:
+
+    with file_lock(self.path):
+        on_disk = self._load()
+        ...
+        os.replace(tmp_path, self.path)
+
+The lock is an ``fcntl.flock`` on a sidecar ``<path>.lock`` file, so the
+JSON file itself can still be replaced atomically. Where fcntl is not
+available (Windows) the lock does nothing.
+"""
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` across processes."""
+    dir_path = os.path.dirname(path)
+    if dir_path and not os.path.exists(dir_path):
+        os.makedirs(dir_path, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+
+    with open(f"{path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,164 @@
+"""
+Shared pooled HTTP client for the requests-based scrapers.
+
+``requests.get()`` opens a fresh connection (TCP and TLS handshake) for
+every call and closes it again. ``get``/``post`` here are drop-in
+replacements that go through one process-wide ``requests.Session``:
+
+- keep-alive: connections are reused across calls and scrapers
+- per-host limit: at most ``MAX_PER_HOST`` connections to one host; extra
+  requests wait for a free connection instead of hammering the site
+- compression: gzip/deflate always, brotli when the ``brotli`` package
+  is installed
+- transient 502/503/504 and connection errors on GETs are retried
+- every request is paced by the adaptive per-domain limiter in
+  utils/rate_limit.py, which backs off on 429/503, timeouts and challenge
+  pages
+
+``map_details`` runs a scraper's detail parser over its URLs concurrently,
+which replaces the usual sequential loop:
+
+    for url in listing_urls:
+        try:
+            self.results.append(self.parse_listing(url))
+        except Exception:
+            continue
+
+with
+
+    self.results.extend(map_details(self.parse_listing, listing_urls))
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.rate_limit import THROTTLED, get_limiter, is_challenge, outcome_of, retry_after
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes "br" when it is importable)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# Open connections to a single host, shared by every scraper in the process
+MAX_PER_HOST = int(os.environ.get("HTTP_MAX_PER_HOST", "6"))
+
+# Concurrent detail fetches per scraper
+DETAIL_WORKERS = int(os.environ.get("HTTP_DETAIL_WORKERS", "6"))
+
+# Distinct hosts whose connection pools are kept
+POOL_HOSTS = 50
+
+DEFAULT_TIMEOUT = 30
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+# ===================== SESSION ===================== #
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,
+    )
+    # pool_block: a host at its limit makes callers wait rather than
+    # opening (and then discarding) an extra connection
+    adapter = HTTPAdapter(
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=MAX_PER_HOST,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+def get_session() -> requests.Session:
+    """The process-wide pooled session."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close() -> None:
+    """Close every pooled connection; the next call opens a new session."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# ===================== REQUESTS ===================== #
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """``requests.request`` over the pooled session, paced per domain."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    with get_limiter().request(url) as ticket:
+        response = get_session().request(method, url, **kwargs)
+        ticket.outcome = outcome_of(response.status_code)
+        if response.status_code == 429:
+            ticket.pause = retry_after(response)
+        elif is_challenge(response):
+            ticket.outcome = THROTTLED
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """``requests.get`` over the pooled session."""
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """``requests.post`` over the pooled session."""
+    return request("POST", url, **kwargs)
+
+
+def fetch_all(urls: Iterable[str], workers: int = DETAIL_WORKERS, **kwargs) -> List[Optional[requests.Response]]:
+    """GET every URL concurrently; responses in the order of ``urls``, None where a request failed."""
+    def fetch(url):
+        try:
+            return get(url, **kwargs)
+        except requests.RequestException:
+            return None
+
+    urls = list(urls)
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return list(executor.map(fetch, urls))
+
+
+def map_details(parse: Callable, items: Iterable, workers: int = DETAIL_WORKERS) -> List:
+    """
+    ``parse(item)`` for every item concurrently.
+
+    Results come back in the order of ``items``. Items whose parse raised
+    or returned None are left out, as the sequential loops did.
+    """
+    def run(item):
+        try:
+            return parse(item)
+        except Exception:
+            return None
+
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return [result for result in executor.map(run, items) if result is not None]
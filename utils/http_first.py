@@ -0,0 +1,203 @@
+"""
+HTTP-first page fetching with a browser fallback, learned per site.
+
+Many "Selenium" pages are server-rendered and come back complete from a
+plain GET, at a fraction of the cost of a Chrome page load. ``fetch_tree``
+tries HTTP first and accepts the page only if every required XPath of the
+scraper matches; otherwise it hands the URL to the scraper's browser
+loader.
+
+Which path works is remembered per domain and page type in
+website_data/fetch_strategies.json, so later runs go straight to the
+browser for sites that need it. Browser-only sites are re-probed over HTTP
+once per run and every ``PROBE_EVERY`` pages, so a site that stops
+needing JavaScript moves back to the cheap path. master.py saves the file
+after every scraper (``save_strategies``).
+"""
+import atexit
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Optional, Sequence
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+
+from lxml import html
+
+from utils.file_lock import file_lock
+
+HTTP = "http"
+BROWSER = "browser"
+
+# Consecutive failed HTTP validations before a site is marked browser-only
+FAILS_TO_SWITCH = 3
+
+# Re-try HTTP on a browser-only site every this many pages
+PROBE_EVERY = 100
+
+HTTP_TIMEOUT = 15
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-GB,en;q=0.9",
+}
+
+DEFAULT_PATH = os.environ.get(
+    "FETCH_STRATEGY_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                 "website_data", "fetch_strategies.json"),
+)
+
+
+# ===================== LEARNED STRATEGIES ===================== #
+
+class FetchStrategies:
+    """
+    Learned fetch path per (domain, page type), stored as JSON:
+    {domain: {page_type: {"mode": "http"|"browser", "http_ok": n, "http_failed": n, ...}}}.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self.sites: Dict[str, Dict[str, Dict]] = self._load()
+        # Per-process counters, not persisted
+        self._fails: Dict[tuple, int] = {}
+        self._since_probe: Dict[tuple, int] = {}
+        self._changed = set()
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable fetch strategies {self.path}: {e}")
+            return {}
+
+    def _entry(self, domain: str, page_type: str) -> Dict:
+        return self.sites.setdefault(domain, {}).setdefault(
+            page_type, {"mode": HTTP, "http_ok": 0, "http_failed": 0}
+        )
+
+    def use_http(self, domain: str, page_type: str) -> bool:
+        """Whether the next page of this kind should be tried over HTTP."""
+        key = (domain, page_type)
+        with self._lock:
+            if self._entry(domain, page_type)["mode"] == HTTP:
+                return True
+            count = self._since_probe.get(key)
+            self._since_probe[key] = 1 if count is None or count >= PROBE_EVERY else count + 1
+            # Probe on the first page of the run and every PROBE_EVERY pages
+            return count is None or count >= PROBE_EVERY
+
+    def record(self, domain: str, page_type: str, http_ok: bool) -> None:
+        key = (domain, page_type)
+        with self._lock:
+            entry = self._entry(domain, page_type)
+            entry["http_ok" if http_ok else "http_failed"] += 1
+            entry["updated"] = datetime.now().strftime("%Y-%m-%d")
+
+            if http_ok:
+                self._fails[key] = 0
+                entry["mode"] = HTTP
+            else:
+                self._fails[key] = self._fails.get(key, 0) + 1
+                if entry["mode"] == HTTP and self._fails[key] >= FAILS_TO_SWITCH:
+                    entry["mode"] = BROWSER
+            self._changed.add(key)
+
+    def mode(self, domain: str, page_type: str) -> Optional[str]:
+        with self._lock:
+            return self.sites.get(domain, {}).get(page_type, {}).get("mode")
+
+    def save(self) -> None:
+        """Write our entries back, keeping what other processes saved meanwhile."""
+        with self._lock:
+            if not self._changed:
+                return
+            # Other processes save the same file; hold the lock from read to replace
+            with file_lock(self.path):
+                on_disk = self._load()
+                for domain, page_type in self._changed:
+                    on_disk.setdefault(domain, {})[page_type] = self.sites[domain][page_type]
+
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(on_disk, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            self._changed.clear()
+
+
+_STRATEGIES = None
+_STRATEGIES_LOCK = threading.Lock()
+
+
+def get_strategies() -> FetchStrategies:
+    global _STRATEGIES
+    with _STRATEGIES_LOCK:
+        if _STRATEGIES is None:
+            _STRATEGIES = FetchStrategies()
+            # Fallback for in-process use; supervised children are killed
+            # before atexit handlers run, so master saves explicitly
+            atexit.register(_STRATEGIES.save)
+        return _STRATEGIES
+
+
+def save_strategies() -> None:
+    """Write what this process learned, if it fetched anything."""
+    if _STRATEGIES is not None:
+        _STRATEGIES.save()
+
+
+# ===================== FETCH ===================== #
+
+def fetch_http(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = HTTP_TIMEOUT):
+    """Plain GET parsed with lxml, or None on any error."""
+    try:
+        request = Request(url, headers=headers or DEFAULT_HEADERS)
+        with urlopen(request, timeout=timeout) as response:
+            content = response.read()
+        return html.fromstring(content)
+    except Exception:
+        return None
+
+
+def is_complete(tree, required_xpaths: Sequence[str]) -> bool:
+    """True if every required XPath matches something in ``tree``."""
+    return tree is not None and all(tree.xpath(xpath) for xpath in required_xpaths)
+
+
+def fetch_tree(url: str, required_xpaths: Sequence[str], load_in_browser: Callable[[str], object],
+               page_type: str = "detail", headers: Optional[Dict[str, str]] = None,
+               strategies: Optional[FetchStrategies] = None):
+    """
+    Return the page as an lxml tree, over HTTP when that is known (or
+    found) to give a complete page, else via ``load_in_browser(url)``.
+
+    Args:
+        url: Page to fetch
+        required_xpaths: XPaths that must all match for an HTTP response
+            to count as complete
+        load_in_browser: Scraper's fallback, returns an lxml tree or None
+        page_type: What kind of page this is ("detail", "listing", ...);
+            strategies are learned separately per type
+        headers: HTTP headers (default: a desktop Chrome)
+    """
+    strategies = strategies or get_strategies()
+    domain = urlparse(url).netloc
+
+    if required_xpaths and strategies.use_http(domain, page_type):
+        tree = fetch_http(url, headers)
+        complete = is_complete(tree, required_xpaths)
+        strategies.record(domain, page_type, complete)
+        if complete:
+            return tree
+
+    return load_in_browser(url)
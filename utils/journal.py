@@ -0,0 +1,107 @@
+"""
+Append-only journal of per-scraper deltas.
+
+The master run appends one JSON line per scraper containing only the rows
+that scraper changed, instead of rewriting the whole CSV each time. If the
+run crashes, the journal is replayed on top of the last compacted CSV on
+the next start. At the end of a run the merged data is compacted into the
+CSV once and the journal is removed.
+"""
+import json
+import os
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from .csv_handler import store_data_to_csv
+
+
+def append_delta(
+    journal_path: str,
+    scraper_name: str,
+    rows: List[Dict[str, Any]],
+    run_id: Optional[str] = None
+) -> None:
+    """
+    Append one scraper's changed rows to the journal and fsync it.
+
+    Args:
+        journal_path: Path to the journal file
+        scraper_name: Name of the scraper that produced the rows
+        rows: Rows to upsert by listingUrl when the journal is replayed
+        run_id: Queued run the rows belong to, if any
+    """
+    dir_path = os.path.dirname(journal_path)
+    if dir_path and not os.path.exists(dir_path):
+        os.makedirs(dir_path)
+
+    record = {"scraper": scraper_name, "rows": rows}
+    if run_id:
+        record["run"] = run_id
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_journal(journal_path: str) -> Iterator[Tuple[str, Optional[str], List[Dict[str, Any]]]]:
+    """
+    Yield (scraper_name, run_id, rows) for every complete record in the journal.
+
+    A truncated last line (crash mid-write) is ignored.
+    """
+    if not os.path.exists(journal_path):
+        return
+
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            yield record.get("scraper", ""), record.get("run"), record.get("rows", [])
+
+
+def replay_journal(
+    journal_path: str,
+    existing_map: Dict[str, Dict[str, Any]]
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    Apply journaled rows on top of ``existing_map`` (keyed by listingUrl).
+
+    Returns:
+        (scraper_name, run_id) of every record replayed, in journal order
+    """
+    replayed = []
+    for scraper_name, run_id, rows in read_journal(journal_path):
+        for row in rows:
+            url = row.get("listingUrl")
+            if url:
+                existing_map[url] = row
+        replayed.append((scraper_name, run_id))
+    return replayed
+
+
+def compact(
+    journal_path: str,
+    data: List[Dict[str, Any]],
+    filepath: str
+) -> bool:
+    """
+    Write the merged data to the CSV atomically and drop the journal.
+
+    The CSV is written to a temporary file and moved into place, so a crash
+    during compaction leaves the previous CSV and the journal intact.
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    tmp_path = filepath + ".tmp"
+    if not store_data_to_csv(data, filepath=tmp_path, mode="overwrite"):
+        return False
+
+    os.replace(tmp_path, filepath)
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+    return True
@@ -0,0 +1,125 @@
+"""
+In-memory listing map keyed by listingUrl with a secondary index by agent.
+
+The master merge needs "all URLs we already hold for this agency" once per
+scraper. Scanning the whole map for that is O(total rows) per agency; the
+agent index makes it O(rows for that agency).
+"""
+from collections.abc import MutableMapping
+from typing import Dict, Any, Iterator, Set
+
+
+class ListingMap(MutableMapping):
+    """
+    Dict-like store of rows keyed by listingUrl.
+
+    Keeps ``agentCompanyName -> {listingUrl}`` in sync on every set/delete,
+    so it can be used anywhere the plain ``existing_map`` dict was used.
+    """
+
+    def __init__(self, rows=None):
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._by_agent: Dict[str, Set[str]] = {}
+        if rows:
+            for row in rows:
+                self.upsert(row)
+
+    # ===================== MAPPING ===================== #
+
+    def __getitem__(self, url):
+        return self._rows[url]
+
+    def __setitem__(self, url, row):
+        old = self._rows.get(url)
+        if old is not None:
+            self._unindex(url, old.get("agentCompanyName", ""))
+        self._rows[url] = row
+        self._by_agent.setdefault(row.get("agentCompanyName", ""), set()).add(url)
+
+    def __delitem__(self, url):
+        row = self._rows.pop(url)
+        self._unindex(url, row.get("agentCompanyName", ""))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, url):
+        return url in self._rows
+
+    # ===================== INDEX ===================== #
+
+    def upsert(self, row: Dict[str, Any]) -> bool:
+        """Insert or replace a row by its listingUrl. Returns False if it has none."""
+        url = row.get("listingUrl")
+        if not url:
+            return False
+        self[url] = row
+        return True
+
+    def urls_for_agent(self, agent_name: str) -> Set[str]:
+        """Return a copy of the listing URLs held for ``agent_name``."""
+        return set(self._by_agent.get(agent_name, ()))
+
+    def agents(self):
+        return list(self._by_agent)
+
+    def _unindex(self, url, agent_name):
+        urls = self._by_agent.get(agent_name)
+        if urls is None:
+            return
+        urls.discard(url)
+        if not urls:
+            del self._by_agent[agent_name]
+
+
+def merge_scraper_results(existing_map, properties, today):
+    """
+    Apply New/Old/Deleted classification for one scraper's properties.
+
+    Mutates ``existing_map`` (a ListingMap) in place. Must only be called
+    from the master process so there is exactly one writer.
+
+    Returns:
+        List of rows that were added or changed (the scraper's delta).
+    """
+    # Get agent name from first row (assumed consistent per scraper)
+    agent_name = properties[0].get("agentCompanyName", "")
+
+    current_urls = set()
+    agent_existing_urls = existing_map.urls_for_agent(agent_name)
+
+    # ---------------- HANDLE NEW / OLD ---------------- #
+
+    for row in properties:
+        listing_url = row.get("listingUrl")
+        if not listing_url:
+            continue
+
+        current_urls.add(listing_url)
+        row["date"] = today
+
+        if listing_url in existing_map:
+            row["status"] = "Old"
+        else:
+            row["status"] = "New"
+
+        existing_map[listing_url] = row
+
+    # ---------------- HANDLE DELETED ---------------- #
+
+    deleted_urls = agent_existing_urls - current_urls
+
+    delta = [row for row in properties if row.get("listingUrl")]
+
+    for url in deleted_urls:
+        existing_row = existing_map.get(url)
+        if existing_row:
+            existing_row["status"] = "Deleted"
+            existing_row["date"] = today
+            existing_map[url] = existing_row
+            delta.append(existing_row)
+
+    return delta
@@ -0,0 +1,346 @@
+"""
+Listing stores used by the master merge stage.
+
+Both stores expose the same interface:
+
+    store.merge(scraper_name, properties, today, run_id=None) -> delta rows
+    store.has_delta(scraper_name, run_id=None)    -> delta already in the store?
+    store.apply_delta(scraper_name, delta rows)   -> replay a recorded delta
+    store.finalize()                              -> write website_data CSV
+    store.close()
+
+CsvListingStore keeps the whole history in memory (ListingMap) and journals
+per-scraper deltas (see journal.py). SQLiteListingStore keeps the history
+in an indexed SQLite database, so startup cost no longer grows with the
+size of the history file and New/Old/Deleted transitions are set-based SQL
+in one transaction per scraper. It still exports to the STANDARD_COLUMNS
+CSV layout.
+"""
+import csv
+import json
+import os
+import sqlite3
+from typing import List, Dict, Any, Iterator, Optional
+
+from . import journal
+from .csv_handler import STANDARD_COLUMNS
+from .listing_map import ListingMap, merge_scraper_results
+
+
+# ===================== CSV + JOURNAL ===================== #
+
+class CsvListingStore:
+    """In-memory ListingMap loaded from the CSV, with a delta journal."""
+
+    def __init__(self, csv_path: str, journal_path: str):
+        self.csv_path = csv_path
+        self.journal_path = journal_path
+        self.existing_map = ListingMap()
+
+        if os.path.exists(csv_path):
+            with open(csv_path, "r", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    self.existing_map.upsert(row)
+
+        # Recover deltas from a run that crashed before compaction
+        # (scraper, run_id) of every delta in the journal
+        self.deltas = set(journal.replay_journal(journal_path, self.existing_map))
+        self.replayed = len(self.deltas)
+
+    def merge(self, scraper_name: str, properties: List[Dict[str, Any]], today: str,
+              run_id: Optional[str] = None):
+        delta = merge_scraper_results(self.existing_map, properties, today)
+        journal.append_delta(self.journal_path, scraper_name, delta, run_id)
+        self.deltas.add((scraper_name, run_id))
+        return delta
+
+    def has_delta(self, scraper_name: str, run_id: Optional[str] = None) -> bool:
+        """True if the journal already holds the scraper's delta (of queued run ``run_id``)."""
+        return (scraper_name, run_id) in self.deltas
+
+    def apply_delta(self, scraper_name: str, rows: List[Dict[str, Any]]) -> None:
+        """Upsert already-classified rows as they are (used to replay a run)."""
+        for row in rows:
+            self.existing_map.upsert(row)
+        journal.append_delta(self.journal_path, scraper_name, rows)
+        self.deltas.add((scraper_name, None))
+
+    def finalize(self) -> bool:
+        if not self.existing_map:
+            return False
+        return journal.compact(
+            self.journal_path,
+            list(self.existing_map.values()),
+            filepath=self.csv_path
+        )
+
+    def close(self):
+        pass
+
+
+# ===================== SQLITE ===================== #
+
+def _to_text(value) -> str:
+    """Match what csv.DictWriter writes for a value (None -> '', else str())."""
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def _quote(column: str) -> str:
+    return '"' + column.replace('"', '""') + '"'
+
+
+class SQLiteListingStore:
+    """
+    SQLite-backed listing history.
+
+    STANDARD_COLUMNS are real TEXT columns; any other keys a scraper emits
+    are kept in a JSON ``extra`` column and exported after the standard
+    columns, like store_data_to_csv() does.
+    """
+
+    TABLE = "listings"
+
+    def __init__(self, db_path: str, csv_path: str):
+        self.db_path = db_path
+        self.csv_path = csv_path
+        self.replayed = 0
+
+        dir_path = os.path.dirname(db_path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        if self.is_empty() and os.path.exists(csv_path):
+            self.import_csv(csv_path)
+
+    def _create_schema(self):
+        columns = ", ".join(
+            f"{_quote(col)} TEXT NOT NULL DEFAULT ''"
+            for col in STANDARD_COLUMNS if col != "listingUrl"
+        )
+        with self.conn:
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+                f"listingUrl TEXT PRIMARY KEY, {columns}, "
+                f"extra TEXT NOT NULL DEFAULT '{{}}')"
+            )
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_agent "
+                f"ON {self.TABLE} (agentCompanyName)"
+            )
+            # Queued results merged, so a restarted collector skips them
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS merged_runs ("
+                "scraper TEXT NOT NULL, run_id TEXT NOT NULL, PRIMARY KEY (scraper, run_id))"
+            )
+
+    def is_empty(self) -> bool:
+        return self.conn.execute(f"SELECT 1 FROM {self.TABLE} LIMIT 1").fetchone() is None
+
+    def __len__(self):
+        return self.conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+
+    # ===================== ROW MAPPING ===================== #
+
+    def _row_values(self, row: Dict[str, Any]) -> list:
+        extra = {
+            key: _to_text(value) for key, value in row.items()
+            if key not in STANDARD_COLUMNS
+        }
+        values = [_to_text(row.get(col)) for col in STANDARD_COLUMNS]
+        values.append(json.dumps(extra, ensure_ascii=False, sort_keys=True))
+        return values
+
+    def _row_dict(self, values) -> Dict[str, Any]:
+        row = dict(zip(STANDARD_COLUMNS, values))
+        row.update(json.loads(values[-1] or "{}"))
+        return row
+
+    def _insert_sql(self, table: str, verb: str = "INSERT OR REPLACE") -> str:
+        columns = ", ".join(_quote(col) for col in STANDARD_COLUMNS) + ", extra"
+        marks = ", ".join("?" for _ in range(len(STANDARD_COLUMNS) + 1))
+        return f"{verb} INTO {table} ({columns}) VALUES ({marks})"
+
+    def _select_columns(self) -> str:
+        return ", ".join(_quote(col) for col in STANDARD_COLUMNS) + ", extra"
+
+    def _upsert_clause(self) -> str:
+        """Update in place on conflict so existing rows keep their export position."""
+        updates = ", ".join(
+            f"{_quote(col)} = excluded.{_quote(col)}"
+            for col in STANDARD_COLUMNS + ["extra"] if col != "listingUrl"
+        )
+        return f"ON CONFLICT (listingUrl) DO UPDATE SET {updates}"
+
+    # ===================== IMPORT / EXPORT ===================== #
+
+    def import_csv(self, csv_path: str) -> int:
+        """Bulk-load an existing website_data CSV (one-off bootstrap)."""
+        count = 0
+        with open(csv_path, "r", encoding="utf-8") as f, self.conn:
+            for row in csv.DictReader(f):
+                if not row.get("listingUrl"):
+                    continue
+                self.conn.execute(self._insert_sql(self.TABLE), self._row_values(row))
+                count += 1
+        print(f"Imported {count} rows from {csv_path} into {self.db_path}")
+        return count
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        cursor = self.conn.execute(
+            f"SELECT {self._select_columns()} FROM {self.TABLE} ORDER BY rowid"
+        )
+        for values in cursor:
+            yield self._row_dict(values)
+
+    def export_csv(self, filepath: str) -> bool:
+        """
+        Stream the store into a CSV with the STANDARD_COLUMNS layout.
+
+        Written to a temporary file and moved into place atomically.
+        """
+        extra_columns = set()
+        for (extra,) in self.conn.execute(f"SELECT DISTINCT extra FROM {self.TABLE}"):
+            extra_columns.update(json.loads(extra or "{}"))
+        all_columns = list(STANDARD_COLUMNS) + sorted(extra_columns - set(STANDARD_COLUMNS))
+
+        dir_path = os.path.dirname(filepath)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        tmp_path = filepath + ".tmp"
+        count = 0
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=all_columns, extrasaction="ignore")
+            writer.writeheader()
+            for row in self.iter_rows():
+                writer.writerow({col: row.get(col, "") for col in all_columns})
+                count += 1
+        os.replace(tmp_path, filepath)
+
+        print(f"Successfully stored {count} records to {filepath}")
+        return True
+
+    # ===================== MERGE ===================== #
+
+    def merge(self, scraper_name: str, properties: List[Dict[str, Any]], today: str,
+              run_id: Optional[str] = None):
+        """
+        Apply New/Old/Deleted for one scraper in a single transaction.
+
+        Same semantics as merge_scraper_results(): incoming URLs become New
+        or Old, every other URL held for the agency becomes Deleted.
+
+        Returns:
+            List of rows that were added or changed (the scraper's delta).
+        """
+        agent_name = properties[0].get("agentCompanyName", "")
+        incoming = "temp.incoming"
+
+        with self.conn:
+            self.conn.execute(f"DROP TABLE IF EXISTS {incoming}")
+            self.conn.execute(
+                f"CREATE TEMP TABLE incoming AS SELECT * FROM {self.TABLE} WHERE 0"
+            )
+            self.conn.execute("CREATE UNIQUE INDEX temp.idx_incoming ON incoming (listingUrl)")
+
+            for row in properties:
+                if not row.get("listingUrl"):
+                    continue
+                row["date"] = today
+                self.conn.execute(self._insert_sql(incoming), self._row_values(row))
+
+            # ---------------- HANDLE NEW / OLD ---------------- #
+
+            self.conn.execute(
+                f"UPDATE {incoming} SET status = CASE WHEN listingUrl IN "
+                f"(SELECT listingUrl FROM {self.TABLE}) THEN 'Old' ELSE 'New' END"
+            )
+
+            # ---------------- HANDLE DELETED ---------------- #
+
+            deleted_filter = (
+                f"agentCompanyName = ? AND listingUrl NOT IN "
+                f"(SELECT listingUrl FROM {incoming})"
+            )
+            self.conn.execute(
+                f"UPDATE {self.TABLE} SET status = 'Deleted', date = ? WHERE {deleted_filter}",
+                (today, agent_name),
+            )
+
+            self.conn.execute(
+                f"INSERT INTO {self.TABLE} ({self._select_columns()}) "
+                f"SELECT {self._select_columns()} FROM {incoming} WHERE true "
+                f"{self._upsert_clause()}"
+            )
+
+            delta = [
+                self._row_dict(values) for values in self.conn.execute(
+                    f"SELECT {self._select_columns()} FROM {incoming} ORDER BY rowid"
+                )
+            ]
+            delta.extend(
+                self._row_dict(values) for values in self.conn.execute(
+                    f"SELECT {self._select_columns()} FROM {self.TABLE} "
+                    f"WHERE status = 'Deleted' AND date = ? AND {deleted_filter}",
+                    (today, agent_name),
+                )
+            )
+            self.conn.execute(f"DROP TABLE {incoming}")
+            if run_id:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO merged_runs (scraper, run_id) VALUES (?, ?)",
+                    (scraper_name, run_id),
+                )
+
+        # Keep the caller's rows consistent with what was stored
+        status_by_url = {row["listingUrl"]: row["status"] for row in delta}
+        for row in properties:
+            url = row.get("listingUrl")
+            if url in status_by_url:
+                row["status"] = status_by_url[url]
+
+        return delta
+
+    def has_delta(self, scraper_name: str, run_id: Optional[str] = None) -> bool:
+        """
+        True if the scraper's delta (of queued run ``run_id``) is in the
+        database. Without a run id it always is: every merge is committed
+        before it is checkpointed.
+        """
+        if not run_id:
+            return True
+        return self.conn.execute(
+            "SELECT 1 FROM merged_runs WHERE scraper = ? AND run_id = ?", (scraper_name, run_id)
+        ).fetchone() is not None
+
+    def apply_delta(self, scraper_name: str, rows: List[Dict[str, Any]]) -> None:
+        """Upsert already-classified rows as they are (used to replay a run)."""
+        sql = self._insert_sql(self.TABLE, verb="INSERT") + " " + self._upsert_clause()
+        with self.conn:
+            for row in rows:
+                if row.get("listingUrl"):
+                    self.conn.execute(sql, self._row_values(row))
+
+    def finalize(self) -> bool:
+        if self.is_empty():
+            return False
+        return self.export_csv(self.csv_path)
+
+    def close(self):
+        self.conn.close()
+
+
+def open_store(kind: str, csv_path: str, journal_path: str, db_path: str):
+    """Return the listing store for ``kind`` ('csv' or 'sqlite')."""
+    if kind == "sqlite":
+        return SQLiteListingStore(db_path, csv_path)
+    if kind == "csv":
+        return CsvListingStore(csv_path, journal_path)
+    raise ValueError(f"Unknown listing store: {kind}")
@@ -0,0 +1,208 @@
+"""
+Replay the AJAX request behind a "load more" button over HTTP.
+
+A "load more" button usually posts the same request with an increasing
+page number and appends the HTML it gets back. Clicking through it in a
+browser loads the pages one after the other. ``LoadMoreEndpoint``
+declares that request: URL, method, fixed parameters and the paging
+parameters, each as an offset from the 1-based page number. All pages are
+then fetched concurrently:
+
+    endpoint = LoadMoreEndpoint(
+        "https://example.com/wp-admin/admin-ajax.php",
+        params={"action": "load_properties"},
+        page_params={"paged": 0},
+    )
+    for tree in endpoint.fetch_pages(session, range(1, pages + 1)):
+        ...
+
+When the request is not known in advance, ``capture_endpoint`` clicks the
+button twice in a browser started with ``performance_log=True`` and works
+the endpoint out from the two requests it made.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+from lxml import html
+
+from utils import waits
+from utils.network_capture import iter_json
+from utils.scroll_stream import click_load_more
+from utils.webdriver_pool import performance_log
+
+DEFAULT_WORKERS = 4
+
+
+# ===================== ENDPOINT ===================== #
+
+class LoadMoreEndpoint:
+    """
+    AJAX request behind a "load more" button.
+
+    Args:
+        url: Endpoint URL
+        params: Form (POST) or query (GET) parameters that don't change
+        page_params: Paging parameter names, each mapped to the offset
+            added to the 1-based page number, e.g. ``{"paged": -1}``
+        method: "POST" or "GET"
+        headers: Extra request headers
+        timeout: Request timeout in seconds
+    """
+
+    def __init__(self, url: str, params: Dict[str, str], page_params: Dict[str, int],
+                 method: str = "POST", headers: Optional[Dict[str, str]] = None, timeout: float = 20):
+        self.url = url
+        self.params = dict(params)
+        self.page_params = dict(page_params)
+        self.method = method.upper()
+        self.headers = {"X-Requested-With": "XMLHttpRequest", **(headers or {})}
+        self.timeout = timeout
+
+    def params_for(self, page: int) -> Dict[str, str]:
+        params = dict(self.params)
+        for name, offset in self.page_params.items():
+            params[name] = str(page + offset)
+        return params
+
+    def fetch_page(self, session, page: int):
+        """
+        The HTML fragment of ``page`` as an lxml tree, None if empty or
+        failed. ``session`` is utils.http_client, a BrowserSession or
+        anything else with requests-style get/post; the first two pace
+        their requests with the per-domain limiter.
+        """
+        params = self.params_for(page)
+        try:
+            if self.method == "GET":
+                response = session.get(self.url, params=params, headers=self.headers, timeout=self.timeout)
+            else:
+                response = session.post(self.url, data=params, headers=self.headers, timeout=self.timeout)
+        except Exception:
+            return None
+        if response is None or response.status_code != 200:
+            return None
+
+        fragment = _html_fragment(response.text)
+        if not fragment.strip():
+            return None
+        try:
+            return html.fromstring(fragment)
+        except Exception:
+            return None
+
+    def fetch_pages(self, session, pages: Iterable[int], workers: int = DEFAULT_WORKERS) -> List:
+        """fetch_page() for every page concurrently; trees in the order of ``pages``."""
+        pages = list(pages)
+        if not pages:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return list(executor.map(lambda page: self.fetch_page(session, page), pages))
+
+    def fetch_all(self, session, first_page: int = 1, workers: int = DEFAULT_WORKERS,
+                  max_pages: int = 100) -> List:
+        """
+        Fetch pages ``workers`` at a time when the page count is unknown,
+        until one comes back empty or repeats an earlier page.
+        """
+        trees = []
+        seen = set()
+        page = first_page
+        while page < first_page + max_pages:
+            batch = self.fetch_pages(session, range(page, page + workers), workers)
+            for tree in batch:
+                if tree is None:
+                    return trees
+                fingerprint = html.tostring(tree)
+                if fingerprint in seen:
+                    return trees
+                seen.add(fingerprint)
+                trees.append(tree)
+            page += workers
+        return trees
+
+
+def _html_fragment(text: str) -> str:
+    """HTML of a load-more response: the body itself, or the largest HTML string in its JSON."""
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return text
+    fragments = [
+        value for _, value in iter_json(payload)
+        if isinstance(value, str) and "<" in value
+    ]
+    return max(fragments, key=len, default="")
+
+
+# ===================== DISCOVERY ===================== #
+
+def _ajax_request(driver) -> Optional[Dict]:
+    """The last XHR/fetch request in the performance log since the last read."""
+    request = None
+    for entry in performance_log(driver):
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        params = message.get("params", {})
+        if message.get("method") == "Network.requestWillBeSent" and params.get("type") in ("XHR", "Fetch"):
+            request = params.get("request")
+    return request
+
+
+def _split_request(request: Dict) -> Tuple[str, Dict[str, str]]:
+    parts = urlsplit(request["url"])
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    if request.get("method", "GET").upper() != "GET":
+        params = dict(parse_qsl(request.get("postData") or "", keep_blank_values=True))
+        return request["url"], params
+    return urlunsplit(parts._replace(query="")), params
+
+
+def capture_endpoint(driver, load_more: str, next_page: int = 2) -> Optional[LoadMoreEndpoint]:
+    """
+    Click the "load more" button twice and return the endpoint behind it.
+
+    The paging parameters are the ones that went up by one between the two
+    requests. The driver must come from get_driver(performance_log=True);
+    both clicked pages stay loaded in it.
+
+    Args:
+        driver: Browser on the results page
+        load_more: CSS selector of the button
+        next_page: 1-based page number the first click loads
+    """
+    requests_made = []
+    performance_log(driver)
+    for _ in range(2):
+        if not click_load_more(driver, load_more):
+            return None
+        waits.network_idle(driver, timeout=15)
+        request = _ajax_request(driver)
+        if request is None:
+            return None
+        requests_made.append(request)
+
+    first, second = requests_made
+    url, first_params = _split_request(first)
+    second_url, second_params = _split_request(second)
+    if urlsplit(url).path != urlsplit(second_url).path:
+        return None
+
+    page_params = {}
+    for name, value in first_params.items():
+        other = second_params.get(name, "")
+        if value.isdigit() and other.isdigit() and int(other) == int(value) + 1:
+            page_params[name] = int(value) - next_page
+    if not page_params:
+        return None
+
+    params = {k: v for k, v in first_params.items() if k not in page_params}
+    headers = {
+        name: value for name, value in (first.get("headers") or {}).items()
+        if name.lower() in ("x-requested-with", "accept", "content-type", "x-wp-nonce")
+    }
+    headers["Referer"] = driver.current_url
+    return LoadMoreEndpoint(url, params, page_params, method=first.get("method", "POST"), headers=headers)
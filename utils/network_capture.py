@@ -0,0 +1,124 @@
+"""
+Capture the JSON a page loads over XHR/fetch.
+
+Single-page apps render their listings from JSON API responses; scraping
+the rendered DOM means scrolling, waiting for React and parsing HTML for
+data the browser already had as structured JSON. ``ResponseCapture`` reads
+the session's DevTools performance log, picks the responses whose URL and
+MIME type match, and returns their decoded bodies:
+
+    driver = get_driver(performance_log=True)
+    capture = ResponseCapture(driver, r"/api/search")
+    driver.get(search_url)
+    waits.network_idle(driver)
+    for url, payload in capture.poll():
+        ...
+
+Bodies are fetched with ``Network.getResponseBody``, so ``poll()`` has to
+run before the page navigates away or Chrome drops them.
+"""
+import base64
+import json
+import re
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from utils.webdriver_pool import performance_log
+
+
+# ===================== CAPTURE ===================== #
+
+class ResponseCapture:
+    """
+    JSON responses of a get_driver(performance_log=True) session.
+
+    Args:
+        driver: Session to watch
+        url_pattern: Regex searched in the response URL
+        mime_types: Substrings of the accepted MIME types
+    """
+
+    def __init__(self, driver, url_pattern: str = "", mime_types: Sequence[str] = ("json",)):
+        self.driver = driver
+        self.url_regex = re.compile(url_pattern)
+        self.mime_types = tuple(mime_types)
+        self._pending: Dict[str, str] = {}
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+        except Exception:
+            pass
+
+    def _matches(self, response: Dict) -> bool:
+        mime = (response.get("mimeType") or "").lower()
+        return bool(self.url_regex.search(response.get("url", ""))) and any(
+            m in mime for m in self.mime_types
+        )
+
+    def _body(self, request_id: str):
+        try:
+            body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except Exception:
+            # Evicted, or the page navigated away
+            return None
+        text = body.get("body", "")
+        if body.get("base64Encoded"):
+            text = base64.b64decode(text).decode("utf-8", "replace")
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+
+    def poll(self) -> List[Tuple[str, Any]]:
+        """(url, payload) of matching responses finished since the last call."""
+        results = []
+        for entry in performance_log(self.driver):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+
+            if method == "Network.responseReceived":
+                if self._matches(params.get("response", {})):
+                    self._pending[request_id] = params["response"]["url"]
+            elif method == "Network.loadingFinished" and request_id in self._pending:
+                url = self._pending.pop(request_id)
+                payload = self._body(request_id)
+                if payload is not None:
+                    results.append((url, payload))
+            elif method == "Network.loadingFailed":
+                self._pending.pop(request_id, None)
+        return results
+
+
+# ===================== PAYLOAD HELPERS ===================== #
+
+def iter_json(payload: Any) -> Iterator[Tuple[str, Any]]:
+    """Yield (key, value) for every value nested in ``payload``; list items get key ""."""
+    stack = [("", payload)]
+    while stack:
+        key, value = stack.pop()
+        yield key, value
+        if isinstance(value, dict):
+            stack.extend(reversed(list(value.items())))
+        elif isinstance(value, list):
+            stack.extend(("", item) for item in reversed(value))
+
+
+def find_strings(payload: Any, pattern: str) -> List[str]:
+    """String values in ``payload`` matching the regex ``pattern``, in document order."""
+    regex = re.compile(pattern)
+    return [
+        value for _, value in iter_json(payload)
+        if isinstance(value, str) and regex.search(value)
+    ]
+
+
+def find_number(payload: Any, keys: Sequence[str]) -> int:
+    """Largest integer stored under any of ``keys``, 0 if none."""
+    found = [
+        int(value) for key, value in iter_json(payload)
+        if key in keys and isinstance(value, (int, float)) and not isinstance(value, bool)
+    ]
+    return max(found, default=0)
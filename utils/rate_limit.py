@@ -0,0 +1,311 @@
+"""
+Adaptive per-domain rate limiting, shared by the HTTP and browser paths.
+
+Every request to a domain takes a token from that domain's bucket and one
+of its concurrency slots. Both limits adapt AIMD-style (additive increase,
+multiplicative decrease):
+
+- after ``INCREASE_AFTER`` healthy responses in a row the rate goes up by
+  ``RATE_STEP`` requests/s and concurrency by one
+- a throttling signal (429/503, a timeout, a challenge page, or a
+  response far slower than the domain's usual) halves both, once per
+  round of in-flight requests
+
+utils/http_client.py, BrowserSession and DetailFetcher go through the
+process-wide limiter on their own. Browser code that loads pages itself
+wraps each load:
+
+    with get_limiter().request(url) as ticket:
+        driver.get(url)
+        if is_challenge_page(driver.page_source):
+            ticket.outcome = THROTTLED
+
+Learned rates are saved per domain in website_data/domain_rates.json
+(master.py calls ``save_limiter`` after every scraper), so the next run
+starts where this one left off instead of relearning.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from utils.file_lock import file_lock
+
+OK = "ok"
+ERROR = "error"
+THROTTLED = "throttled"
+
+# Starting point for a domain never seen before
+INITIAL_RATE = float(os.environ.get("RATE_LIMIT_INITIAL_RATE", "2.0"))
+INITIAL_CONCURRENCY = int(os.environ.get("RATE_LIMIT_INITIAL_CONCURRENCY", "3"))
+
+# Bounds of what the limiter may learn
+MIN_RATE = 0.2
+MAX_RATE = float(os.environ.get("RATE_LIMIT_MAX_RATE", "10.0"))
+MAX_CONCURRENCY = int(os.environ.get("RATE_LIMIT_MAX_CONCURRENCY", "8"))
+
+# Additive increase after this many healthy responses in a row
+INCREASE_AFTER = 10
+RATE_STEP = 0.5
+
+# Multiplicative decrease on a throttling signal
+BACKOFF = 0.5
+
+# A response this many times slower than the domain's usual latency, and
+# slower than SLOW_FLOOR seconds, counts as throttling
+SLOW_FACTOR = 4.0
+SLOW_FLOOR = 2.0
+
+# Weight of the newest sample in the latency average
+LATENCY_WEIGHT = 0.2
+
+# Text found in bot-protection interstitials (Cloudflare, Incapsula, DataDome)
+CHALLENGE_MARKERS = (
+    "cf-chl",
+    "challenge-platform",
+    "<title>Just a moment...</title>",
+    "Attention Required! | Cloudflare",
+    "_Incapsula_Resource",
+    "captcha-delivery.com",
+)
+
+DEFAULT_PATH = os.environ.get(
+    "RATE_LIMIT_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                 "website_data", "domain_rates.json"),
+)
+
+
+def is_challenge_page(text: str) -> bool:
+    """True if the HTML ``text`` is a bot-protection page rather than content."""
+    head = (text or "")[:20000]
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+def is_challenge(response) -> bool:
+    """True if ``response`` is a bot-protection page rather than content."""
+    if "html" not in response.headers.get("Content-Type", "html"):
+        return False
+    return is_challenge_page(response.text)
+
+
+def outcome_of(status: int) -> str:
+    """Limiter outcome for an HTTP status code."""
+    if status in (429, 503):
+        return THROTTLED
+    if status >= 500:
+        return ERROR
+    return OK
+
+
+def retry_after(response) -> Optional[float]:
+    """Seconds from a Retry-After header, None if absent or a date."""
+    value = response.headers.get("Retry-After", "")
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+# ===================== DOMAIN ===================== #
+
+class Ticket:
+    """
+    One request through the limiter. Set ``outcome`` (OK by default) and,
+    for a 429 with Retry-After, ``pause`` before it is released.
+    """
+
+    def __init__(self, domain: str):
+        self.domain = domain
+        self.started = time.time()
+        self.outcome = OK
+        self.pause: Optional[float] = None
+
+
+class DomainLimit:
+    """Token bucket and concurrency limit of one domain."""
+
+    def __init__(self, rate: float = INITIAL_RATE, concurrency: int = INITIAL_CONCURRENCY,
+                 latency: Optional[float] = None):
+        self.rate = min(MAX_RATE, max(MIN_RATE, rate))
+        self.concurrency = min(MAX_CONCURRENCY, max(1, concurrency))
+        self.latency = latency
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._next_start = 0.0
+        self._healthy = 0
+        self._last_backoff = 0.0
+
+    def acquire(self, domain: str) -> Ticket:
+        return self.acquire_many(domain, 1)[0]
+
+    def acquire_many(self, domain: str, count: int) -> List[Ticket]:
+        """
+        Up to ``count`` tickets for requests sent together: waits for one
+        slot, then takes as many of the free ones as asked for.
+        """
+        with self._cond:
+            while self._in_flight >= self.concurrency:
+                self._cond.wait()
+            count = max(1, min(count, self.concurrency - self._in_flight))
+            self._in_flight += count
+
+            # Token bucket as a schedule: up to ``concurrency`` tokens may
+            # have built up while the domain was idle
+            now = time.time()
+            start = max(self._next_start, now - (self.concurrency - 1) / self.rate)
+            self._next_start = start + count / self.rate
+        last = start + (count - 1) / self.rate
+        if last > now:
+            time.sleep(last - now)
+        return [Ticket(domain) for _ in range(count)]
+
+    def release(self, ticket: Ticket) -> None:
+        elapsed = time.time() - ticket.started
+        with self._cond:
+            self._in_flight -= 1
+            outcome = ticket.outcome
+            slow = self.latency and elapsed > max(SLOW_FLOOR, SLOW_FACTOR * self.latency)
+            if outcome == OK and slow:
+                outcome = THROTTLED
+
+            if outcome == THROTTLED:
+                self._healthy = 0
+                # Requests already in flight when we backed off report the
+                # same congestion; count it once
+                if ticket.started >= self._last_backoff:
+                    self.rate = max(MIN_RATE, self.rate * BACKOFF)
+                    self.concurrency = max(1, int(self.concurrency * BACKOFF))
+                    self._last_backoff = time.time()
+                if ticket.pause:
+                    self._next_start = max(self._next_start, time.time() + ticket.pause)
+            elif outcome == OK:
+                self.latency = elapsed if self.latency is None else (
+                    (1 - LATENCY_WEIGHT) * self.latency + LATENCY_WEIGHT * elapsed
+                )
+                self._healthy += 1
+                if self._healthy >= INCREASE_AFTER:
+                    self._healthy = 0
+                    self.rate = min(MAX_RATE, self.rate + RATE_STEP)
+                    self.concurrency = min(MAX_CONCURRENCY, self.concurrency + 1)
+            else:
+                self._healthy = 0
+            self._cond.notify_all()
+
+    def state(self) -> Dict:
+        with self._cond:
+            return {
+                "rate": round(self.rate, 3),
+                "concurrency": self.concurrency,
+                "latency": round(self.latency, 3) if self.latency else None,
+            }
+
+
+# ===================== LIMITER ===================== #
+
+class RateLimiter:
+    """
+    Per-domain limits, learned and stored as JSON:
+    {domain: {"rate": requests/s, "concurrency": n, "latency": s, "updated": date}}.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._saved = self._load()
+        self._domains: Dict[str, DomainLimit] = {}
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable domain rates {self.path}: {e}")
+            return {}
+
+    def domain(self, url: str) -> DomainLimit:
+        domain = urlparse(url).netloc or url
+        with self._lock:
+            if domain not in self._domains:
+                saved = self._saved.get(domain, {})
+                self._domains[domain] = DomainLimit(
+                    rate=saved.get("rate", INITIAL_RATE),
+                    concurrency=saved.get("concurrency", INITIAL_CONCURRENCY),
+                    latency=saved.get("latency"),
+                )
+            return self._domains[domain]
+
+    def acquire(self, url: str) -> Ticket:
+        """Wait for a slot and a token of the URL's domain."""
+        domain = urlparse(url).netloc or url
+        return self.domain(url).acquire(domain)
+
+    def acquire_many(self, url: str, count: int) -> List[Ticket]:
+        """Tickets for up to ``count`` requests to the URL's domain sent at once."""
+        domain = urlparse(url).netloc or url
+        return self.domain(url).acquire_many(domain, count)
+
+    def release(self, ticket: Ticket) -> None:
+        self.domain(ticket.domain).release(ticket)
+
+    @contextmanager
+    def request(self, url: str) -> Iterator[Ticket]:
+        """
+        acquire() and release() around a block. An exception from the block
+        counts as a timeout (THROTTLED) or an error, and is re-raised.
+        """
+        ticket = self.acquire(url)
+        try:
+            yield ticket
+        except Exception as e:
+            # requests.Timeout, selenium's TimeoutException, socket.timeout
+            ticket.outcome = THROTTLED if "timeout" in type(e).__name__.lower() else ERROR
+            raise
+        finally:
+            self.release(ticket)
+
+    def save(self) -> None:
+        """Write our domains back, keeping what other processes saved meanwhile."""
+        with self._lock:
+            if not self._domains:
+                return
+            today = datetime.now().strftime("%Y-%m-%d")
+            # Other processes save the same file; hold the lock from read to replace
+            with file_lock(self.path):
+                on_disk = self._load()
+                for domain, limit in self._domains.items():
+                    on_disk[domain] = {**limit.state(), "updated": today}
+
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(on_disk, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.path)
+
+
+_LIMITER = None
+_LIMITER_LOCK = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    global _LIMITER
+    with _LIMITER_LOCK:
+        if _LIMITER is None:
+            _LIMITER = RateLimiter()
+            # Fallback for in-process use; supervised children are killed
+            # before atexit handlers run, so master saves explicitly
+            atexit.register(_LIMITER.save)
+        return _LIMITER
+
+
+def save_limiter() -> None:
+    """Write the rates this process learned, if it made any request."""
+    if _LIMITER is not None:
+        _LIMITER.save()
@@ -0,0 +1,89 @@
+"""
+Run manifest for checkpoint/resume of master runs.
+
+The manifest is an append-only JSON-lines file. The first line holds the
+run date; every scraper that is merged successfully appends one line with
+its row count and its delta (the rows it added or changed). If the master
+dies part-way, ``master.py --resume`` reads the manifest, replays the
+recorded deltas into the listing store and only runs the scrapers that are
+not in it yet. A run that reaches the end is marked finished.
+"""
+import json
+import os
+from typing import List, Dict, Any, Optional
+
+
+class RunManifest:
+    """Completed scrapers of one master run, keyed by scraper name."""
+
+    def __init__(self, path: str, run_date: str):
+        self.path = path
+        self.run_date = run_date
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.finished = False
+
+    # ===================== LOAD / START ===================== #
+
+    @classmethod
+    def load(cls, path: str) -> Optional["RunManifest"]:
+        """Read an existing manifest, or return None if there is none."""
+        if not os.path.exists(path):
+            return None
+
+        manifest = None
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Truncated last line from a crash mid-write
+                    continue
+                if manifest is None:
+                    manifest = cls(path, record.get("run_date", ""))
+                    continue
+                if record.get("finished"):
+                    manifest.finished = True
+                    continue
+                manifest.completed[record["scraper"]] = record
+
+        return manifest
+
+    @classmethod
+    def start(cls, path: str, run_date: str) -> "RunManifest":
+        """Begin a fresh manifest, discarding the previous run's."""
+        dir_path = os.path.dirname(path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        manifest = cls(path, run_date)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"run_date": run_date}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return manifest
+
+    # ===================== RECORD ===================== #
+
+    def record(self, scraper_name: str, row_count: int, delta: List[Dict[str, Any]]) -> None:
+        """Mark a scraper as completed, together with its delta."""
+        record = {"scraper": scraper_name, "rows": row_count, "delta": delta}
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed[scraper_name] = record
+
+    def finish(self) -> None:
+        """Mark the run as finished so ``--resume`` starts a new one."""
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"finished": True}) + "\n")
+        self.finished = True
+
+    def is_completed(self, scraper_name: str) -> bool:
+        return scraper_name in self.completed
+
+    def total_rows(self) -> int:
+        return sum(record.get("rows", 0) for record in self.completed.values())
@@ -0,0 +1,93 @@
+"""
+Per-scraper runtime history and longest-processing-time-first scheduling.
+
+With several workers the order in which scrapers are started decides the
+makespan: a slow scraper started last keeps the run going long after the
+other workers are idle. The master records how long each scraper took and
+starts the expensive ones first (LPT). Scrapers without history keep
+their helper.SCRAPERS order.
+"""
+import heapq
+import json
+import os
+from statistics import median
+from typing import List, Dict, Optional
+
+# Number of recent runs kept per scraper
+HISTORY_SIZE = 5
+
+
+class RuntimeHistory:
+    """Runtime history stored as JSON: {scraper_name: [seconds, ...]}."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.runs: Dict[str, List[float]] = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.runs = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable runtime history {path}: {e}")
+
+    def expected(self, scraper_name: str) -> Optional[float]:
+        """Median of the recent runs, or None without history."""
+        runs = self.runs.get(scraper_name)
+        return median(runs) if runs else None
+
+    def estimates(self, scraper_names: List[str], defaults: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """
+        Expected duration for every scraper.
+
+        Scrapers without history use ``defaults`` (e.g. the registry's
+        expected cost) or else the median of the known ones, so a cold
+        start without defaults falls back to list order.
+        """
+        defaults = defaults or {}
+        known = [e for e in (self.expected(n) for n in scraper_names) if e is not None]
+        fallback = median(known) if known else 0.0
+        estimates = {}
+        for name in scraper_names:
+            expected = self.expected(name)
+            if expected is None:
+                expected = defaults.get(name, fallback)
+            estimates[name] = expected
+        return estimates
+
+    def record(self, scraper_name: str, seconds: float) -> None:
+        runs = self.runs.setdefault(scraper_name, [])
+        runs.append(round(seconds, 1))
+        del runs[:-HISTORY_SIZE]
+
+    def save(self) -> None:
+        dir_path = os.path.dirname(self.path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.runs, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def schedule_lpt(scraper_names: List[str], estimates: Dict[str, float]) -> List[str]:
+    """Order scrapers longest expected runtime first (stable on ties)."""
+    return sorted(scraper_names, key=lambda name: -estimates.get(name, 0.0))
+
+
+def predict_makespan(scraper_names: List[str], estimates: Dict[str, float], workers: int) -> float:
+    """
+    Simulate dispatching ``scraper_names`` in order to ``workers`` workers,
+    each taking the next scraper as soon as it is free.
+    """
+    loads = [0.0] * max(1, workers)
+    for name in scraper_names:
+        heapq.heapreplace(loads, loads[0] + estimates.get(name, 0.0))
+    return max(loads)
+
+
+def format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{secs:02d}s" if hours else f"{minutes}m{secs:02d}s"
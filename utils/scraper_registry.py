@@ -0,0 +1,95 @@
+"""
+Declarative scraper registry.
+
+Each scraper is described once in helper.py by a ScraperSpec: its module,
+its class, the engine it needs, the domains it talks to and a rough
+expected cost. The master uses the spec to import the module only when
+the scraper is dispatched, to route HTTP/API scrapers to lightweight
+workers that never load selenium, and as the cold-start runtime estimate.
+"""
+import importlib
+from dataclasses import dataclass, field
+from typing import Tuple
+
+# Engines
+HTTP = "http"          # plain requests + lxml/bs4
+API = "api"            # JSON endpoints over requests
+SELENIUM = "selenium"  # needs a Chrome session
+
+ENGINES = (HTTP, API, SELENIUM)
+
+# Default expected cost (seconds) per engine when a spec gives none
+DEFAULT_COST = {
+    HTTP: 120,
+    API: 120,
+    SELENIUM: 600,
+}
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    """Description of one scraper module under scrapers/."""
+
+    name: str
+    class_name: str
+    engine: str
+    domains: Tuple[str, ...] = field(default_factory=tuple)
+    cost: int = 0
+
+    def __post_init__(self):
+        if self.engine not in ENGINES:
+            raise ValueError(f"{self.name}: unknown engine {self.engine!r}")
+        if not self.cost:
+            object.__setattr__(self, "cost", DEFAULT_COST[self.engine])
+
+    @property
+    def module(self) -> str:
+        return f"scrapers.{self.name}"
+
+    @property
+    def needs_browser(self) -> bool:
+        return self.engine == SELENIUM
+
+    def load(self):
+        """Import the scraper module and return its class (lazy import)."""
+        module = importlib.import_module(self.module)
+        return getattr(module, self.class_name)
+
+
+class ScraperRegistry:
+    """Ordered collection of ScraperSpecs, addressable by name."""
+
+    def __init__(self, specs):
+        self._specs = {}
+        for spec in specs:
+            if spec.name in self._specs:
+                raise ValueError(f"Duplicate scraper in registry: {spec.name}")
+            self._specs[spec.name] = spec
+
+    def __iter__(self):
+        return iter(self._specs.values())
+
+    def __len__(self):
+        return len(self._specs)
+
+    def __contains__(self, name):
+        return name in self._specs
+
+    def get(self, name: str) -> ScraperSpec:
+        """
+        Return the spec for ``name``.
+
+        Names missing from the registry fall back to the historical
+        convention (snake_case module -> TitleCaseScraper class, Selenium).
+        """
+        spec = self._specs.get(name)
+        if spec is None:
+            class_name = ''.join(word.title() for word in name.split('_')) + 'Scraper'
+            spec = ScraperSpec(name, class_name, SELENIUM)
+        return spec
+
+    def names(self):
+        return list(self._specs)
+
+    def costs(self):
+        return {spec.name: float(spec.cost) for spec in self}
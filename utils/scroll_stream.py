@@ -0,0 +1,147 @@
+"""
+Infinite-scroll and "load more" engine driven by DOM mutations.
+
+Scrapers scrolled or clicked "load more", slept, re-parsed the whole page
+and counted cards until a few rounds brought nothing new. ``stream_cards``
+installs a MutationObserver that queues every card as it is added to the
+page, and yields each one (as an lxml element) as soon as its batch has
+settled, so the scraper can start on detail pages while loading goes on:
+
+    for card in stream_cards(driver, "div.property-card", load_more="#load-more"):
+        url = card.xpath(".//a/@href")[0]
+        futures.append(executor.submit(self.parse_listing, url))
+
+Loading is finished when the "load more" button is gone, or when
+``stall_rounds`` scrolls/clicks in a row add no card. Between yields the
+generator leaves the browser alone, but the consumer must not navigate
+this driver until it stops iterating.
+"""
+import time
+from typing import Iterator, Optional
+
+from lxml import html
+from selenium.common.exceptions import WebDriverException
+
+from utils.waits import POLL_INTERVAL
+
+# A batch of new cards is handed out once the DOM was quiet this long (ms)
+SETTLE_MS = 300
+
+_STREAM_JS = """
+var selector = arguments[0], settleMs = arguments[1], flush = arguments[2];
+var state = window.__cardStream;
+if (!state || state.selector !== selector) {
+    state = window.__cardStream = {
+        selector: selector, queue: [], seen: new WeakSet(), last: performance.now()
+    };
+    var collect = function (root) {
+        if (root.nodeType !== 1) return;
+        var found = root.matches(selector) ? [root] : [];
+        root.querySelectorAll(selector).forEach(function (el) { found.push(el); });
+        found.forEach(function (el) {
+            if (!state.seen.has(el)) {
+                state.seen.add(el);
+                state.queue.push(el);
+            }
+        });
+    };
+    collect(document.documentElement);
+    new MutationObserver(function (mutations) {
+        state.last = performance.now();
+        mutations.forEach(function (m) { m.addedNodes.forEach(collect); });
+    }).observe(document, {childList: true, subtree: true});
+}
+var quietMs = performance.now() - state.last;
+var cards = flush || quietMs >= settleMs
+    ? state.queue.splice(0).map(function (el) { return el.outerHTML; })
+    : [];
+return [cards, quietMs, state.queue.length];
+"""
+
+_LOAD_MORE_JS = """
+var button = document.querySelector(arguments[0]);
+if (!button || button.disabled || button.offsetParent === null) return false;
+button.scrollIntoView({block: 'center'});
+button.click();
+return true;
+"""
+
+_SCROLL_JS = "window.scrollTo(0, document.body.scrollHeight); return true;"
+
+
+def click_load_more(driver, selector: str, wait: float = 1.5) -> bool:
+    """
+    Click the "load more" button matching the CSS ``selector``, waiting up
+    to ``wait`` seconds for it to be clickable. False if it never was.
+    """
+    deadline = time.time() + wait
+    while True:
+        try:
+            if driver.execute_script(_LOAD_MORE_JS, selector):
+                return True
+        except WebDriverException:
+            return False
+        # The button may still be disabled from the previous click
+        if time.time() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+
+
+def _trigger(driver, load_more: Optional[str], wait: float) -> bool:
+    """Ask the page for more cards; False if there is no way to."""
+    if load_more:
+        return click_load_more(driver, load_more, wait)
+    try:
+        return bool(driver.execute_script(_SCROLL_JS))
+    except WebDriverException:
+        return False
+
+
+def stream_cards(driver, card_selector: str, load_more: Optional[str] = None, quiet: float = 1.5,
+                 timeout: float = 20.0, max_rounds: int = 40, stall_rounds: int = 2) -> Iterator:
+    """
+    Yield every card on the current page, loading more until there are none.
+
+    Args:
+        driver: Browser already on the results page
+        card_selector: CSS selector of one card
+        load_more: CSS selector of the "load more" button; the page is
+            scrolled to the bottom instead when not given
+        quiet: Seconds without DOM changes after which a round that
+            brought no card is over
+        timeout: Longest a single round may take; cards still queued
+            then are yielded even if the page is not quiet
+        max_rounds: Most scrolls/clicks
+        stall_rounds: Rounds in a row without new cards that end loading
+    """
+    stalled = 0
+    for round_number in range(max_rounds + 1):
+        started = time.time()
+        new_cards = 0
+        while True:
+            # A page that never stops mutating (carousel, ads, chat widget)
+            # never settles: when the round times out, take the queue anyway
+            timed_out = time.time() - started > timeout
+            try:
+                cards, quiet_ms, queued = driver.execute_script(
+                    _STREAM_JS, card_selector, SETTLE_MS, timed_out
+                )
+            except WebDriverException:
+                return
+            for card_html in cards:
+                new_cards += 1
+                yield html.fragment_fromstring(card_html)
+
+            # Quiet time only counts from the start of the round
+            quiet_ms = min(quiet_ms, (time.time() - started) * 1000)
+            if new_cards and not queued and quiet_ms >= SETTLE_MS:
+                break
+            if quiet_ms >= quiet * 1000 or timed_out:
+                break
+            time.sleep(POLL_INTERVAL)
+
+        stalled = 0 if new_cards else stalled + 1
+        if stalled >= stall_rounds or round_number == max_rounds:
+            return
+        if not _trigger(driver, load_more, wait=quiet):
+            return
@@ -0,0 +1,174 @@
+"""
+Sharded master runs across several machines.
+
+``master.py --shard i/N`` runs only the i-th of N deterministic shards of
+the registry and writes each scraper's raw results to a shard file instead
+of touching the listing store. The New/Old/Deleted classification needs the
+full history, so it is applied later, in one place, by
+``master.py --merge-shards FILE ...``. Each agency belongs to exactly one
+shard, so merging the shard files one scraper at a time gives the same
+result as a single-process run.
+
+Shards are balanced greedily by expected runtime (longest first onto the
+least-loaded shard). Every host must use the same registry and runtime
+history to compute the same assignment. Each shard file records its
+assignment key and its scrapers: a shard continued later (e.g. after a
+merge updated the runtime history) keeps its original scrapers, and
+``--merge-shards`` refuses shards of one run whose keys disagree.
+"""
+import hashlib
+import heapq
+import json
+import os
+from typing import List, Dict, Any, Iterator, Tuple
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse 'i/N' (1-based) into (i, N)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got {value!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index out of range: {value!r}")
+    return index, count
+
+
+def assign_shards(scraper_names: List[str], estimates: Dict[str, float], count: int) -> List[List[str]]:
+    """
+    Split scrapers into ``count`` shards with similar expected runtime.
+
+    Deterministic: ties are broken by scraper name, shard size and index.
+    """
+    shards: List[List[str]] = [[] for _ in range(count)]
+    # (expected load, number of scrapers, shard index)
+    loads = [(0.0, 0, i) for i in range(count)]
+    ordered = sorted(scraper_names, key=lambda name: (-estimates.get(name, 0.0), name))
+    for name in ordered:
+        load, size, i = heapq.heappop(loads)
+        shards[i].append(name)
+        heapq.heappush(loads, (load + estimates.get(name, 0.0), size + 1, i))
+    return shards
+
+
+def assignment_key(shards: List[List[str]]) -> str:
+    """Short fingerprint of a shard assignment, to compare across hosts."""
+    payload = json.dumps(shards, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:10]
+
+
+def shard_file_name(directory: str, index: int, count: int, run_date: str) -> str:
+    return os.path.join(directory, f"{run_date}_shard-{index}-of-{count}.jsonl")
+
+
+# ===================== SHARD FILES ===================== #
+
+class ShardResultWriter:
+    """Append-only JSON-lines file of one shard's scraper results."""
+
+    def __init__(self, path: str, index: int, count: int, run_date: str, key: str,
+                 scrapers: List[str]):
+        self.path = path
+        self.done = set()
+        self.key = key
+        self.scrapers = list(scrapers)
+
+        dir_path = os.path.dirname(path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        if os.path.exists(path):
+            # Continue a shard that was interrupted, with its own assignment
+            header, records = read_shard_file(path)
+            self.done = {record["scraper"] for record in records if not record.get("error")}
+            if header.get("assignment") != key:
+                if "scrapers" not in header:
+                    raise ValueError(
+                        f"{path} was written for assignment {header.get('assignment')}, "
+                        f"not {key}, and does not list its scrapers"
+                    )
+                self.key = header["assignment"]
+                self.scrapers = header["scrapers"]
+            return
+
+        header = {"shard": index, "of": count, "run_date": run_date, "assignment": key,
+                  "scrapers": self.scrapers}
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+
+    def append(self, scraper_name: str, properties: List[Dict[str, Any]], error, seconds: float) -> None:
+        record = {
+            "scraper": scraper_name,
+            "properties": properties,
+            "error": error,
+            "seconds": round(seconds, 1),
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if not error:
+            self.done.add(scraper_name)
+
+
+def read_shard_file(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Return (header, records) of a shard file; a truncated last line is ignored."""
+    header: Dict[str, Any] = {}
+    records: List[Dict[str, Any]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not header:
+                header = record
+            else:
+                records.append(record)
+    return header, records
+
+
+def iter_shard_results(paths: List[str]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Yield (header, record) for every scraper across the given shard files.
+
+    If a scraper appears more than once (a shard was re-run), its last
+    successful record is kept. Warns about shards missing from an N-way set.
+
+    Raises:
+        ValueError: if shards of one run were split with different
+            assignments, so agencies would be skipped or merged twice
+    """
+    latest: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+    seen_shards = {}
+    keys = {}
+
+    for path in paths:
+        header, records = read_shard_file(path)
+        run = (header.get("run_date"), header.get("of"))
+        seen_shards.setdefault(run, set()).add(header.get("shard"))
+        keys.setdefault(run, {}).setdefault(header.get("assignment"), []).append(path)
+        for record in records:
+            previous = latest.get(record["scraper"])
+            if previous and record.get("error") and not previous[1].get("error"):
+                continue
+            latest[record["scraper"]] = (header, record)
+
+    for (run_date, count), by_key in keys.items():
+        if len(by_key) > 1:
+            detail = "; ".join(f"{key}: {', '.join(files)}" for key, files in by_key.items())
+            raise ValueError(
+                f"Shards of run {run_date} ({count}-way) disagree on the assignment "
+                f"({detail}); re-run them with the same registry and runtime history"
+            )
+
+    for (run_date, count), indexes in seen_shards.items():
+        missing = sorted(set(range(1, (count or 0) + 1)) - indexes)
+        if missing:
+            print(f"Warning: run {run_date} is missing shard(s) {missing} of {count}; "
+                  f"their agencies are left unchanged")
+
+    return iter(latest.values())
@@ -0,0 +1,181 @@
+"""
+Run a scraper in a supervised child process.
+
+The child gets its own process group/session, so chromedriver and Chrome
+started by the scraper are its descendants and can be killed together.
+The supervisor enforces:
+
+- a wall-clock budget per scraper (hard timeout), and
+- a heartbeat timeout: the child counts as hung when it has written no
+  output and called no ``heartbeat()`` for ``hang_timeout`` seconds.
+
+Whatever happens, the child's whole process tree is killed afterwards, so
+a scraper that forgot ``driver.quit()`` cannot leave Chrome behind.
+"""
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+import traceback
+
+_CTX = multiprocessing.get_context("spawn")
+
+# Set in the child process only
+_HEARTBEAT = None
+
+
+def heartbeat():
+    """
+    Record progress for the supervisor.
+
+    Scrapers and shared helpers may call this during long steps that print
+    nothing. It is a no-op when not running under the supervisor.
+    """
+    if _HEARTBEAT is not None:
+        _HEARTBEAT.value = time.time()
+
+
+class _HeartbeatStream:
+    """Wraps stdout/stderr so that any output counts as a heartbeat."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, data):
+        heartbeat()
+        return self._stream.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+# ===================== CHILD ===================== #
+
+def _child_main(target, args, conn, heartbeat_value):
+    global _HEARTBEAT
+    _HEARTBEAT = heartbeat_value
+
+    if hasattr(os, "setsid"):
+        os.setsid()
+
+    sys.stdout = _HeartbeatStream(sys.stdout)
+    sys.stderr = _HeartbeatStream(sys.stderr)
+    heartbeat()
+
+    try:
+        result = target(*args)
+    except BaseException:
+        result = (args[0] if args else "", [], traceback.format_exc())
+
+    try:
+        conn.send(result)
+    finally:
+        conn.close()
+        sys.stdout.flush()
+
+
+# ===================== CLEANUP ===================== #
+
+def kill_process_tree(pid, grace=5.0, reap=None):
+    """
+    Terminate ``pid`` and every process it started.
+
+    On POSIX the child runs in its own session, so its process group id is
+    its pid; SIGTERM the group, then SIGKILL whatever is left. ``reap`` is
+    called while waiting so the caller can collect its own exited child,
+    which would otherwise keep the group alive as a zombie.
+    """
+    if os.name == "nt":
+        subprocess.run(
+            ["taskkill", "/T", "/F", "/PID", str(pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return
+
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(pid, sig)
+        except (ProcessLookupError, PermissionError):
+            return
+        deadline = time.time() + grace
+        while time.time() < deadline:
+            if reap is not None:
+                reap()
+            try:
+                os.killpg(pid, 0)
+            except (ProcessLookupError, PermissionError):
+                return
+            time.sleep(0.1)
+
+
+# ===================== SUPERVISOR ===================== #
+
+def run_supervised(target, args=(), budget=3600, hang_timeout=600, poll_interval=1.0):
+    """
+    Run ``target(*args)`` in a child process under a watchdog.
+
+    ``target`` must be importable (module-level) and return a
+    (scraper_name, properties, error) tuple like master.run_scraper().
+
+    Args:
+        target: Function to run in the child
+        args: Positional arguments; args[0] is the scraper name
+        budget: Wall-clock limit in seconds (None for no limit)
+        hang_timeout: Seconds without a heartbeat before the child is
+            considered hung (None to disable)
+        poll_interval: How often the supervisor checks the child
+
+    Returns:
+        Tuple of (scraper_name, properties, error)
+    """
+    name = args[0] if args else getattr(target, "__name__", "")
+    heartbeat_value = _CTX.Value("d", time.time(), lock=False)
+    parent_conn, child_conn = _CTX.Pipe(duplex=False)
+
+    process = _CTX.Process(
+        target=_child_main,
+        args=(target, args, child_conn, heartbeat_value),
+        name=f"scraper-{name}",
+    )
+    process.start()
+    child_conn.close()
+
+    started = time.time()
+    result = None
+    error = None
+
+    try:
+        while True:
+            # Receive before join: a large payload would otherwise block the child
+            if parent_conn.poll(poll_interval):
+                try:
+                    result = parent_conn.recv()
+                except EOFError:
+                    error = f"Process exited with code {process.exitcode} without a result"
+                break
+
+            if not process.is_alive():
+                if parent_conn.poll(0):
+                    continue
+                error = f"Process exited with code {process.exitcode} without a result"
+                break
+
+            now = time.time()
+            if budget and now - started > budget:
+                error = f"Timed out after {budget}s wall-clock budget"
+                break
+            if hang_timeout and now - heartbeat_value.value > hang_timeout:
+                error = f"Hung: no heartbeat for {hang_timeout}s"
+                break
+    finally:
+        if process.pid is not None:
+            kill_process_tree(process.pid, reap=lambda: process.join(0))
+        process.join(timeout=5)
+        parent_conn.close()
+
+    if result is not None:
+        return result
+    return name, [], error
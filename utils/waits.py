@@ -0,0 +1,213 @@
+"""
+Condition-based waits for the Selenium scrapers.
+
+Scrapers used fixed ``time.sleep()`` calls to let pages render, lazy
+loaders fire and new tabs open. A fixed sleep is either too short (flaky)
+or too long (wasted wall-clock on every page). These helpers return as
+soon as the page is actually ready:
+
+- ``dom_stable``: no DOM mutations for ``quiet`` seconds
+- ``network_idle``: no fetch/XHR in flight and no new resources for ``quiet`` seconds
+- ``count_increased``: more elements match a locator than before
+- ``load_more_finished``: new items arrived and settled, or the network
+  went idle without any (nothing more to load)
+- ``new_window``: a new tab/window opened
+- ``until``: any other condition
+
+Every helper takes ``replaces=``, the fixed sleep it stands in for, so
+``take_wait_report()`` can tell how much time the old sleeps cost compared
+with the time actually spent waiting.
+"""
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+Locator = Tuple[str, str]
+
+# How often conditions are re-checked (seconds)
+POLL_INTERVAL = 0.1
+
+_DOM_QUIET_JS = """
+var state = window.__scraperMutations;
+if (!state) {
+    state = window.__scraperMutations = {last: performance.now()};
+    new MutationObserver(function () { state.last = performance.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return [document.readyState, performance.now() - state.last];
+"""
+
+_NETWORK_QUIET_JS = """
+var state = window.__scraperNetwork;
+if (!state) {
+    state = window.__scraperNetwork = {pending: 0, last: performance.now(), resources: -1};
+    var done = function () {
+        state.pending = Math.max(0, state.pending - 1);
+        state.last = performance.now();
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            state.pending++;
+            state.last = performance.now();
+            return fetch.apply(this, arguments).finally(done);
+        };
+    }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        state.last = performance.now();
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+}
+var resources = performance.getEntriesByType('resource').length;
+if (resources !== state.resources) {
+    state.resources = resources;
+    state.last = performance.now();
+}
+return [document.readyState, state.pending, performance.now() - state.last];
+"""
+
+_lock = threading.Lock()
+_report = {"waits": 0, "waited": 0.0, "replaced": 0.0}
+
+
+# ===================== REPORT ===================== #
+
+def _record(started: float, replaces: float) -> None:
+    with _lock:
+        _report["waits"] += 1
+        _report["waited"] += time.time() - started
+        _report["replaced"] += replaces
+
+
+def take_wait_report() -> Dict[str, float]:
+    """
+    Waits since the last call: how many, seconds actually waited and
+    seconds the fixed sleeps they replace would have taken.
+    """
+    global _report
+    with _lock:
+        report, _report = _report, {"waits": 0, "waited": 0.0, "replaced": 0.0}
+    return report
+
+
+# ===================== WAITS ===================== #
+
+def _until(driver, condition, timeout: float) -> bool:
+    def check(d):
+        try:
+            return condition(d)
+        except WebDriverException:
+            # e.g. the page navigated while the script was running
+            return False
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(check)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _count(driver, locator: Locator) -> int:
+    return len(driver.find_elements(*locator))
+
+
+def _quiet_ms(measured_ms: float, started: float) -> float:
+    # Quiet time only counts from the start of the wait, so a wait made
+    # right after a scroll or click gives the page time to react to it
+    return min(measured_ms, (time.time() - started) * 1000)
+
+
+def _wait_dom_stable(driver, quiet: float, timeout: float) -> bool:
+    started = time.time()
+
+    def stable(d):
+        ready_state, quiet_ms = d.execute_script(_DOM_QUIET_JS)
+        return ready_state != "loading" and _quiet_ms(quiet_ms, started) >= quiet * 1000
+
+    return _until(driver, stable, timeout)
+
+
+def dom_stable(driver, quiet: float = 0.5, timeout: float = 10.0, replaces: float = 0.0) -> bool:
+    """Wait until the document has loaded and the DOM stopped changing."""
+    started = time.time()
+    result = _wait_dom_stable(driver, quiet, timeout)
+    _record(started, replaces)
+    return result
+
+
+def network_idle(driver, quiet: float = 0.5, timeout: float = 15.0, replaces: float = 0.0) -> bool:
+    """
+    Wait until no fetch/XHR is in flight and no resource finished loading
+    for ``quiet`` seconds.
+
+    Requests already running when the first check is made are only seen
+    through the Resource Timing entries they add when they finish.
+    """
+    started = time.time()
+
+    def idle(d):
+        ready_state, pending, quiet_ms = d.execute_script(_NETWORK_QUIET_JS)
+        return ready_state != "loading" and pending == 0 and _quiet_ms(quiet_ms, started) >= quiet * 1000
+
+    result = _until(driver, idle, timeout)
+    _record(started, replaces)
+    return result
+
+
+def count_increased(driver, locator: Locator, previous: int, timeout: float = 10.0,
+                    replaces: float = 0.0) -> int:
+    """Wait until more than ``previous`` elements match ``locator``; return the count."""
+    started = time.time()
+    _until(driver, lambda d: _count(d, locator) > previous, timeout)
+    _record(started, replaces)
+    return _count(driver, locator)
+
+
+def load_more_finished(driver, locator: Locator, previous: int, timeout: float = 15.0,
+                       quiet: float = 1.0, replaces: float = 0.0) -> int:
+    """
+    Wait for a scroll or "load more" click to finish.
+
+    Returns as soon as new items have arrived and the DOM settled, or the
+    network has been idle for ``quiet`` seconds without new items. Returns
+    the item count.
+    """
+    started = time.time()
+
+    def finished(d):
+        if _count(d, locator) > previous:
+            return True
+        ready_state, pending, quiet_ms = d.execute_script(_NETWORK_QUIET_JS)
+        return ready_state != "loading" and pending == 0 and _quiet_ms(quiet_ms, started) >= quiet * 1000
+
+    _until(driver, finished, timeout)
+    if _count(driver, locator) > previous:
+        # Let the new batch finish rendering
+        _wait_dom_stable(driver, quiet=0.3, timeout=3.0)
+    _record(started, replaces)
+    return _count(driver, locator)
+
+
+def until(driver, condition, timeout: float = 10.0, replaces: float = 0.0) -> bool:
+    """Wait for any ``condition(driver)``; False if it timed out."""
+    started = time.time()
+    result = _until(driver, condition, timeout)
+    _record(started, replaces)
+    return result
+
+
+def new_window(driver, known_handles: Sequence[str], timeout: float = 10.0,
+               replaces: float = 0.0) -> Optional[str]:
+    """Wait for a window that is not in ``known_handles``; return its handle."""
+    started = time.time()
+    known = set(known_handles)
+    _until(driver, lambda d: len(set(d.window_handles) - known) > 0, timeout)
+    _record(started, replaces)
+    new = [handle for handle in driver.window_handles if handle not in known]
+    return new[0] if new else None
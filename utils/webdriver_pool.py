@@ -0,0 +1,605 @@
+"""
+Shared Chrome WebDriver factory and pool for the Selenium scrapers.
+
+Scrapers used to build their own Chrome in ``__init__`` (Options, a
+hard-coded chromedriver path, ``webdriver.Chrome``), so every agency paid a
+full browser cold start. ``get_driver()`` hands out a warmed session from a
+process-wide pool instead and ``release_driver()`` gives it back:
+
+- sessions are keyed by their Chrome options, so scrapers with different
+  flags never share a browser;
+- cookies, storage and extra windows are cleared on release, so one agency
+  never sees another's state;
+- a browser is only recycled (quit and restarted) after ``MAX_USES``
+  scrapers or when it was released after an error.
+
+Reuse happens whenever several scrapers run in the same process
+(``master.py --in-process`` or the non-isolated ``--workers`` pool). In a
+one-shot child the pool simply acts as the driver factory.
+
+Paths come from the environment when set (CHROMEDRIVER_PATH, CHROME_BINARY),
+otherwise the usual Linux locations, otherwise Selenium Manager.
+
+Images, fonts, media and tracking/chat widgets are blocked at the network
+level (CDP ``Network.setBlockedURLs``) since scrapers only read the DOM.
+``WEBDRIVER_BLOCK`` overrides the blocked categories ("none" to disable);
+a scraper that needs some of them passes ``allow=`` to ``get_driver()``.
+With ``WEBDRIVER_RESOURCE_REPORT=1`` nothing is blocked; instead every
+request is logged and ``take_resource_report()`` tells how many bytes the
+blocklist would have saved.
+
+New browsers are only started once there is memory for them (see
+utils/browser_memory.py), and sessions that grew too big are quit instead
+of pooled. Scrapers that load hundreds of pages on one session ask for
+``get_driver(recycle=True)``, which restarts it transparently.
+"""
+import atexit
+import json
+import os
+import re
+import shutil
+import threading
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from utils import browser_memory
+
+DEFAULT_ARGS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--window-size=1920,1080",
+)
+
+# Recycle a browser after this many scrapers have used it
+MAX_USES = int(os.environ.get("WEBDRIVER_MAX_USES", "20"))
+
+# Keep at most this many idle browsers per option set
+MAX_IDLE = 2
+
+# get_driver(recycle=True): restart the session after this many page loads,
+# checking its memory every MEMORY_CHECK_EVERY loads
+RECYCLE_PAGES = int(os.environ.get("WEBDRIVER_RECYCLE_PAGES", "200"))
+MEMORY_CHECK_EVERY = 10
+
+# Blocked URL patterns per category (CDP wildcards)
+_IMAGE_EXT = ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp")
+_FONT_EXT = ("woff", "woff2", "ttf", "otf", "eot")
+_MEDIA_EXT = ("mp4", "webm", "ogg", "mp3", "m4a", "mov")
+
+BLOCKLIST: Dict[str, Tuple[str, ...]] = {
+    "image": tuple(p for ext in _IMAGE_EXT for p in (f"*.{ext}", f"*.{ext}?*")),
+    "font": tuple(p for ext in _FONT_EXT for p in (f"*.{ext}", f"*.{ext}?*")),
+    "media": tuple(p for ext in _MEDIA_EXT for p in (f"*.{ext}", f"*.{ext}?*")),
+    "tracking": (
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*connect.facebook.net*",
+        "*hotjar.com*",
+        "*clarity.ms*",
+        "*snap.licdn.com*",
+        "*hs-analytics.net*",
+        "*hs-banner.com*",
+        "*intercom.io*",
+        "*intercomcdn.com*",
+        "*tawk.to*",
+        "*zopim.com*",
+        "*zdassets.com*",
+        "*livechatinc.com*",
+        "*crisp.chat*",
+        "*youtube.com/embed*",
+        "*player.vimeo.com*",
+    ),
+}
+
+# Categories blocked unless WEBDRIVER_BLOCK says otherwise
+DEFAULT_BLOCK = ("image", "font", "media", "tracking")
+
+RESOURCE_REPORT = os.environ.get("WEBDRIVER_RESOURCE_REPORT", "") not in ("", "0")
+
+CHROMEDRIVER_CANDIDATES = ("/usr/bin/chromedriver", "/usr/lib/chromium-browser/chromedriver")
+CHROME_BINARY_CANDIDATES = ("/usr/bin/chromium-browser", "/usr/bin/chromium")
+
+
+# ===================== PATHS / OPTIONS ===================== #
+
+def chromedriver_path() -> Optional[str]:
+    """chromedriver to use, or None to let Selenium Manager resolve it."""
+    path = os.environ.get("CHROMEDRIVER_PATH")
+    if path:
+        return path
+    for candidate in CHROMEDRIVER_CANDIDATES:
+        if os.path.exists(candidate):
+            return candidate
+    return shutil.which("chromedriver")
+
+
+def chrome_binary() -> Optional[str]:
+    path = os.environ.get("CHROME_BINARY")
+    if path:
+        return path
+    for candidate in CHROME_BINARY_CANDIDATES:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def build_options(extra_args: Sequence[str] = (), prefs: Optional[Dict] = None,
+                  experimental: Optional[Dict] = None, headless: bool = True,
+                  page_load_strategy: Optional[str] = None, performance_log: bool = False) -> Options:
+    """Chrome options shared by all scrapers, plus per-scraper additions."""
+    options = Options()
+    binary = chrome_binary()
+    if binary:
+        options.binary_location = binary
+
+    for arg in DEFAULT_ARGS:
+        if arg == "--headless=new" and not headless:
+            continue
+        options.add_argument(arg)
+    for arg in extra_args:
+        options.add_argument(arg)
+
+    if prefs:
+        options.add_experimental_option("prefs", prefs)
+    for name, value in (experimental or {}).items():
+        options.add_experimental_option(name, value)
+    if page_load_strategy:
+        options.page_load_strategy = page_load_strategy
+    if RESOURCE_REPORT or performance_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def create_driver(extra_args: Sequence[str] = (), prefs: Optional[Dict] = None,
+                  experimental: Optional[Dict] = None, headless: bool = True,
+                  page_load_strategy: Optional[str] = None, performance_log: bool = False):
+    """Start a new, unpooled Chrome session."""
+    options = build_options(extra_args, prefs, experimental, headless, page_load_strategy,
+                            performance_log)
+    path = chromedriver_path()
+    service = Service(path) if path else Service()
+    return webdriver.Chrome(service=service, options=options)
+
+
+# ===================== RESOURCE BLOCKING ===================== #
+
+def blocked_categories() -> Tuple[str, ...]:
+    value = os.environ.get("WEBDRIVER_BLOCK")
+    if value is None:
+        return DEFAULT_BLOCK
+    if value.strip().lower() in ("", "0", "none"):
+        return ()
+    return tuple(part.strip() for part in value.split(",") if part.strip() in BLOCKLIST)
+
+
+def blocked_url_patterns(allow: Sequence[str] = ()) -> List[str]:
+    """
+    URL patterns to block for a scraper.
+
+    Args:
+        allow: Categories (e.g. "image") or URL fragments (e.g.
+            "googletagmanager.com") the scraper needs loaded
+    """
+    patterns = []
+    for category in blocked_categories():
+        if category in allow:
+            continue
+        for pattern in BLOCKLIST[category]:
+            if not any(fragment in pattern for fragment in allow):
+                patterns.append(pattern)
+    return patterns
+
+
+def apply_blocking(driver, patterns: Sequence[str]) -> None:
+    """
+    Block ``patterns`` in the driver's current tab.
+
+    The block list is per tab: call again after switching to a new window.
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+def _pattern_regex(patterns: Sequence[str]):
+    if not patterns:
+        return None
+    return re.compile("|".join(
+        "^" + re.escape(pattern).replace(r"\*", ".*") + "$" for pattern in patterns
+    ))
+
+
+def _empty_report() -> Dict[str, int]:
+    return {"requests": 0, "bytes": 0, "blockable_requests": 0, "blockable_bytes": 0}
+
+
+def _read_log(driver) -> List[Dict]:
+    try:
+        return driver.get_log("performance")
+    except Exception:
+        return []
+
+
+def _collect_resource_stats(driver, patterns: Sequence[str], report: Dict[str, int],
+                            earlier: Sequence[Dict] = ()) -> None:
+    """Add the session's logged network traffic to ``report``."""
+    entries = list(earlier) + _read_log(driver)
+
+    urls = {}
+    sizes = {}
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        params = message.get("params", {})
+        if message.get("method") == "Network.requestWillBeSent":
+            urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+        elif message.get("method") == "Network.loadingFinished":
+            sizes[params.get("requestId")] = params.get("encodedDataLength", 0)
+
+    blockable = _pattern_regex(patterns)
+    for request_id, size in sizes.items():
+        url = urls.get(request_id, "")
+        report["requests"] += 1
+        report["bytes"] += int(size)
+        if blockable is not None and blockable.match(url):
+            report["blockable_requests"] += 1
+            report["blockable_bytes"] += int(size)
+
+
+# ===================== POOL ===================== #
+
+class _Entry:
+    def __init__(self, driver, key):
+        self.driver = driver
+        self.key = key
+        self.uses = 0
+        self.blocked: List[str] = []
+        # Performance log entries already read by the scraper
+        self.logged: List[Dict] = []
+        self.performance_log = False
+
+
+class DriverPool:
+    """Thread-safe pool of Chrome sessions keyed by their options."""
+
+    def __init__(self, max_uses: int = MAX_USES, max_idle: int = MAX_IDLE):
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle: Dict[str, List[_Entry]] = {}
+        self._leased: Dict[int, _Entry] = {}
+        self.started = 0
+        self.reused = 0
+        self.recycled = 0
+        self.resource_report = _empty_report()
+
+    @staticmethod
+    def _key(extra_args, prefs, experimental, headless, page_load_strategy, performance_log) -> str:
+        return json.dumps(
+            [sorted(extra_args), prefs or {}, experimental or {}, headless, page_load_strategy,
+             performance_log],
+            sort_keys=True,
+            default=str,
+        )
+
+    def acquire(self, extra_args: Sequence[str] = (), prefs: Optional[Dict] = None,
+                experimental: Optional[Dict] = None, headless: bool = True,
+                page_load_strategy: Optional[str] = None, allow: Sequence[str] = (),
+                performance_log: bool = False):
+        """Return a clean browser session with these options."""
+        blocked = blocked_url_patterns(allow)
+        if "image" in blocked_categories() and "image" not in allow and not RESOURCE_REPORT:
+            # Also catches images served without a file extension
+            prefs = {"profile.managed_default_content_settings.images": 2, **(prefs or {})}
+        key = self._key(extra_args, prefs, experimental, headless, page_load_strategy, performance_log)
+
+        with self._lock:
+            idle = self._idle.get(key) or []
+            entry = idle.pop() if idle else None
+
+        if entry is not None and not _is_alive(entry.driver):
+            _quit(entry.driver)
+            entry = None
+
+        if entry is None:
+            browser_memory.admit_browser()
+            driver = create_driver(extra_args, prefs, experimental, headless, page_load_strategy,
+                                   performance_log)
+            entry = _Entry(driver, key)
+            entry.performance_log = performance_log or RESOURCE_REPORT
+            self.started += 1
+        else:
+            self.reused += 1
+
+        entry.uses += 1
+        entry.blocked = blocked
+        if not RESOURCE_REPORT:
+            try:
+                apply_blocking(entry.driver, blocked)
+            except Exception:
+                pass
+        with self._lock:
+            self._leased[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver, error: bool = False) -> None:
+        """
+        Give a session back. It is reset for the next scraper, or quit if
+        it errored, has been used ``max_uses`` times or the pool is full.
+        """
+        with self._lock:
+            entry = self._leased.pop(id(driver), None)
+
+        if entry is None:
+            # Not from the pool (or released twice)
+            _quit(driver)
+            return
+
+        if RESOURCE_REPORT:
+            _collect_resource_stats(driver, entry.blocked, self.resource_report, entry.logged)
+        entry.logged = []
+
+        if error or entry.uses >= self.max_uses or _too_big(driver) or not _reset(driver):
+            _quit(driver)
+            return
+        if entry.performance_log:
+            # Don't hand this session's traffic to the next scraper
+            _read_log(driver)
+
+        with self._lock:
+            idle = self._idle.setdefault(entry.key, [])
+            if len(idle) < self.max_idle:
+                idle.append(entry)
+                return
+        _quit(driver)
+
+    def read_performance_log(self, driver) -> List[Dict]:
+        """
+        Read (and consume) the session's DevTools performance log. With
+        WEBDRIVER_RESOURCE_REPORT the entries are kept for the report.
+        """
+        entries = _read_log(driver)
+        if RESOURCE_REPORT:
+            with self._lock:
+                entry = self._leased.get(id(driver))
+            if entry is not None:
+                entry.logged.extend(entries)
+        return entries
+
+    def take_resource_report(self) -> Dict[str, int]:
+        """Traffic logged since the last call (WEBDRIVER_RESOURCE_REPORT)."""
+        with self._lock:
+            report, self.resource_report = self.resource_report, _empty_report()
+        return report
+
+    def release_all(self, error: bool = False) -> int:
+        """Release every session still leased (e.g. a scraper forgot or crashed)."""
+        with self._lock:
+            drivers = [entry.driver for entry in self._leased.values()]
+        for driver in drivers:
+            self.release(driver, error=error)
+        return len(drivers)
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._leased.values())
+            for idle in self._idle.values():
+                entries.extend(idle)
+            self._leased.clear()
+            self._idle.clear()
+        for entry in entries:
+            _quit(entry.driver)
+
+
+def _is_alive(driver) -> bool:
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def _too_big(driver) -> bool:
+    rss = browser_memory.session_rss(driver)
+    return rss is not None and rss > browser_memory.MAX_SESSION_RSS_MB * browser_memory.MB
+
+
+def _origin(url: str) -> Optional[str]:
+    parts = urlparse(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _visited_origins(driver) -> Set[str]:
+    """
+    Origins the session has stored data for: every page in the navigation
+    history of the current tab, plus the domains that set cookies.
+    """
+    origins = set()
+    history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+    for item in history.get("entries", []):
+        origin = _origin(item.get("url", ""))
+        if origin:
+            origins.add(origin)
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})
+    for cookie in cookies.get("cookies", []):
+        domain = cookie.get("domain", "").lstrip(".")
+        if domain:
+            origins.update((f"https://{domain}", f"http://{domain}"))
+    return origins
+
+
+def _reset(driver) -> bool:
+    """Clear cookies, storage, extra windows and timeouts. False if it failed."""
+    try:
+        handles = driver.window_handles
+        origins = set()
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            origins |= _visited_origins(driver)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        origins |= _visited_origins(driver)
+
+        driver.get("about:blank")
+        # Storage (localStorage, IndexedDB, service workers, ...) can only be
+        # cleared per origin
+        for origin in sorted(origins):
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                   {"origin": origin, "storageTypes": "all"})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+
+        driver.implicitly_wait(0)
+        driver.set_page_load_timeout(300)
+        driver.set_script_timeout(30)
+        return True
+    except Exception as e:
+        print(f"Could not reset browser for reuse, quitting it: {e}")
+        return False
+
+
+def _quit(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+# ===================== RECYCLING ===================== #
+
+class RecyclingDriver:
+    """
+    Chrome session that restarts itself between page loads once it has
+    loaded RECYCLE_PAGES pages or grown past WEBDRIVER_MAX_RSS_MB.
+
+    Everything is delegated to the current session, so WebDriverWaits and
+    other references held by the scraper keep working across restarts.
+    Timeouts and CDP setup commands are replayed on the new session;
+    cookies and open windows are not carried over.
+    """
+
+    _REPLAYED_CDP = (
+        "Page.addScriptToEvaluateOnNewDocument",
+        "Network.setUserAgentOverride",
+        "Network.setExtraHTTPHeaders",
+    )
+
+    def __init__(self, pool: "DriverPool", options: Dict):
+        self._pool = pool
+        self._options = options
+        self._setup: List[Tuple[str, tuple]] = []
+        self._driver = pool.acquire(**options)
+        self.pages = 0
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def _record(self, method: str, *args):
+        self._setup.append((method, args))
+        return getattr(self._driver, method)(*args)
+
+    def set_page_load_timeout(self, seconds):
+        return self._record("set_page_load_timeout", seconds)
+
+    def set_script_timeout(self, seconds):
+        return self._record("set_script_timeout", seconds)
+
+    def implicitly_wait(self, seconds):
+        return self._record("implicitly_wait", seconds)
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict):
+        if cmd in self._REPLAYED_CDP:
+            return self._record("execute_cdp_cmd", cmd, cmd_args)
+        return self._driver.execute_cdp_cmd(cmd, cmd_args)
+
+    def get(self, url: str):
+        self.pages += 1
+        if self.pages % MEMORY_CHECK_EVERY == 0 or self.pages >= RECYCLE_PAGES:
+            self._recycle_if_needed()
+        return self._driver.get(url)
+
+    def _recycle_if_needed(self) -> None:
+        if self.pages < RECYCLE_PAGES and not _too_big(self._driver):
+            return
+        rss = browser_memory.session_rss(self._driver)
+        size = f", {rss / browser_memory.MB:.0f} MB" if rss else ""
+        print(f"Restarting browser after {self.pages} pages{size}")
+
+        self._pool.release(self._driver, error=True)
+        self._driver = self._pool.acquire(**self._options)
+        self._pool.recycled += 1
+        self.pages = 0
+        for method, args in self._setup:
+            try:
+                getattr(self._driver, method)(*args)
+            except Exception:
+                pass
+
+
+def _unwrap(driver):
+    return driver._driver if isinstance(driver, RecyclingDriver) else driver
+
+
+# ===================== MODULE-LEVEL POOL ===================== #
+
+_POOL = DriverPool()
+atexit.register(_POOL.close_all)
+
+
+def get_pool() -> DriverPool:
+    return _POOL
+
+
+def get_driver(extra_args: Sequence[str] = (), prefs: Optional[Dict] = None,
+               experimental: Optional[Dict] = None, headless: bool = True,
+               page_load_strategy: Optional[str] = None, allow: Sequence[str] = (),
+               performance_log: bool = False, recycle: bool = False):
+    """
+    Get a Chrome session from the shared pool.
+
+    Args:
+        extra_args: Chrome arguments on top of DEFAULT_ARGS
+        prefs: Chrome ``prefs`` experimental option
+        experimental: Other experimental options, e.g. ``excludeSwitches``
+        headless: Set False to drop ``--headless=new``
+        page_load_strategy: "normal" (default), "eager" or "none"
+        allow: Blocked categories or URL fragments this scraper needs
+        performance_log: Record DevTools network events, read with
+            performance_log() (see utils/network_capture.py)
+        recycle: Return a RecyclingDriver, for long-lived sessions that
+            load hundreds of pages
+    """
+    if recycle:
+        return RecyclingDriver(_POOL, {
+            "extra_args": extra_args,
+            "prefs": prefs,
+            "experimental": experimental,
+            "headless": headless,
+            "page_load_strategy": page_load_strategy,
+            "allow": allow,
+            "performance_log": performance_log,
+        })
+    return _POOL.acquire(extra_args, prefs, experimental, headless, page_load_strategy, allow,
+                         performance_log)
+
+
+def release_driver(driver, error: bool = False) -> None:
+    """Return a session from get_driver() to the shared pool."""
+    if driver is not None:
+        _POOL.release(_unwrap(driver), error=error)
+
+
+def performance_log(driver) -> List[Dict]:
+    """Consume the performance log of a get_driver(performance_log=True) session."""
+    return _POOL.read_performance_log(_unwrap(driver))
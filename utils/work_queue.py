@@ -0,0 +1,271 @@
+"""
+SQLite-backed work queue for pull-based scraper workers.
+
+One job per scraper per run. Any number of worker processes claim jobs
+with a time-limited lease, renew the lease while the scraper runs, and
+push the scraped properties back. Failed jobs and jobs
+whose lease expired (worker died) go back to pending until they run out of
+attempts. The master collects finished results and merges them into the
+listing store; no external broker is needed.
+
+By default the database uses WAL, which needs shared memory and so only
+works for processes on one host. Set WORK_QUEUE_SHARED=1 on every host
+when workers on other hosts open the file over a network filesystem (with
+working locks); the queue then uses the rollback journal instead.
+"""
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from typing import List, Dict, Any, Optional
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+# Workers on several hosts share the database file
+SHARED = os.environ.get("WORK_QUEUE_SHARED", "") not in ("", "0")
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class WorkQueue:
+    """Jobs and results of queued master runs in one SQLite file."""
+
+    def __init__(self, db_path: str, timeout: float = 30.0, shared: bool = SHARED):
+        self.db_path = db_path
+
+        dir_path = os.path.dirname(db_path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        # Autocommit mode; transactions are opened explicitly with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None)
+        # WAL's shared-memory index is unsafe on network filesystems
+        self.conn.execute("PRAGMA journal_mode=DELETE" if shared else "PRAGMA journal_mode=WAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY,
+                run_id TEXT NOT NULL,
+                scraper TEXT NOT NULL,
+                priority REAL NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                lease_owner TEXT,
+                lease_expires REAL,
+                error TEXT,
+                seconds REAL,
+                updated_at REAL,
+                UNIQUE (run_id, scraper)
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (run_id, status, priority);
+            CREATE TABLE IF NOT EXISTS results (
+                job_id INTEGER PRIMARY KEY REFERENCES jobs (id),
+                run_id TEXT NOT NULL,
+                scraper TEXT NOT NULL,
+                properties TEXT NOT NULL,
+                merged INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_results_merge ON results (run_id, merged);
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                run_date TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                closed INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+
+    def _transaction(self):
+        """BEGIN IMMEDIATE so two claimers can never lease the same job."""
+        return _Immediate(self.conn)
+
+    # ===================== RUNS ===================== #
+
+    def enqueue_run(self, run_id: str, run_date: str, priorities: Dict[str, float],
+                    max_attempts: int = 3) -> int:
+        """Create one pending job per scraper. Returns the number of jobs added."""
+        now = time.time()
+        with self._transaction():
+            self.conn.execute(
+                "INSERT OR IGNORE INTO runs (run_id, run_date, created_at) VALUES (?, ?, ?)",
+                (run_id, run_date, now),
+            )
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (run_id, scraper, priority, max_attempts, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(run_id, name, priority, max_attempts, now) for name, priority in priorities.items()],
+            )
+            return self.conn.total_changes - before
+
+    def open_run(self) -> Optional[Dict[str, Any]]:
+        """The oldest run that has not been closed by the master, if any."""
+        row = self.conn.execute(
+            "SELECT run_id, run_date FROM runs WHERE closed = 0 ORDER BY created_at LIMIT 1"
+        ).fetchone()
+        return {"run_id": row[0], "run_date": row[1]} if row else None
+
+    def close_run(self, run_id: str) -> None:
+        with self._transaction():
+            self.conn.execute("UPDATE runs SET closed = 1 WHERE run_id = ?", (run_id,))
+
+    def counts(self, run_id: str) -> Dict[str, int]:
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for status, count in self.conn.execute(
+            "SELECT status, COUNT(*) FROM jobs WHERE run_id = ? GROUP BY status", (run_id,)
+        ):
+            counts[status] = count
+        return counts
+
+    def is_drained(self, run_id: str) -> bool:
+        counts = self.counts(run_id)
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    # ===================== WORKERS ===================== #
+
+    def claim(self, worker_id: str, lease_seconds: float,
+              scrapers: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Lease the highest-priority runnable job of any open run.
+
+        Runnable means pending, or leased with an expired lease (its worker
+        died). ``scrapers`` restricts the claim, e.g. to HTTP-only scrapers.
+        """
+        now = time.time()
+        with self._transaction():
+            # Jobs whose worker keeps dying give up like any other failure
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, error = 'Lease expired (worker lost)', updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (FAILED, now, LEASED, now),
+            )
+            rows = self.conn.execute(
+                "SELECT jobs.id, jobs.run_id, jobs.scraper, jobs.attempts, runs.run_date "
+                "FROM jobs JOIN runs ON runs.run_id = jobs.run_id "
+                "WHERE runs.closed = 0 AND (jobs.status = ? OR (jobs.status = ? AND jobs.lease_expires < ?)) "
+                "ORDER BY runs.created_at, jobs.priority DESC, jobs.id",
+                (PENDING, LEASED, now),
+            ).fetchall()
+            for job_id, run_id, scraper, attempts, run_date in rows:
+                if scrapers is not None and scraper not in scrapers:
+                    continue
+                self.conn.execute(
+                    "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    (LEASED, worker_id, now + lease_seconds, now, job_id),
+                )
+                return {
+                    "id": job_id,
+                    "run_id": run_id,
+                    "run_date": run_date,
+                    "scraper": scraper,
+                    "attempt": attempts + 1,
+                }
+        return None
+
+    def renew(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a lease. False if the job was taken over by someone else."""
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (time.time() + lease_seconds, job_id, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, properties: List[Dict[str, Any]],
+                 seconds: float) -> bool:
+        """Store a job's result. Ignored if the lease was lost meanwhile."""
+        payload = json.dumps(properties, ensure_ascii=False, default=str)
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = ?, seconds = ?, error = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (DONE, seconds, time.time(), job_id, LEASED, worker_id),
+            )
+            if cursor.rowcount != 1:
+                return False
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results (job_id, run_id, scraper, properties) "
+                "SELECT id, run_id, scraper, ? FROM jobs WHERE id = ?",
+                (payload, job_id),
+            )
+            return True
+
+    def fail(self, job_id: int, worker_id: str, error: str, seconds: float) -> str:
+        """
+        Record a failed attempt. The job goes back to pending until it runs
+        out of attempts. Returns the job's new status.
+        """
+        with self._transaction():
+            row = self.conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND lease_owner = ?",
+                (job_id, worker_id),
+            ).fetchone()
+            if row is None:
+                return ""
+            status = FAILED if row[0] >= row[1] else PENDING
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, seconds = ?, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ?",
+                (status, error, seconds, time.time(), job_id),
+            )
+            return status
+
+    # ===================== MASTER ===================== #
+
+    def unmerged_results(self, run_id: str) -> List[Dict[str, Any]]:
+        results = []
+        for job_id, scraper, properties, seconds in self.conn.execute(
+            "SELECT results.job_id, results.scraper, results.properties, jobs.seconds "
+            "FROM results JOIN jobs ON jobs.id = results.job_id "
+            "WHERE results.run_id = ? AND results.merged = 0 ORDER BY results.rowid",
+            (run_id,),
+        ):
+            results.append({
+                "job_id": job_id,
+                "scraper": scraper,
+                "properties": json.loads(properties),
+                "seconds": seconds or 0.0,
+            })
+        return results
+
+    def mark_merged(self, job_id: int) -> None:
+        with self._transaction():
+            # The payload is no longer needed once it is in the listing store
+            self.conn.execute(
+                "UPDATE results SET merged = 1, properties = '[]' WHERE job_id = ?", (job_id,)
+            )
+
+    def failed_jobs(self, run_id: str) -> List[Dict[str, Any]]:
+        return [
+            {"scraper": scraper, "attempts": attempts, "error": error}
+            for scraper, attempts, error in self.conn.execute(
+                "SELECT scraper, attempts, error FROM jobs WHERE run_id = ? AND status = ?",
+                (run_id, FAILED),
+            )
+        ]
+
+    def close(self):
+        self.conn.close()
+
+
+class _Immediate:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False